@@ -0,0 +1,101 @@
+"""Benchmark JSON extraction from Claude output: greedy regex vs extractor.
+
+Usage:
+    python benchmarks/bench_json_extract.py [--slides N ...] [--repeat N]
+
+Builds synthetic deck responses of growing size, wrapped in a preamble,
+a Markdown fence and trailing prose, and times the old
+``re.search(r"\\{[\\s\\S]*\\}")`` + json.loads against
+jsonstream.extract_json_object. Three shapes are measured: a clean
+response, one whose trailing prose contains braces (the regex grabs the
+prose and fails), and an unbalanced one with many "{" and no "}" (the
+regex backtracks quadratically).
+"""
+
+import argparse
+import json
+import re
+import statistics
+import time
+
+from pitchdeck.engine.jsonstream import JSONExtractError, extract_json_object
+
+_GREEDY = re.compile(r"\{[\s\S]*\}")
+
+
+def _deck(n_slides: int) -> str:
+    return json.dumps({
+        "narrative_arc": "Hook {problem} -> proof -> ask",
+        "gaps_identified": ["NDR", 'Churn "cohorts" {by quarter}'],
+        "slides": [
+            {
+                "slide_number": i,
+                "slide_type": "traction",
+                "title": f"Slide {i}: growth {{YoY}}",
+                "headline": 'Revenue grew 3x, "net" of churn \\ refunds',
+                "bullets": [f"Point {j} with {{braces}} and [brackets]" for j in range(5)],
+                "metrics": ["EUR 1.2M ARR", "140% NDR"],
+                "speaker_notes": "Say it plainly. " * 20,
+                "transition_to_next": "Which brings us to the next slide.",
+                "vc_alignment_notes": ["Fits the thesis"],
+            }
+            for i in range(1, n_slides + 1)
+        ],
+    }, indent=2)
+
+
+def _shapes(n_slides: int) -> dict[str, str]:
+    body = _deck(n_slides)
+    return {
+        "clean": f"Here is the deck:\n```json\n{body}\n```\n",
+        "trailing braces": (
+            f"Here is the deck:\n```json\n{body}\n```\n"
+            "Swap {ARR} and {NDR} for audited figures before sending."
+        ),
+        "unbalanced": "{ " * (len(body) // 40),
+    }
+
+
+def _greedy(text: str):
+    match = _GREEDY.search(text)
+    if match is None:
+        raise ValueError("no JSON found")
+    return json.loads(match.group())
+
+
+def _time(fn, text: str, repeat: int) -> tuple[float, bool]:
+    timings = []
+    ok = True
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            fn(text)
+        except (ValueError, JSONExtractError):
+            ok = False
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, nargs="*", default=[15, 150, 1500])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'shape':<16} {'slides':>6} {'chars':>10} "
+          f"{'regex (ms)':>11} {'extractor (ms)':>15}")
+    for n_slides in args.slides:
+        for shape, text in _shapes(n_slides).items():
+            regex, regex_ok = _time(_greedy, text, args.repeat)
+            matcher, matcher_ok = _time(extract_json_object, text, args.repeat)
+            print(
+                f"{shape:<16} {n_slides:>6} {len(text):>10,} "
+                f"{regex * 1e3:>9.2f}{'' if regex_ok else ' ✗':<2} "
+                f"{matcher * 1e3:>13.2f}{'' if matcher_ok else ' ✗':<2}"
+            )
+    print("✗ = raised (expected for 'unbalanced'; a regex failure on "
+          "'trailing braces' is the bug this replaces)")
+
+
+if __name__ == "__main__":
+    main()
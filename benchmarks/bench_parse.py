@@ -0,0 +1,114 @@
+"""Benchmark PDF extraction: --parse-mode layout vs fast.
+
+Usage:
+    python benchmarks/bench_parse.py [PDF ...] [--repeat N]
+
+Defaults to the PDFs in INPUT/. When INPUT/ holds no PDFs, the Markdown
+and DOCX briefs there are rendered into a temporary PDF first so both
+modes are measured on the same sample content. The parse cache is
+bypassed so every run does real work.
+"""
+
+import argparse
+import html
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pymupdf
+
+from pitchdeck.parsers import PARSE_MODES, extract_document
+
+ROOT = Path(__file__).resolve().parent.parent
+INPUT_DIR = ROOT / "INPUT"
+
+
+def _markdown_to_html(text: str) -> str:
+    """Just enough Markdown -> HTML for headings and paragraphs."""
+    parts = []
+    for block in text.split("\n\n"):
+        block = block.strip()
+        if not block:
+            continue
+        hashes = len(block) - len(block.lstrip("#"))
+        if 0 < hashes <= 6 and "\n" not in block:
+            parts.append(f"<h{hashes}>{html.escape(block[hashes:].strip())}</h{hashes}>")
+        else:
+            parts.append(f"<p>{html.escape(block)}</p>")
+    return "\n".join(parts)
+
+
+def _render_sample_pdf(sources: list[Path], out_path: Path) -> Path:
+    """Render Markdown/DOCX briefs into a multi-page PDF."""
+    texts = []
+    for source in sources:
+        texts.append(extract_document(str(source), use_cache=False))
+    story = pymupdf.Story(html=_markdown_to_html("\n\n".join(texts)))
+    writer = pymupdf.DocumentWriter(str(out_path))
+    mediabox = pymupdf.paper_rect("a4")
+    where = mediabox + (50, 50, -50, -50)
+    more = True
+    while more:
+        device = writer.begin_page(mediabox)
+        more, _ = story.place(where)
+        story.draw(device)
+        writer.end_page()
+    writer.close()
+    return out_path
+
+
+def _default_inputs(tmp_dir: Path) -> list[Path]:
+    pdfs = sorted(INPUT_DIR.glob("*.pdf"))
+    if pdfs:
+        return pdfs
+    sources = sorted(INPUT_DIR.glob("*.md")) + sorted(INPUT_DIR.glob("*.docx"))
+    if not sources:
+        sys.exit(f"No sample inputs found in {INPUT_DIR}")
+    print(f"No PDFs in {INPUT_DIR}; rendering {len(sources)} brief(s) to PDF")
+    return [_render_sample_pdf(sources, tmp_dir / "input_sample.pdf")]
+
+
+def _time_mode(path: Path, mode: str, repeat: int) -> tuple[float, int]:
+    timings = []
+    chars = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = extract_document(str(path), use_cache=False, mode=mode)
+        timings.append(time.perf_counter() - start)
+        chars = len(text)
+    return statistics.median(timings), chars
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdfs", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = args.pdfs or _default_inputs(Path(tmp))
+        # Warm-up: import both backends so import time isn't billed to a mode
+        for mode in PARSE_MODES:
+            extract_document(str(inputs[0]), use_cache=False, mode=mode)
+
+        print(f"{'file':<32} {'mode':<7} {'pages':>5} {'wall (s)':>9} {'chars':>8} {'chars/s':>11}")
+        for path in inputs:
+            with pymupdf.open(path) as doc:
+                pages = doc.page_count
+            results = {}
+            for mode in PARSE_MODES:
+                wall, chars = _time_mode(path, mode, args.repeat)
+                results[mode] = wall
+                print(
+                    f"{path.name[:32]:<32} {mode:<7} {pages:>5} {wall:>9.3f} "
+                    f"{chars:>8} {chars / max(wall, 1e-9):>11,.0f}"
+                )
+            speedup = results["layout"] / max(results["fast"], 1e-9)
+            saved = results["layout"] - results["fast"]
+            print(f"{'':<32} fast is {speedup:.1f}x faster ({saved:.3f}s saved)\n")
+
+
+if __name__ == "__main__":
+    main()
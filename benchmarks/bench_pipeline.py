@@ -0,0 +1,126 @@
+"""Benchmark the generate -> validate pipeline offline on the mock backend.
+
+Usage:
+    python benchmarks/bench_pipeline.py [FILE ...] [--repeat N]
+        [--latency S] [--tokens-per-second N] [--parallel-groups N]
+
+Runs every local stage (parsing, compaction, extraction, prompt
+building, streamed-response parsing, rule-based and LLM validation,
+Markdown rendering) with the Claude calls answered by MockBackend, so
+timings are free of network noise. Use --latency and
+--tokens-per-second to model the API, e.g. to see how much of the
+wall-clock time --parallel-groups saves. Defaults to the documents in
+INPUT/. Parse and LLM caches live in a temporary PITCHDECK_CACHE_DIR
+and are bypassed.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pitchdeck.engine.backends import MockBackend
+from pitchdeck.engine.compaction import combine_documents, compact_documents
+from pitchdeck.engine.extraction import apply_extracted_metrics, extract_metrics
+from pitchdeck.engine.narrative import generate_deck
+from pitchdeck.engine.slides import get_slide_templates
+from pitchdeck.engine.validator import validate_deck
+from pitchdeck.models import CompanyProfile
+from pitchdeck.output import save_markdown
+from pitchdeck.parsers import extract_documents_sections
+from pitchdeck.profiles import load_vc_profile
+
+ROOT = Path(__file__).resolve().parent.parent
+INPUT_DIR = ROOT / "INPUT"
+STAGES = ("parse", "prepare", "generate", "validate", "render")
+
+
+def _run_once(paths: list[str], backend: MockBackend, parallel_groups: int,
+              out_dir: Path) -> dict[str, float]:
+    timings = {}
+    start = time.perf_counter()
+    documents = [
+        sections for _, sections in extract_documents_sections(paths, use_cache=False)
+    ]
+    timings["parse"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vc_profile = load_vc_profile("earlybird")
+    templates = get_slide_templates(vc_profile)
+    documents, _ = compact_documents(documents, templates, vc_profile, 120_000)
+    company = CompanyProfile(
+        name="Benchmark Co", product_name="Benchmark", one_liner="",
+        founded_year=0, employee_count=0, revenue_eur=0,
+        revenue_type="revenue", funding_stage="bootstrapped",
+        raw_document_text=combine_documents(documents),
+    )
+    company, _ = apply_extracted_metrics(
+        company, extract_metrics(company.raw_document_text)
+    )
+    timings["prepare"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    deck = generate_deck(
+        company, vc_profile, templates,
+        parallel_groups=parallel_groups, use_llm_cache=False, backend=backend,
+    )
+    timings["generate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    validate_deck(deck, vc_profile, use_llm_cache=False, backend=backend)
+    timings["validate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    save_markdown(deck, str(out_dir / "deck.md"))
+    timings["render"] = time.perf_counter() - start
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Mock seconds before the first token")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0,
+                        help="Mock streaming rate (0 = instant)")
+    parser.add_argument("--parallel-groups", type=int, default=0)
+    args = parser.parse_args()
+
+    paths = args.files or sorted(
+        str(p) for p in INPUT_DIR.iterdir()
+        if p.suffix.lower() in (".md", ".txt", ".pdf", ".docx")
+    )
+    if not paths:
+        sys.exit(f"No input documents found in {INPUT_DIR}")
+
+    backend = MockBackend(
+        latency_s=args.latency, tokens_per_second=args.tokens_per_second
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["PITCHDECK_CACHE_DIR"] = str(Path(tmp) / "cache")
+        runs = [
+            _run_once(paths, backend, args.parallel_groups, Path(tmp))
+            for _ in range(args.repeat)
+        ]
+
+    print(f"{len(paths)} document(s), median of {args.repeat} runs, "
+          f"mock latency {args.latency}s, "
+          f"{args.tokens_per_second or 'instant'} tokens/s, "
+          f"parallel groups {args.parallel_groups}")
+    print(f"{'stage':<10} {'median (ms)':>12} {'min (ms)':>10}")
+    total = 0.0
+    for stage in STAGES:
+        values = [run[stage] for run in runs]
+        total += statistics.median(values)
+        print(f"{stage:<10} {statistics.median(values) * 1e3:>12.1f} "
+              f"{min(values) * 1e3:>10.1f}")
+    print(f"{'total':<10} {total * 1e3:>12.1f}")
+    print(f"{backend.calls} mock calls")
+
+
+if __name__ == "__main__":
+    main()
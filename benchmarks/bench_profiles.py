@@ -0,0 +1,109 @@
+"""Benchmark VC profile loading: cold YAML parse vs compiled cache.
+
+Usage:
+    python benchmarks/bench_profiles.py [--copies N] [--repeat N]
+
+Copies every profile in profiles/ N times into a scratch directory and
+loads them all, first straight from YAML (ruamel + Pydantic validation)
+and then from the compiled JSON cache, then times a faceted search
+through the profile index. The cache lives in a temporary
+PITCHDECK_CACHE_DIR so your real cache is untouched.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pitchdeck.profiles.index import load_profile_index
+from pitchdeck.profiles.loader import PROFILES_DIR, list_profiles, load_vc_profile
+
+FRESH_PROCESS_SNIPPET = """
+import sys, time
+from pathlib import Path
+start = time.perf_counter()
+from pitchdeck.profiles.loader import load_vc_profile
+load_vc_profile(sys.argv[1], Path(sys.argv[2]), use_cache=sys.argv[3] == "1")
+print(time.perf_counter() - start)
+"""
+
+
+def _load_all(names: list[str], directory: Path, use_cache: bool) -> float:
+    start = time.perf_counter()
+    for name in names:
+        load_vc_profile(name, directory, use_cache=use_cache)
+    return time.perf_counter() - start
+
+
+def _fresh_process(name: str, directory: Path, use_cache: bool) -> float:
+    """Time import + one load in a new interpreter, as a CLI call sees it."""
+    result = subprocess.run(
+        [sys.executable, "-c", FRESH_PROCESS_SNIPPET, name, str(directory),
+         "1" if use_cache else "0"],
+        capture_output=True, text=True, check=True, env=os.environ.copy(),
+    )
+    return float(result.stdout.strip())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sources = sorted(PROFILES_DIR.glob("*.yaml"))
+    if not sources:
+        sys.exit(f"No profiles found in {PROFILES_DIR}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["PITCHDECK_CACHE_DIR"] = str(Path(tmp) / "cache")
+        directory = Path(tmp) / "profiles"
+        directory.mkdir()
+        for i in range(args.copies):
+            for source in sources:
+                shutil.copy(source, directory / f"{source.stem}_{i}.yaml")
+        names = list_profiles(directory)
+
+        _load_all(names, directory, use_cache=True)  # compile every entry
+        cold = statistics.median(
+            _load_all(names, directory, use_cache=False) for _ in range(args.repeat)
+        )
+        cached = statistics.median(
+            _load_all(names, directory, use_cache=True) for _ in range(args.repeat)
+        )
+        print(f"{len(names)} profiles, median of {args.repeat} runs")
+        print(f"{'':<22} {'total (ms)':>11} {'per profile (ms)':>17}")
+        for label, wall in (("cold YAML + validate", cold), ("compiled cache", cached)):
+            print(f"{label:<22} {wall * 1e3:>11.1f} {wall * 1e3 / len(names):>17.3f}")
+        print(f"cache is {cold / max(cached, 1e-9):.1f}x faster\n")
+
+        # Faceted search: first call builds the index, later ones refresh it
+        start = time.perf_counter()
+        load_profile_index(directory)
+        build = time.perf_counter() - start
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            matches = load_profile_index(directory).search(
+                stage=["series-a"], sector=["enterprise-ai"], geo=["DACH"]
+            )
+            timings.append(time.perf_counter() - start)
+        print(f"profile index: build {build * 1e3:.1f} ms, "
+              f"refresh + query {statistics.median(timings) * 1e3:.2f} ms "
+              f"({len(matches)} matches)\n")
+
+        # One CLI-style call in a fresh interpreter, including imports
+        fresh_cold = _fresh_process(names[0], directory, use_cache=False)
+        fresh_cached = _fresh_process(names[0], directory, use_cache=True)
+        print("fresh process, import + one load:")
+        print(f"  cold YAML       {fresh_cold * 1e3:8.1f} ms")
+        print(f"  compiled cache  {fresh_cached * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""On-disk caches shared by the parsing, profile, and LLM stages."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "pitchdeck"
+
+
+def get_cache_dir(namespace: str = "") -> Path:
+    """Return the cache root (or a namespace below it).
+
+    Honours the PITCHDECK_CACHE_DIR environment variable so tests and CI
+    can point every cache at a scratch directory.
+    """
+    override = os.environ.get("PITCHDECK_CACHE_DIR")
+    root = Path(override) if override else DEFAULT_CACHE_DIR
+    return root / namespace if namespace else root
+
+
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_key(*parts: str) -> str:
+    """Combine key components into a single filesystem-safe digest."""
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """Key/value text store with size-bounded LRU eviction.
+
+    Each entry is one file named after its key. Reads bump the file's
+    mtime, so eviction drops the least recently used entries first.
+    Writes go through a temp file and os.replace, which keeps concurrent
+    writers from different processes from producing torn entries.
+    """
+
+    def __init__(
+        self, directory: Path, max_bytes: int, suffix: str = ".txt"
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                value = f.read()
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # entry evicted between read and touch — value is still good
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        """Store value under key, then evict down to max_bytes."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        self.evict()
+
+    def evict(self) -> int:
+        """Delete least recently used entries until under max_bytes.
+
+        Returns the number of entries removed.
+        """
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(self.suffix):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                    total += st.st_size
+        except FileNotFoundError:
+            return 0
+
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry in this cache."""
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
@@ -1,7 +1,7 @@
 """Typer CLI application for pitch deck generation."""
 
-from pathlib import Path
-from typing import Annotated
+import os
+from typing import Annotated, Optional
 
 import typer
 from dotenv import load_dotenv
@@ -9,6 +9,7 @@ from dotenv import load_dotenv
 load_dotenv()
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 
 app = typer.Typer(
     name="pitchdeck",
@@ -18,6 +19,196 @@ app = typer.Typer(
 console = Console()
 
 
+def _describe_parse_error(error: BaseException) -> str:
+    """Render a document parsing failure for the per-file FAIL line."""
+    from pitchdeck.models import DocumentParseError
+
+    if isinstance(error, FileNotFoundError):
+        return "File not found"
+    if isinstance(error, PermissionError):
+        return "Permission denied"
+    if isinstance(error, DocumentParseError):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+
+# Dropped sections listed individually before summarising the rest
+MAX_DROPPED_SHOWN = 10
+
+
+def _print_compaction(report) -> None:
+    console.print(
+        f"\n[yellow]Documents exceed the {report.token_budget}-token budget: "
+        f"kept ~{report.tokens_after} of ~{report.tokens_before} tokens, "
+        f"dropped {len(report.dropped)} least relevant section(s)[/yellow]"
+    )
+    for section in report.dropped[:MAX_DROPPED_SHOWN]:
+        where = f"p.{section.page}" if section.page else f"#{section.index + 1}"
+        title = section.heading or section.text[:60].replace("\n", " ")
+        console.print(f"  [dim]- {section.source} {where}: {title}[/dim]")
+    if len(report.dropped) > MAX_DROPPED_SHOWN:
+        console.print(
+            f"  [dim]... and {len(report.dropped) - MAX_DROPPED_SHOWN} more[/dim]"
+        )
+
+
+def _check_parse_mode(parse_mode: str) -> None:
+    from pitchdeck.parsers import PARSE_MODES
+
+    if parse_mode not in PARSE_MODES:
+        console.print(
+            f"[red]Error: --parse-mode must be one of {', '.join(PARSE_MODES)}, "
+            f"got '{parse_mode}'[/red]"
+        )
+        raise typer.Exit(1)
+
+
+def _parse_inputs(
+    input_files: list[str],
+    parse_workers: int = 0,
+    use_cache: bool = True,
+    pdf_shard_pages: Optional[int] = None,
+    parse_mode: str = "layout",
+    dedupe: bool = True,
+) -> list:
+    """Parse input documents into sections, printing one line per file."""
+    from pitchdeck.engine.dedupe import dedupe_documents
+    from pitchdeck.parsers import extract_documents_sections
+
+    console.print(f"[bold]Parsing {len(input_files)} document(s)...[/bold]")
+    documents = []
+    for path, result in extract_documents_sections(
+        input_files,
+        workers=parse_workers,
+        use_cache=use_cache,
+        pdf_shard_threshold=pdf_shard_pages,
+        mode=parse_mode,
+    ):
+        if isinstance(result, BaseException):
+            console.print(f"  [red]FAIL[/red] {path}: {_describe_parse_error(result)}")
+            raise typer.Exit(1)
+        documents.append(result)
+        n_chars = sum(len(section.text) for section in result)
+        console.print(
+            f"  [green]OK[/green] {path} ({n_chars} chars, {len(result)} sections)"
+        )
+
+    if len(documents) > 1 and dedupe:
+        documents, dedupe_report = dedupe_documents(documents)
+        if dedupe_report.paragraphs_dropped:
+            console.print(
+                f"  [dim]Dropped {dedupe_report.paragraphs_dropped} near-duplicate "
+                f"paragraph(s) across documents: {dedupe_report.chars_saved} chars, "
+                f"~{dedupe_report.tokens_saved} tokens saved[/dim]"
+            )
+    return documents
+
+
+def _load_profile_for_generation(vc: str):
+    from pitchdeck.models import ProfileNotFoundError
+    from pitchdeck.profiles import load_vc_profile
+
+    console.print(f"\n[bold]Loading VC profile: {vc}[/bold]")
+    try:
+        vc_profile = load_vc_profile(vc)
+        console.print(
+            f"  [green]OK[/green] {vc_profile.name} "
+            f"({len(vc_profile.thesis_points)} thesis points)"
+        )
+    except ProfileNotFoundError as e:
+        console.print(f"  [red]FAIL[/red] {e}")
+        console.print("  Run [bold]pitchdeck profiles[/bold] to see available profiles.")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"  [red]FAIL[/red] {type(e).__name__}: {e}")
+        raise typer.Exit(1)
+    return vc_profile
+
+
+def _initial_company(documents, templates, vc_profile, token_budget: Optional[int]):
+    """Compact documents to the token budget and build the starting profile.
+
+    Numeric fields stated in the documents are pre-filled by the
+    deterministic extractor, which reads every section, including those
+    compaction drops; everything else starts empty. Returns the
+    profile and the compacted sections its document text was joined from.
+    """
+    from pitchdeck.engine.compaction import (
+        DEFAULT_TOKEN_BUDGET,
+        combine_documents,
+        compact_documents,
+    )
+    from pitchdeck.engine.extraction import apply_extracted_metrics, extract_metrics
+    from pitchdeck.models import CompanyProfile
+
+    # Extract before compaction so facts in dropped sections still count
+    facts = extract_metrics(combine_documents(documents))
+    documents, compaction = compact_documents(
+        documents,
+        templates,
+        vc_profile,
+        DEFAULT_TOKEN_BUDGET if token_budget is None else token_budget,
+    )
+    if compaction.dropped:
+        _print_compaction(compaction)
+
+    company = CompanyProfile(
+        name="",
+        product_name="",
+        one_liner="",
+        founded_year=0,
+        employee_count=0,
+        revenue_eur=0,
+        revenue_type="revenue",
+        funding_stage="bootstrapped",
+        raw_document_text=combine_documents(documents),
+    )
+
+    # Facts stated plainly in the documents don't need a gap prompt
+    company, applied = apply_extracted_metrics(company, facts)
+    if applied:
+        console.print(f"\n[bold]Extracted {len(applied)} fact(s) from documents:[/bold]")
+        for fact in applied:
+            console.print(
+                f"  [green]{fact.field}[/green] = {fact.value} "
+                f"[dim](confidence {fact.confidence:.2f}: \"{fact.snippet}\")[/dim]"
+            )
+    return company, documents
+
+
+def _print_prompt_estimate(estimate) -> None:
+    console.print(
+        f"  [dim]Prompt ~{estimate.total_tokens} input tokens "
+        f"({estimate.cached_tokens} cached prefix, {estimate.uncached_tokens} uncached):[/dim]"
+    )
+    for block in estimate.blocks:
+        status = "cached" if block.cached else "uncached"
+        console.print(f"  [dim]  {block.name}: ~{block.tokens} ({status})[/dim]")
+
+
+def _print_slide_retrieval(documents, templates) -> None:
+    from pitchdeck.engine.retrieval import load_or_build_index
+    from pitchdeck.engine.tokens import estimate_tokens
+
+    sections = [s for doc in documents for s in doc]
+    index = load_or_build_index(sections)
+    table = Table(title="Per-slide context (BM25 top sections)")
+    table.add_column("Slide")
+    table.add_column("Sections")
+    table.add_column("Tokens", justify="right")
+    for template in templates:
+        hits = index.for_slide(template)
+        table.add_row(
+            template.slide_type,
+            "\n".join(s.heading or f"{s.source} #{s.index + 1}" for s in hits),
+            f"~{sum(estimate_tokens(s.text) for s in hits)}",
+        )
+    console.print(table)
+    console.print(
+        f"[dim]Full document: ~{sum(estimate_tokens(s.text) for s in sections)} tokens[/dim]"
+    )
+
+
 @app.command()
 def generate(
     input_files: Annotated[
@@ -40,79 +231,123 @@ def generate(
         str,
         typer.Option("--json", help="Path for JSON output (always saved; default: replaces .md with .json)"),
     ] = "",
+    no_parse_cache: Annotated[
+        bool,
+        typer.Option("--no-parse-cache", help="Re-parse documents instead of using cached text"),
+    ] = False,
+    parse_workers: Annotated[
+        int,
+        typer.Option(
+            "--parse-workers",
+            help="Parallel document parsing processes (0 = one per document, up to CPU count)",
+        ),
+    ] = 0,
+    pdf_shard_pages: Annotated[
+        Optional[int],
+        typer.Option(
+            "--pdf-shard-pages",
+            help="Split PDFs longer than this many pages across processes (0 = never; default 60)",
+        ),
+    ] = None,
+    parse_mode: Annotated[
+        str,
+        typer.Option(
+            "--parse-mode",
+            help="PDF extraction: 'layout' (tables, full layout) or 'fast' (text + headings only)",
+        ),
+    ] = "layout",
+    no_dedupe: Annotated[
+        bool,
+        typer.Option(
+            "--no-dedupe",
+            help="Keep paragraphs that nearly duplicate one in an earlier document",
+        ),
+    ] = False,
+    token_budget: Annotated[
+        Optional[int],
+        typer.Option(
+            "--token-budget",
+            help="Max estimated document tokens sent to Claude (default 120000); least relevant sections are dropped (0 = no limit)",
+        ),
+    ] = None,
+    max_input_tokens: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-input-tokens",
+            help="Refuse or auto-compact before sending if the whole prompt is estimated above this (default: fit the context window)",
+        ),
+    ] = None,
+    parallel_groups: Annotated[
+        int,
+        typer.Option(
+            "--parallel-groups",
+            help="Generate the narrative arc stages as separate requests, at most N at once, then stitch them (0 = one request for the whole deck)",
+        ),
+    ] = 0,
+    no_llm_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-llm-cache",
+            help="Always call Claude; don't read or write the LLM response cache",
+        ),
+    ] = False,
+    metrics: Annotated[
+        Optional[str],
+        typer.Option(
+            "--metrics",
+            help="Where to write this run's Claude usage/latency metrics JSON (default: <output>.metrics.json)",
+        ),
+    ] = None,
+    metrics_log: Annotated[
+        Optional[str],
+        typer.Option(
+            "--metrics-log",
+            help="Also append this run's metrics as one line to this JSONL file",
+        ),
+    ] = None,
+    llm_backend: Annotated[
+        Optional[str],
+        typer.Option(
+            "--llm-backend",
+            help="Where Claude requests go: anthropic, or mock for a local deterministic stand-in (default: $PITCHDECK_LLM_BACKEND or anthropic)",
+        ),
+    ] = None,
 ):
     """Generate a pitch deck from company documents."""
-    import os
-
     from pitchdeck.engine.gaps import detect_gaps, fill_gaps_interactive
     from pitchdeck.engine.narrative import generate_deck
     from pitchdeck.engine.slides import get_slide_templates
-    from pitchdeck.models import CompanyProfile, DocumentParseError, PitchDeckError, ProfileNotFoundError
+    from pitchdeck.models import PitchDeckError
     from pitchdeck.output import save_markdown
-    from pitchdeck.parsers import extract_document
-    from pitchdeck.profiles import load_vc_profile
+
+    _check_parse_mode(parse_mode)
+    backend = _resolve_backend(llm_backend)
 
     # Check API key
-    if not os.environ.get("ANTHROPIC_API_KEY"):
+    if _needs_api_key(backend) and not os.environ.get("ANTHROPIC_API_KEY"):
         console.print(
             "[red]Error: ANTHROPIC_API_KEY environment variable not set[/red]"
         )
         raise typer.Exit(1)
 
     # 1. Parse documents
-    console.print(f"[bold]Parsing {len(input_files)} document(s)...[/bold]")
-    combined_text = ""
-    for path in input_files:
-        try:
-            text = extract_document(path)
-            combined_text += (
-                f"\n\n--- Document: {Path(path).name} ---\n\n{text}"
-            )
-            console.print(f"  [green]OK[/green] {path} ({len(text)} chars)")
-        except FileNotFoundError:
-            console.print(f"  [red]FAIL[/red] {path}: File not found")
-            raise typer.Exit(1)
-        except PermissionError:
-            console.print(f"  [red]FAIL[/red] {path}: Permission denied")
-            raise typer.Exit(1)
-        except DocumentParseError as e:
-            console.print(f"  [red]FAIL[/red] {path}: {e}")
-            raise typer.Exit(1)
-        except Exception as e:
-            console.print(f"  [red]FAIL[/red] {path}: {type(e).__name__}: {e}")
-            raise typer.Exit(1)
+    documents = _parse_inputs(
+        input_files,
+        parse_workers=parse_workers,
+        use_cache=not no_parse_cache,
+        pdf_shard_pages=pdf_shard_pages,
+        parse_mode=parse_mode,
+        dedupe=not no_dedupe,
+    )
 
     # 2. Load VC profile
-    console.print(f"\n[bold]Loading VC profile: {vc}[/bold]")
-    try:
-        vc_profile = load_vc_profile(vc)
-        console.print(
-            f"  [green]OK[/green] {vc_profile.name} "
-            f"({len(vc_profile.thesis_points)} thesis points)"
-        )
-    except ProfileNotFoundError as e:
-        console.print(f"  [red]FAIL[/red] {e}")
-        console.print("  Run [bold]pitchdeck profiles[/bold] to see available profiles.")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"  [red]FAIL[/red] {type(e).__name__}: {e}")
-        raise typer.Exit(1)
+    vc_profile = _load_profile_for_generation(vc)
 
-    # 3. Build initial company profile from extracted text
-    company = CompanyProfile(
-        name="",
-        product_name="",
-        one_liner="",
-        founded_year=0,
-        employee_count=0,
-        revenue_eur=0,
-        revenue_type="revenue",
-        funding_stage="bootstrapped",
-        raw_document_text=combined_text,
-    )
+    # 3. Fit documents to the token budget, then build the initial profile
+    templates = get_slide_templates(vc_profile)
+    company, documents = _initial_company(documents, templates, vc_profile, token_budget)
 
     # 4. Detect and fill gaps
-    templates = get_slide_templates(vc_profile)
     gaps = detect_gaps(company, templates)
     if gaps and not skip_gaps:
         console.print(
@@ -124,6 +359,7 @@ def generate(
 
     # 5. Generate deck
     console.print(f"\n[bold]Generating {len(templates)}-slide deck...[/bold]")
+    run = _new_run_metrics("generate")
     try:
         with Progress(
             SpinnerColumn(),
@@ -131,9 +367,35 @@ def generate(
             console=console,
         ) as progress:
             task = progress.add_task(
-                "Generating slides with Claude...", total=None
+                "Waiting for the first slide from Claude...", total=len(templates)
+            )
+
+            def _on_progress(received: int, total: int) -> None:
+                progress.update(
+                    task,
+                    completed=received,
+                    description=f"Slide {received}/{total} received",
+                )
+
+            def _on_slide(slide) -> None:
+                progress.console.print(
+                    f"  [dim]{slide.slide_number}. {slide.slide_type}:[/dim] {slide.title}"
+                )
+
+            deck = generate_deck(
+                company,
+                vc_profile,
+                templates,
+                max_input_tokens=max_input_tokens,
+                on_preflight=_print_prompt_estimate,
+                on_progress=_on_progress,
+                on_slide=_on_slide,
+                parallel_groups=parallel_groups,
+                use_llm_cache=not no_llm_cache,
+                on_call=run.calls.append,
+                backend=backend,
+                documents=documents,
             )
-            deck = generate_deck(company, vc_profile, templates)
             progress.remove_task(task)
     except PitchDeckError as e:
         console.print(f"\n[red]Generation failed: {e}[/red]")
@@ -141,6 +403,8 @@ def generate(
     except Exception as e:
         console.print(f"\n[red]Unexpected error during generation: {type(e).__name__}: {e}[/red]")
         raise typer.Exit(1)
+    finally:
+        _finish_run_metrics(run, metrics or _metrics_path(output), metrics_log)
 
     # 6. Save output
     try:
@@ -180,19 +444,371 @@ def generate(
 
 
 @app.command()
-def profiles():
-    """List available VC profiles."""
-    from pitchdeck.profiles import list_profiles
+def estimate(
+    input_files: Annotated[
+        list[str],
+        typer.Argument(help="Paths to company PDFs or DOCXs"),
+    ],
+    vc: Annotated[
+        str,
+        typer.Option("--vc", "-v", help="VC profile name (without .yaml)"),
+    ] = "earlybird",
+    no_parse_cache: Annotated[
+        bool,
+        typer.Option("--no-parse-cache", help="Re-parse documents instead of using cached text"),
+    ] = False,
+    parse_workers: Annotated[
+        int,
+        typer.Option(
+            "--parse-workers",
+            help="Parallel document parsing processes (0 = one per document, up to CPU count)",
+        ),
+    ] = 0,
+    pdf_shard_pages: Annotated[
+        Optional[int],
+        typer.Option(
+            "--pdf-shard-pages",
+            help="Split PDFs longer than this many pages across processes (0 = never; default 60)",
+        ),
+    ] = None,
+    parse_mode: Annotated[
+        str,
+        typer.Option("--parse-mode", help="PDF extraction: 'layout' or 'fast'"),
+    ] = "layout",
+    no_dedupe: Annotated[
+        bool,
+        typer.Option("--no-dedupe", help="Keep near-duplicate paragraphs across documents"),
+    ] = False,
+    token_budget: Annotated[
+        Optional[int],
+        typer.Option(
+            "--token-budget",
+            help="Max estimated document tokens (default 120000; 0 = no limit)",
+        ),
+    ] = None,
+    max_input_tokens: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-input-tokens",
+            help="Whole-prompt budget to check against (default: fit the context window)",
+        ),
+    ] = None,
+    per_slide: Annotated[
+        bool,
+        typer.Option(
+            "--per-slide",
+            help="Also show the sections BM25 retrieval would send each slide",
+        ),
+    ] = False,
+):
+    """Estimate the generation prompt size offline, without calling the API."""
+    from pitchdeck.engine.narrative import (
+        MAX_OUTPUT_TOKENS,
+        estimate_generation_prompt,
+    )
+    from pitchdeck.engine.slides import get_slide_templates
+    from pitchdeck.engine.tokens import default_input_budget
 
-    available = list_profiles()
-    if not available:
+    _check_parse_mode(parse_mode)
+    documents = _parse_inputs(
+        input_files,
+        parse_workers=parse_workers,
+        use_cache=not no_parse_cache,
+        pdf_shard_pages=pdf_shard_pages,
+        parse_mode=parse_mode,
+        dedupe=not no_dedupe,
+    )
+    vc_profile = _load_profile_for_generation(vc)
+    templates = get_slide_templates(vc_profile)
+    company, documents = _initial_company(documents, templates, vc_profile, token_budget)
+
+    prompt = estimate_generation_prompt(company, vc_profile, templates)
+    if max_input_tokens is None:
+        max_input_tokens = default_input_budget(MAX_OUTPUT_TOKENS)
+
+    table = Table(title="Estimated generation prompt")
+    table.add_column("Block")
+    table.add_column("Tokens", justify="right")
+    table.add_column("Cache")
+    for block in prompt.blocks:
+        table.add_row(
+            block.name, f"~{block.tokens}", "cached" if block.cached else "uncached"
+        )
+    table.add_row("[bold]Total[/bold]", f"[bold]~{prompt.total_tokens}[/bold]", "")
+    console.print()
+    console.print(table)
+    if per_slide:
+        _print_slide_retrieval(documents, templates)
+
+    if prompt.total_tokens > max_input_tokens:
         console.print(
-            "[yellow]No profiles found in profiles/ directory[/yellow]"
+            f"[red]Over budget: ~{prompt.total_tokens} > {max_input_tokens} tokens. "
+            "generate will drop the least relevant sections to fit.[/red]"
         )
-    else:
-        console.print("[bold]Available VC profiles:[/bold]")
-        for name in available:
-            console.print(f"  - {name}")
+        raise typer.Exit(1)
+    console.print(
+        f"[green]Within budget: ~{prompt.total_tokens} of {max_input_tokens} tokens[/green]"
+    )
+
+
+@app.command()
+def profiles(
+    stage: Annotated[
+        Optional[list[str]],
+        typer.Option("--stage", help="Stage focus, e.g. series-a (repeatable)"),
+    ] = None,
+    sector: Annotated[
+        Optional[list[str]],
+        typer.Option("--sector", help="Sector focus, e.g. enterprise-ai (repeatable)"),
+    ] = None,
+    geo: Annotated[
+        Optional[list[str]],
+        typer.Option("--geo", help="Geographic focus, e.g. DACH (repeatable)"),
+    ] = None,
+    keyword: Annotated[
+        Optional[list[str]],
+        typer.Option("--keyword", "-k", help="Word that must appear in the thesis (repeatable)"),
+    ] = None,
+    min_aum: Annotated[
+        Optional[float],
+        typer.Option("--min-aum", help="Minimum assets under management in EUR"),
+    ] = None,
+):
+    """List available VC profiles, optionally filtered by focus."""
+    if not (stage or sector or geo or keyword or min_aum is not None):
+        from pitchdeck.profiles import list_profiles
+
+        available = list_profiles()
+        if not available:
+            console.print(
+                "[yellow]No profiles found in profiles/ directory[/yellow]"
+            )
+        else:
+            console.print("[bold]Available VC profiles:[/bold]")
+            for name in available:
+                console.print(f"  - {name}")
+        return
+
+    from pitchdeck.profiles import load_profile_index
+
+    index = load_profile_index()
+    for name in index.skipped:
+        console.print(f"[yellow]Skipped unreadable profile: {name}[/yellow]")
+    matches = index.search(
+        stage=stage, sector=sector, geo=geo, keywords=keyword, min_aum_eur=min_aum
+    )
+    if not matches:
+        console.print("[yellow]No profiles match these filters[/yellow]")
+        raise typer.Exit(code=1)
+
+    table = Table(title=f"{len(matches)} matching VC profile(s)")
+    table.add_column("Profile")
+    table.add_column("Fund")
+    table.add_column("AUM", justify="right")
+    table.add_column("Stages")
+    table.add_column("Sectors")
+    table.add_column("Geographies")
+    for entry in matches:
+        aum = f"EUR {entry.aum_eur / 1e6:,.0f}M" if entry.aum_eur else "-"
+        table.add_row(
+            entry.profile,
+            f"{entry.name} {entry.fund_name}",
+            aum,
+            ", ".join(entry.stage_focus),
+            ", ".join(entry.sector_focus),
+            ", ".join(entry.geo_focus),
+        )
+    console.print(table)
+
+
+def _metrics_path(output: str) -> str:
+    """deck.md -> deck.metrics.json"""
+    return f"{os.path.splitext(output)[0]}.metrics.json"
+
+
+def _new_run_metrics(command: str):
+    from datetime import datetime
+
+    from pitchdeck.models import RunMetrics
+
+    return RunMetrics(
+        command=command, started_at=datetime.now().isoformat(timespec="seconds")
+    )
+
+
+def _finish_run_metrics(run, path: str, log_path: Optional[str]) -> None:
+    """Print the one-line usage summary and write the metrics files."""
+    if not run.calls:
+        return
+    from pitchdeck.engine.telemetry import (
+        append_metrics_log,
+        summarize,
+        write_run_metrics,
+    )
+
+    console.print(f"\n[dim]{summarize(run)}[/dim]")
+    try:
+        write_run_metrics(run, path)
+        if log_path:
+            append_metrics_log(run, log_path)
+    except OSError as e:
+        # Metrics are diagnostics; never fail the run over them
+        console.print(f"[yellow]Could not write metrics: {e}[/yellow]")
+
+
+def _resolve_backend(name: Optional[str]):
+    """--llm-backend -> LLMBackend (None = the Anthropic API)."""
+    from pitchdeck.engine.backends import get_backend
+    from pitchdeck.models import PitchDeckError
+
+    try:
+        backend = get_backend(name)
+    except PitchDeckError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    if backend is not None:
+        console.print(f"[dim]Using the {backend.name} LLM backend[/dim]")
+    return backend
+
+
+def _needs_api_key(backend) -> bool:
+    return backend is None or backend.requires_api_key
+
+
+def _check_validation_options(threshold: int, skip_llm: bool, backend=None) -> None:
+    if not 0 <= threshold <= 100:
+        console.print(
+            f"[red]Error: --threshold must be between 0 and 100, got {threshold}[/red]"
+        )
+        raise typer.Exit(1)
+
+    if not skip_llm and _needs_api_key(backend) and not os.environ.get("ANTHROPIC_API_KEY"):
+        console.print(
+            "[red]Error: ANTHROPIC_API_KEY not set. "
+            "Use --skip-llm for rule-based scoring only.[/red]"
+        )
+        raise typer.Exit(1)
+
+
+def _fanout_report_path(output: str, profile: str) -> str:
+    """validation_report.md -> validation_report_<profile>.md"""
+    root, ext = os.path.splitext(output)
+    return f"{root}_{profile}{ext or '.md'}"
+
+
+def _validate_many(deck, vc: str, output: str, threshold: int, skip_llm: bool,
+                   max_input_tokens: Optional[int], workers: int,
+                   use_llm_cache: bool = True, metrics_path: Optional[str] = None,
+                   metrics_log: Optional[str] = None, backend=None) -> None:
+    """Validate deck against every profile named in vc ("all" or a list)."""
+    from pitchdeck.engine.validator import validate_deck_against_profiles
+    from pitchdeck.models import PitchDeckError
+    from pitchdeck.output import (
+        rank_validation_results,
+        save_validation_comparison,
+        save_validation_report,
+    )
+    from pitchdeck.profiles import list_profiles, load_vc_profile
+
+    names = (
+        list_profiles() if vc.strip().lower() == "all"
+        else list(dict.fromkeys(n.strip() for n in vc.split(",") if n.strip()))
+    )
+    if not names:
+        console.print("[red]Error: no VC profiles to validate against[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"\n[bold]Loading {len(names)} VC profiles[/bold]")
+    vc_profiles = {}
+    for name in names:
+        try:
+            vc_profiles[name] = load_vc_profile(name)
+        except Exception as e:
+            console.print(f"  [red]FAIL[/red] Could not load profile '{name}': {e}")
+            raise typer.Exit(1)
+    console.print(f"  [green]OK[/green] {', '.join(vc_profiles)}")
+
+    _check_validation_options(threshold, skip_llm, backend)
+
+    mode = "rule-based" if skip_llm else "LLM"
+    run = _new_run_metrics("validate")
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task(
+                f"Scoring deck against {len(vc_profiles)} profiles ({mode})...",
+                total=len(vc_profiles),
+            )
+            results = validate_deck_against_profiles(
+                deck,
+                vc_profiles,
+                threshold,
+                skip_llm,
+                max_input_tokens=max_input_tokens,
+                max_workers=workers,
+                on_result=lambda _: progress.advance(task),
+                use_llm_cache=use_llm_cache,
+                on_call=run.calls.append,
+                backend=backend,
+            )
+    except PitchDeckError as e:
+        console.print(f"  [red]Validation failed: {e}[/red]")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"  [red]Unexpected error during validation: {type(e).__name__}: {e}[/red]")
+        raise typer.Exit(1)
+    finally:
+        if metrics_path:
+            _finish_run_metrics(run, metrics_path, metrics_log)
+
+    report_paths = {}
+    for name, result in results.items():
+        if isinstance(result, Exception):
+            continue
+        path = _fanout_report_path(output, name)
+        try:
+            save_validation_report(result, path)
+        except OSError as e:
+            console.print(f"[red]Error: Failed to save report to {path}: {e}[/red]")
+            raise typer.Exit(1)
+        report_paths[name] = path
+    try:
+        save_validation_comparison(results, report_paths, output)
+    except OSError as e:
+        console.print(f"[red]Error: Failed to save comparison to {output}: {e}[/red]")
+        raise typer.Exit(1)
+
+    table = Table(title=f"{deck.company_name} across {len(results)} VC profiles")
+    table.add_column("#", justify="right")
+    table.add_column("Profile")
+    table.add_column("VC")
+    table.add_column("Score", justify="right")
+    table.add_column("Result")
+    table.add_column("VC Checks", justify="right")
+    for rank, (name, result) in enumerate(rank_validation_results(results), 1):
+        passed = sum(1 for c in result.custom_check_results if c.passed)
+        table.add_row(
+            str(rank),
+            name,
+            result.target_vc,
+            f"{result.overall_score}/100",
+            "[green]PASS[/green]" if result.pass_fail else "[red]FAIL[/red]",
+            f"{passed}/{len(result.custom_check_results)}",
+        )
+    console.print(table)
+
+    failed = {n: r for n, r in results.items() if isinstance(r, Exception)}
+    for name, error in failed.items():
+        console.print(f"  [red]FAIL[/red] {name}: {error}")
+    console.print(
+        f"\n[bold]Comparison saved to {output}; "
+        f"{len(report_paths)} per-fund report(s) alongside it[/bold]"
+    )
+    if failed:
+        raise typer.Exit(1)
 
 
 @app.command()
@@ -203,11 +819,17 @@ def validate(
     ],
     vc: Annotated[
         str,
-        typer.Option("--vc", "-v", help="VC profile name (without .yaml)"),
+        typer.Option(
+            "--vc", "-v",
+            help="VC profile name (without .yaml), a comma-separated list, or 'all'",
+        ),
     ] = "earlybird",
     output: Annotated[
         str,
-        typer.Option("--output", "-o", help="Validation report output path"),
+        typer.Option(
+            "--output", "-o",
+            help="Validation report output path (the ranked comparison with several profiles)",
+        ),
     ] = "validation_report.md",
     threshold: Annotated[
         int,
@@ -217,6 +839,48 @@ def validate(
         bool,
         typer.Option("--skip-llm", help="Skip LLM scoring (rule-based only)"),
     ] = False,
+    max_input_tokens: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-input-tokens",
+            help="Refuse LLM scoring if its prompt is estimated above this (default: fit the context window)",
+        ),
+    ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            help="Profiles scored concurrently when --vc names several",
+        ),
+    ] = 4,
+    no_llm_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-llm-cache",
+            help="Always call Claude; don't read or write the LLM response cache",
+        ),
+    ] = False,
+    metrics: Annotated[
+        Optional[str],
+        typer.Option(
+            "--metrics",
+            help="Where to write this run's Claude usage/latency metrics JSON (default: <output>.metrics.json)",
+        ),
+    ] = None,
+    metrics_log: Annotated[
+        Optional[str],
+        typer.Option(
+            "--metrics-log",
+            help="Also append this run's metrics as one line to this JSONL file",
+        ),
+    ] = None,
+    llm_backend: Annotated[
+        Optional[str],
+        typer.Option(
+            "--llm-backend",
+            help="Where Claude requests go: anthropic, or mock for a local deterministic stand-in (default: $PITCHDECK_LLM_BACKEND or anthropic)",
+        ),
+    ] = None,
 ):
     """Score a pitch deck against VC-specific rubrics."""
     from pitchdeck.engine.validator import validate_deck
@@ -260,6 +924,18 @@ def validate(
         console.print(f"  [red]FAIL[/red] Cannot parse deck JSON: {type(e).__name__}: {e}")
         raise typer.Exit(1)
 
+    backend = None if skip_llm else _resolve_backend(llm_backend)
+
+    if vc.strip().lower() == "all" or "," in vc:
+        _validate_many(
+            deck, vc, output, threshold, skip_llm, max_input_tokens, workers,
+            use_llm_cache=not no_llm_cache,
+            metrics_path=metrics or _metrics_path(output),
+            metrics_log=metrics_log,
+            backend=backend,
+        )
+        return
+
     # 2. Load VC profile
     console.print(f"\n[bold]Loading VC profile: {vc}[/bold]")
     try:
@@ -277,22 +953,9 @@ def validate(
         raise typer.Exit(1)
 
     # 3. Validate
-    if not 0 <= threshold <= 100:
-        console.print(
-            f"[red]Error: --threshold must be between 0 and 100, got {threshold}[/red]"
-        )
-        raise typer.Exit(1)
-
-    if not skip_llm:
-        import os
-
-        if not os.environ.get("ANTHROPIC_API_KEY"):
-            console.print(
-                "[red]Error: ANTHROPIC_API_KEY not set. "
-                "Use --skip-llm for rule-based scoring only.[/red]"
-            )
-            raise typer.Exit(1)
+    _check_validation_options(threshold, skip_llm, backend)
 
+    run = _new_run_metrics("validate")
     try:
         if not skip_llm:
             with Progress(
@@ -306,7 +969,15 @@ def validate(
                     "Scoring deck with Claude...", total=None
                 )
                 result = validate_deck(
-                    deck, vc_profile, threshold, skip_llm
+                    deck,
+                    vc_profile,
+                    threshold,
+                    skip_llm,
+                    max_input_tokens=max_input_tokens,
+                    on_preflight=_print_prompt_estimate,
+                    use_llm_cache=not no_llm_cache,
+                    on_call=run.calls.append,
+                    backend=backend,
                 )
                 progress.remove_task(task)
         else:
@@ -322,6 +993,8 @@ def validate(
     except Exception as e:
         console.print(f"  [red]Unexpected error during validation: {type(e).__name__}: {e}[/red]")
         raise typer.Exit(1)
+    finally:
+        _finish_run_metrics(run, metrics or _metrics_path(output), metrics_log)
 
     # 4. Save report
     try:
@@ -0,0 +1,350 @@
+"""Pluggable LLM backends for the generation and validation engines.
+
+The engines talk to the Messages API through a client's
+``messages.create``. A backend hands out clients that implement that
+call; the default (``None``) is the Anthropic API through the engines'
+own ``Anthropic``/``AsyncAnthropic`` clients. MockBackend answers
+locally with schema-valid deck, stitch and scoring JSON, so the whole
+generate -> validate pipeline can be benchmarked and tested offline.
+
+Select a backend with ``--llm-backend`` or PITCHDECK_LLM_BACKEND. The
+mock is tuned with PITCHDECK_MOCK_LATENCY (seconds before the first
+token), PITCHDECK_MOCK_TOKENS_PER_S (streaming rate, 0 = instant),
+PITCHDECK_MOCK_ERROR_RATE (share of calls failing with
+PITCHDECK_MOCK_ERROR_STATUS, default 529) and PITCHDECK_MOCK_SEED.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from typing import Optional
+
+from anthropic import InternalServerError, RateLimitError
+from anthropic.resources.messages import AsyncMessages, Messages
+
+from pitchdeck.engine import telemetry
+from pitchdeck.engine.tokens import estimate_tokens
+from pitchdeck.models import PitchDeckError
+
+BACKEND_NAMES = ("anthropic", "mock")
+
+# Characters per streamed chunk of the mock (about 8 tokens)
+MOCK_CHUNK_CHARS = 32
+
+# Keyword arguments the installed SDK's messages.create accepts; the mock
+# rejects anything else, as the real client would
+_SYNC_PARAMETERS = frozenset(inspect.signature(Messages.create).parameters) - {"self"}
+_ASYNC_PARAMETERS = frozenset(inspect.signature(AsyncMessages.create).parameters) - {"self"}
+
+
+class LLMBackend(ABC):
+    """Source of Messages-API clients for the engines.
+
+    client() returns an object whose ``messages.create(...)`` behaves like
+    ``Anthropic().messages.create``; async_client() the same for
+    ``AsyncAnthropic``, including ``stream=True``.
+    """
+
+    name = ""
+    requires_api_key = True
+
+    @abstractmethod
+    def client(self):
+        """A client for synchronous calls."""
+
+    @abstractmethod
+    def async_client(self):
+        """A client for async (and streaming) calls."""
+
+
+def get_backend(name: Optional[str] = None) -> Optional[LLMBackend]:
+    """Resolve a backend name (default: PITCHDECK_LLM_BACKEND, then
+    "anthropic"). Returns None for the Anthropic API.
+
+    Raises PitchDeckError for an unknown name.
+    """
+    name = (name or os.environ.get("PITCHDECK_LLM_BACKEND") or "anthropic").lower()
+    if name == "anthropic":
+        return None
+    if name == "mock":
+        return MockBackend.from_env()
+    raise PitchDeckError(
+        f"Unknown LLM backend '{name}'. Choose from: {', '.join(BACKEND_NAMES)}"
+    )
+
+
+def backend_model(backend: Optional[LLMBackend], model: str) -> str:
+    """Model name for cache keys and metrics: mock answers never mix
+    with real ones, and are never costed."""
+    return model if backend is None else f"{backend.name}/{model}"
+
+
+class MockBackend(LLMBackend):
+    """Deterministic local stand-in for the Anthropic API.
+
+    Responses depend only on the request: the same prompt always yields
+    the same slides and scores. Prompt caching is simulated (the first
+    request with a given system prefix writes it, later ones read it) so
+    usage metrics look like a real run. Injected errors are real
+    ``anthropic`` status errors, so retries and error mapping run
+    exactly as they would against the API.
+    """
+
+    name = "mock"
+    requires_api_key = False
+
+    def __init__(
+        self,
+        latency_s: float = 0.0,
+        tokens_per_second: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 529,
+        seed: int = 0,
+    ):
+        self.latency_s = latency_s
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._cached_prefixes: set[str] = set()
+
+    @classmethod
+    def from_env(cls) -> "MockBackend":
+        def number(name: str, default: float) -> float:
+            value = os.environ.get(name)
+            if not value:
+                return default
+            try:
+                return float(value)
+            except ValueError:
+                raise PitchDeckError(f"{name} must be a number, got {value!r}")
+
+        return cls(
+            latency_s=number("PITCHDECK_MOCK_LATENCY", 0.0),
+            tokens_per_second=number("PITCHDECK_MOCK_TOKENS_PER_S", 0.0),
+            error_rate=number("PITCHDECK_MOCK_ERROR_RATE", 0.0),
+            error_status=int(number("PITCHDECK_MOCK_ERROR_STATUS", 529)),
+            seed=int(number("PITCHDECK_MOCK_SEED", 0)),
+        )
+
+    def client(self):
+        return SimpleNamespace(messages=SimpleNamespace(create=self._create))
+
+    def async_client(self):
+        return SimpleNamespace(messages=SimpleNamespace(create=self._create_async))
+
+    # -- Messages API ---------------------------------------------------
+
+    def _create(self, *, max_tokens: int, messages: list, system=None, **kwargs):
+        _check_parameters(kwargs, _SYNC_PARAMETERS)
+        text, usage, stop_reason = self._respond(system or [], messages, max_tokens)
+        time.sleep(self.latency_s)
+        telemetry.mark_response_started()  # as the pooled client's hook does
+        time.sleep(self._stream_seconds(text))
+        return _message(text, usage, stop_reason)
+
+    async def _create_async(
+        self, *, max_tokens: int, messages: list, system=None, stream: bool = False,
+        **kwargs,
+    ):
+        _check_parameters(kwargs, _ASYNC_PARAMETERS)
+        text, usage, stop_reason = self._respond(system or [], messages, max_tokens)
+        if not stream:
+            await asyncio.sleep(self.latency_s + self._stream_seconds(text))
+            return _message(text, usage, stop_reason)
+        return self._stream(text, usage, stop_reason)
+
+    async def _stream(self, text: str, usage, stop_reason: str):
+        await asyncio.sleep(self.latency_s)
+        yield SimpleNamespace(
+            type="message_start", message=SimpleNamespace(usage=usage)
+        )
+        for i in range(0, len(text), MOCK_CHUNK_CHARS):
+            chunk = text[i:i + MOCK_CHUNK_CHARS]
+            await asyncio.sleep(self._stream_seconds(chunk))
+            yield SimpleNamespace(
+                type="content_block_delta",
+                delta=SimpleNamespace(type="text_delta", text=chunk),
+            )
+        yield SimpleNamespace(
+            type="message_delta",
+            delta=SimpleNamespace(stop_reason=stop_reason),
+            usage=SimpleNamespace(output_tokens=usage.output_tokens),
+        )
+
+    def _stream_seconds(self, text: str) -> float:
+        if self.tokens_per_second <= 0:
+            return 0.0
+        return estimate_tokens(text) / self.tokens_per_second
+
+    def _respond(self, system: list, messages: list, max_tokens: int):
+        """Return (text, usage, stop_reason), or raise an injected error."""
+        with self._lock:
+            self.calls += 1
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+        if fail:
+            raise _status_error(self.error_status)
+
+        prompt = "\n".join(
+            m["content"] if isinstance(m["content"], str)
+            else "".join(b.get("text", "") for b in m["content"])
+            for m in messages
+        )
+        text = _mock_completion(prompt)
+        output_tokens = estimate_tokens(text)
+        stop_reason = "end_turn"
+        if output_tokens > max_tokens:
+            text = text[: max_tokens * 4]
+            output_tokens = max_tokens
+            stop_reason = "max_tokens"
+
+        cached_blocks = _cached_prefix(system)
+        prefix = "".join(b["text"] for b in cached_blocks)
+        prefix_tokens = estimate_tokens(prefix) if prefix else 0
+        with self._lock:
+            key = hashlib.sha256(prefix.encode()).hexdigest()
+            hit = key in self._cached_prefixes
+            self._cached_prefixes.add(key)
+        rest = "".join(b["text"] for b in system[len(cached_blocks):])
+        usage = SimpleNamespace(
+            input_tokens=estimate_tokens(rest + prompt),
+            output_tokens=output_tokens,
+            cache_creation_input_tokens=0 if hit else prefix_tokens,
+            cache_read_input_tokens=prefix_tokens if hit else 0,
+        )
+        return text, usage, stop_reason
+
+
+def _check_parameters(kwargs: dict, accepted: frozenset) -> None:
+    for name in kwargs:
+        if name not in accepted:
+            raise TypeError(
+                f"Messages.create() got an unexpected keyword argument '{name}'"
+            )
+
+
+def _cached_prefix(system: list) -> list:
+    last = max(
+        (i for i, block in enumerate(system) if block.get("cache_control")),
+        default=-1,
+    )
+    return system[: last + 1]
+
+
+def _message(text: str, usage, stop_reason: str):
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text=text)],
+        usage=usage,
+        stop_reason=stop_reason,
+    )
+
+
+def _status_error(status: int):
+    # Duck-typed HTTP response: all the SDK's error classes read from it
+    response = SimpleNamespace(
+        status_code=status,
+        headers={},
+        request=SimpleNamespace(method="POST", url="mock://v1/messages"),
+    )
+    error_class = RateLimitError if status == 429 else InternalServerError
+    return error_class(
+        message=f"Mock backend injected HTTP {status}", response=response, body=None
+    )
+
+
+# -- Canned content -------------------------------------------------------
+
+_SLIDE_LINE = re.compile(r"^Slide (\d+): (\S+)$", re.MULTILINE)
+_MAX_BULLETS = re.compile(r"Max bullets: (\d+)")
+_AUDIENCE = re.compile(r"for (.+?) targeting (.+?)\.")
+
+
+def _mock_completion(prompt: str) -> str:
+    """The JSON a well-behaved model would return for this prompt."""
+    if '"narrative_coherence"' in prompt:
+        return json.dumps(_scores(prompt), indent=2)
+    if "<slides>" in prompt:
+        return json.dumps(_stitch(prompt), indent=2)
+    return json.dumps(_deck(prompt), indent=2)
+
+
+def _digest(text: str) -> int:
+    return int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+
+
+def _deck(prompt: str) -> dict:
+    match = _AUDIENCE.search(prompt)
+    company, vc = match.groups() if match else ("the company", "the fund")
+    bullet_limits = [int(n) for n in _MAX_BULLETS.findall(prompt)]
+    slides = []
+    for i, (number, slide_type) in enumerate(_SLIDE_LINE.findall(prompt)):
+        label = slide_type.replace("-", " ").replace("_", " ")
+        n_bullets = max(1, min(3, bullet_limits[i] if i < len(bullet_limits) else 3))
+        slides.append({
+            "slide_number": int(number),
+            "slide_type": slide_type,
+            "title": f"{company}: {label.title()}",
+            "headline": f"Why the {label} makes {company} a fit for {vc}",
+            "bullets": [f"{label.capitalize()} point {j}" for j in range(1, n_bullets + 1)],
+            "metrics": [f"{(_digest(prompt + number) % 90) + 10}% YoY growth"],
+            "speaker_notes": f"Walk {vc} through the {label} in two sentences.",
+            "transition_to_next": f"From the {label}, on to what comes next.",
+            "vc_alignment_notes": [f"Speaks to {vc}'s thesis on {label}"],
+        })
+    return {
+        "narrative_arc": f"{company} from problem to ask, told for {vc}",
+        "gaps_identified": [],
+        "slides": slides,
+    }
+
+
+def _stitch(prompt: str) -> dict:
+    match = re.search(r"for each of slides ([\d, ]+)", prompt)
+    numbers = [int(n) for n in re.findall(r"\d+", match.group(1))] if match else []
+    return {
+        "narrative_arc": "Hook, tension, resolution, proof, trust, ask",
+        "transitions": [
+            {"slide_number": n, "transition_to_next": f"Slide {n} sets up the next section."}
+            for n in numbers
+        ],
+    }
+
+
+def _scores(prompt: str) -> dict:
+    deck = re.search(r"<deck>\n(.*)\n</deck>", prompt, re.DOTALL)
+    try:
+        slides = json.loads(deck.group(1))["slides"] if deck else []
+    except (ValueError, KeyError):
+        slides = []
+    seed = _digest(prompt)
+
+    def dimension(offset: int) -> dict:
+        return {
+            "score": 55 + (seed >> offset) % 41,
+            "rationale": "Deterministic mock assessment.",
+            "evidence_found": ["Clear structure"],
+            "evidence_missing": ["More customer proof"],
+        }
+
+    return {
+        "narrative_coherence": dimension(0),
+        "thesis_alignment": dimension(6),
+        "common_mistakes": dimension(12),
+        "slide_quality": [
+            {"slide_number": s.get("slide_number"), "quality_note": "Reads cleanly."}
+            for s in slides if isinstance(s, dict)
+        ],
+        "top_strengths": ["Clear narrative", "Specific metrics", "Focused ask"],
+        "critical_gaps": ["Retention data", "Competitive moat", "Use of funds"],
+        "recommendation": "Tighten the proof section before sending.",
+    }
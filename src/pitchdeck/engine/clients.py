@@ -0,0 +1,190 @@
+"""Process-wide, pooled Anthropic clients shared by the engines.
+
+Creating a client per call means a new connection pool, so every call
+pays DNS, TCP and TLS setup again. The engines borrow clients from here
+instead; one client (and its keep-alive pool) serves every call of the
+process, including the validation fan-out threads and concurrent
+generation groups.
+
+Sync clients are shared process-wide. Async clients hold connections
+bound to an event loop, so they are shared per running loop: all groups
+of one generate_deck call share one, and so does a long-lived service
+loop across calls.
+
+Pool size, keep-alive and timeouts come from PITCHDECK_HTTP_MAX_CONNECTIONS,
+PITCHDECK_HTTP_KEEPALIVE_EXPIRY, PITCHDECK_HTTP_TIMEOUT and
+PITCHDECK_HTTP_CONNECT_TIMEOUT, or configure_clients().
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Callable, Optional, TypeVar
+
+import anthropic
+
+from pitchdeck.engine import telemetry
+from pitchdeck.models import PitchDeckError
+
+T = TypeVar("T")
+
+
+class ClientPoolConfig:
+    """HTTP connection pool and timeout settings for shared clients."""
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        timeout: float = 600.0,
+        connect_timeout: float = 10.0,
+    ):
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+
+    @classmethod
+    def from_env(cls) -> "ClientPoolConfig":
+        defaults = cls()
+
+        def number(name: str, default: float) -> float:
+            value = os.environ.get(name)
+            if not value:
+                return default
+            try:
+                return float(value)
+            except ValueError:
+                raise PitchDeckError(f"{name} must be a number, got {value!r}")
+
+        return cls(
+            max_connections=int(number(
+                "PITCHDECK_HTTP_MAX_CONNECTIONS", defaults.max_connections
+            )),
+            keepalive_expiry=number(
+                "PITCHDECK_HTTP_KEEPALIVE_EXPIRY", defaults.keepalive_expiry
+            ),
+            timeout=number("PITCHDECK_HTTP_TIMEOUT", defaults.timeout),
+            connect_timeout=number(
+                "PITCHDECK_HTTP_CONNECT_TIMEOUT", defaults.connect_timeout
+            ),
+        )
+
+    def client_options(self, asynchronous: bool) -> dict:
+        """Keyword arguments for Anthropic()/AsyncAnthropic()."""
+        # The SDK's own Limits/Timeout types, whichever HTTP library it uses
+        limits = type(anthropic.DEFAULT_CONNECTION_LIMITS)(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        if asynchronous:
+            # Async calls stream and time their first event themselves
+            http_client = anthropic.DefaultAsyncHttpxClient(limits=limits)
+        else:
+            http_client = anthropic.DefaultHttpxClient(
+                limits=limits,
+                event_hooks={"response": [telemetry.mark_response_started]},
+            )
+        return {
+            "timeout": anthropic.Timeout(self.timeout, connect=self.connect_timeout),
+            "http_client": http_client,
+            "max_retries": 0,  # retries: see ratelimit
+        }
+
+
+_lock = threading.Lock()
+_config: Optional[ClientPoolConfig] = None
+_sync_clients: dict = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _client_key(factory: Callable) -> tuple:
+    # A changed key or endpoint (tests, a long-lived process) gets a new client
+    return (
+        factory,
+        os.environ.get("ANTHROPIC_API_KEY"),
+        os.environ.get("ANTHROPIC_BASE_URL"),
+    )
+
+
+def get_pool_config() -> ClientPoolConfig:
+    global _config
+    with _lock:
+        if _config is None:
+            _config = ClientPoolConfig.from_env()
+        return _config
+
+
+def configure_clients(config: Optional[ClientPoolConfig]) -> None:
+    """Use config for clients created from now on (None = from the
+    environment) and drop the current ones."""
+    global _config
+    reset_clients()
+    with _lock:
+        _config = config
+
+
+def shared_client(factory: Callable[..., T] = anthropic.Anthropic) -> T:
+    """Return the process-wide client made by factory (e.g. Anthropic).
+
+    Safe to call from many threads; they all get the same client.
+    """
+    config = get_pool_config()
+    key = _client_key(factory)
+    with _lock:
+        client = _sync_clients.get(key)
+        if client is None:
+            client = factory(**config.client_options(asynchronous=False))
+            _sync_clients[key] = client
+        return client
+
+
+def shared_async_client(factory: Callable[..., T] = anthropic.AsyncAnthropic) -> T:
+    """Return the client made by factory (e.g. AsyncAnthropic) for the
+    running event loop."""
+    loop = asyncio.get_running_loop()
+    config = get_pool_config()
+    key = _client_key(factory)
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = factory(**config.client_options(asynchronous=True))
+            clients[key] = client
+        return client
+
+
+async def close_loop_clients() -> None:
+    """Close the running loop's shared async clients (call before the
+    loop ends, as generate_deck does for the loop it owns)."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = list(_async_clients.pop(loop, {}).values())
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                pass  # a half-built or mocked client
+
+
+def reset_clients() -> None:
+    """Forget every shared client; the next call creates fresh ones."""
+    with _lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+        _async_clients.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                pass  # a half-built or mocked client
@@ -0,0 +1,172 @@
+"""Token-budgeted compaction of parsed documents.
+
+Large data rooms do not fit in the generation prompt. Compaction scores
+every section against the vocabulary the deck actually needs — slide
+required elements, slide metrics and the VC's emphasised metrics — and
+keeps the highest-scoring sections until the token budget is spent, so
+prompt size (and with it latency and cost) is bounded by the budget
+rather than by the input.
+"""
+
+import math
+import re
+from collections import Counter
+
+from pitchdeck.engine.tokens import estimate_tokens
+from pitchdeck.models import (
+    CompactionReport,
+    DocumentSection,
+    SlideTemplate,
+    VCProfile,
+)
+
+# Document tokens allowed into the generation prompt by default, leaving
+# room for the profile, slide instructions and a 16k-token response
+# inside a 200k context window.
+DEFAULT_TOKEN_BUDGET = 120_000
+
+# Term weights by where the term comes from
+REQUIRED_ELEMENT_WEIGHT = 1.0
+SLIDE_METRIC_WEIGHT = 1.5
+VC_METRIC_WEIGHT = 2.0
+# Figures (42%, €1.2M, 850k) are what metric slides are built from
+NUMBER_WEIGHT = 0.5
+# A term in the section heading counts this many times over
+HEADING_BOOST = 3.0
+
+_WORD_RE = re.compile(r"[a-z][a-z0-9]+")
+_NUMBER_RE = re.compile(
+    r"\d[\d.,]*\s*(?:%|[kmb]\b|eur\b|€)|[€$]\s*\d", re.IGNORECASE
+)
+
+_STOPWORDS = frozenset({
+    "and", "the", "for", "with", "per", "or", "of", "to", "vs", "new",
+    "key", "names", "description", "summary", "explanation",
+})
+
+
+def _terms(phrase: str) -> list[str]:
+    """Split a template identifier or metric phrase into matchable words."""
+    words = _WORD_RE.findall(phrase.lower().replace("_", " "))
+    return [w for w in words if w not in _STOPWORDS]
+
+
+def build_vocabulary(
+    templates: list[SlideTemplate], vc_profile: VCProfile
+) -> dict[str, float]:
+    """Map each relevant term to its weight (highest source wins)."""
+    vocabulary: dict[str, float] = {}
+
+    def add(phrase: str, weight: float) -> None:
+        for term in _terms(phrase):
+            vocabulary[term] = max(vocabulary.get(term, 0.0), weight)
+
+    for template in templates:
+        for element in template.required_elements:
+            add(element, REQUIRED_ELEMENT_WEIGHT)
+        for metric in template.metrics_needed:
+            add(metric, SLIDE_METRIC_WEIGHT)
+    for metric in vc_profile.deck_preferences.metrics_emphasis:
+        add(metric, VC_METRIC_WEIGHT)
+    return vocabulary
+
+
+def score_section(section: DocumentSection, vocabulary: dict[str, float]) -> float:
+    """Relevance per token: weighted term hits, damped by repetition."""
+    counts = Counter(_WORD_RE.findall(section.text.lower()))
+    heading_terms = set(_WORD_RE.findall(section.heading.lower()))
+    score = 0.0
+    for term, weight in vocabulary.items():
+        tf = counts.get(term, 0)
+        if tf:
+            score += weight * (1 + math.log(tf))
+        if term in heading_terms:
+            score += weight * HEADING_BOOST
+    numbers = len(_NUMBER_RE.findall(section.text))
+    if numbers:
+        score += NUMBER_WEIGHT * (1 + math.log(numbers))
+    # Square root, not linear: a long relevant section should still beat a
+    # short one, just not in proportion to its length.
+    return score / math.sqrt(max(estimate_tokens(section.text), 1))
+
+
+def compact_documents(
+    documents: list[list[DocumentSection]],
+    templates: list[SlideTemplate],
+    vc_profile: VCProfile,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+) -> tuple[list[list[DocumentSection]], CompactionReport]:
+    """Keep the most relevant sections that fit in token_budget.
+
+    Sections are taken in descending score order, skipping any that no
+    longer fit; survivors keep their original document order. A budget of
+    0 disables compaction.
+    """
+    tokens = [[estimate_tokens(s.text) for s in doc] for doc in documents]
+    total = sum(map(sum, tokens))
+    report = CompactionReport(
+        token_budget=token_budget, tokens_before=total, tokens_after=total
+    )
+    if not token_budget or total <= token_budget:
+        return documents, report
+
+    vocabulary = build_vocabulary(templates, vc_profile)
+    ranked = sorted(
+        (-score_section(section, vocabulary), d, i)
+        for d, doc in enumerate(documents)
+        for i, section in enumerate(doc)
+    )
+    keep = set()
+    used = 0
+    for _, d, i in ranked:
+        if used + tokens[d][i] <= token_budget:
+            keep.add((d, i))
+            used += tokens[d][i]
+
+    result = []
+    for d, doc in enumerate(documents):
+        kept = []
+        for i, section in enumerate(doc):
+            if (d, i) in keep:
+                kept.append(section)
+            else:
+                report.dropped.append(section)
+        result.append(kept)
+    report.tokens_after = used
+    return result, report
+
+
+DOCUMENT_HEADER = "\n\n--- Document: {name} ---\n\n"
+_DOCUMENT_HEADER_RE = re.compile(r"\n\n--- Document: (.+?) ---\n\n")
+
+
+def combine_documents(documents: list[list[DocumentSection]]) -> str:
+    """Join parsed documents into one prompt text, with a header per file."""
+    parts = []
+    for sections in documents:
+        if not sections:
+            continue
+        parts.append(DOCUMENT_HEADER.format(name=sections[0].source))
+        parts.append("\n\n".join(section.text for section in sections))
+    return "".join(parts)
+
+
+def split_documents(text: str) -> list[list[DocumentSection]]:
+    """Recover per-document sections from text built by combine_documents.
+
+    Text without document headers is treated as a single document.
+    """
+    from pitchdeck.parsers.sections import split_markdown
+
+    pieces = _DOCUMENT_HEADER_RE.split(text)
+    # split() alternates [preamble, name, body, name, body, ...]
+    named = [("", pieces[0])] + list(zip(pieces[1::2], pieces[2::2]))
+    documents = []
+    for name, body in named:
+        if not body.strip():
+            continue
+        documents.append([
+            DocumentSection(source=name, index=index, heading=heading, text=chunk)
+            for index, (heading, chunk) in enumerate(split_markdown(body.splitlines()))
+        ])
+    return documents
@@ -0,0 +1,138 @@
+"""Cross-document near-duplicate paragraph elimination.
+
+Update memos and narrative briefs repeat whole passages. Sending both
+copies doubles their cost in the cached <company_document> block, so
+paragraphs that nearly duplicate one from an earlier document are dropped
+before prompting.
+
+Detection uses MinHash signatures over word shingles with LSH banding:
+each paragraph is hashed once and only compared against paragraphs that
+share a band bucket, so the whole pass is linear in input size.
+"""
+
+import hashlib
+import re
+import struct
+from typing import Iterator
+
+from pitchdeck.engine.tokens import estimate_tokens
+from pitchdeck.models import DedupeReport, DocumentSection
+
+SHINGLE_WORDS = 5
+# Short paragraphs (headings, table rows, one-liners) are never dropped —
+# repeating them is cheap and they often carry structure.
+MIN_PARAGRAPH_CHARS = 80
+SIMILARITY_THRESHOLD = 0.8
+
+# 32 hash functions split into 8 bands of 4 rows: pairs with Jaccard 0.8
+# become candidates ~98% of the time, pairs at 0.5 only ~40%, and every
+# candidate is then checked against the threshold.
+NUM_HASHES = 32
+BANDS = 8
+ROWS_PER_BAND = NUM_HASHES // BANDS
+
+_WORD_RE = re.compile(r"\w+")
+_UINT32S = struct.Struct(f"<{NUM_HASHES // 2}I")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+
+
+def _shingles(text: str) -> set[bytes]:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= SHINGLE_WORDS:
+        return {" ".join(words).encode("utf-8")}
+    return {
+        " ".join(words[i : i + SHINGLE_WORDS]).encode("utf-8")
+        for i in range(len(words) - SHINGLE_WORDS + 1)
+    }
+
+
+def _hash_row(shingle: bytes) -> tuple[int, ...]:
+    """Derive NUM_HASHES independent 32-bit hashes from two blake2b digests."""
+    return _UINT32S.unpack(
+        hashlib.blake2b(shingle, digest_size=64, person=b"pd-mh-a").digest()
+    ) + _UINT32S.unpack(
+        hashlib.blake2b(shingle, digest_size=64, person=b"pd-mh-b").digest()
+    )
+
+
+def minhash_signature(text: str) -> tuple[int, ...]:
+    """Return the MinHash signature of a paragraph's word shingles."""
+    rows = [_hash_row(shingle) for shingle in _shingles(text)]
+    # Column-wise minimum, done by zip/min in C rather than a Python loop
+    return tuple(map(min, zip(*rows)))
+
+
+def estimated_similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def _bands(signature: tuple[int, ...]) -> Iterator[tuple[int, tuple[int, ...]]]:
+    for band in range(BANDS):
+        start = band * ROWS_PER_BAND
+        yield band, signature[start : start + ROWS_PER_BAND]
+
+
+def dedupe_documents(
+    documents: list[list[DocumentSection]],
+    threshold: float = SIMILARITY_THRESHOLD,
+) -> tuple[list[list[DocumentSection]], DedupeReport]:
+    """Drop paragraphs that nearly duplicate one in an earlier document.
+
+    The first occurrence is kept; repeats within the same document are
+    left alone. Sections that lose every paragraph are removed. Returns
+    the filtered documents and a report of what was saved.
+    """
+    report = DedupeReport()
+    # (band, band_values) -> signatures of kept paragraphs in earlier documents
+    buckets: dict[tuple[int, tuple[int, ...]], list[tuple[int, ...]]] = {}
+    result = []
+
+    for sections in documents:
+        kept_sections = []
+        # Indexed only once the document is done, so repeats within a
+        # document never match each other
+        pending = []
+        for section in sections:
+            kept_paragraphs = []
+            for paragraph in _PARAGRAPH_SPLIT_RE.split(section.text):
+                if not paragraph.strip():
+                    continue
+                report.paragraphs_total += 1
+                if len(paragraph) < MIN_PARAGRAPH_CHARS:
+                    kept_paragraphs.append(paragraph)
+                    continue
+                signature = minhash_signature(paragraph)
+                if _has_near_duplicate(signature, buckets, threshold):
+                    report.paragraphs_dropped += 1
+                    report.chars_saved += len(paragraph)
+                    report.tokens_saved += estimate_tokens(paragraph)
+                    continue
+                kept_paragraphs.append(paragraph)
+                pending.append(signature)
+            if kept_paragraphs:
+                text = "\n\n".join(kept_paragraphs)
+                kept_sections.append(
+                    section if text == section.text
+                    else section.model_copy(update={"text": text})
+                )
+        for signature in pending:
+            for band_key in _bands(signature):
+                buckets.setdefault(band_key, []).append(signature)
+        result.append(kept_sections)
+
+    return result, report
+
+
+def _has_near_duplicate(
+    signature: tuple[int, ...], buckets: dict, threshold: float
+) -> bool:
+    seen = set()
+    for band_key in _bands(signature):
+        for other in buckets.get(band_key, ()):
+            if id(other) in seen:
+                continue
+            seen.add(id(other))
+            if estimated_similarity(signature, other) >= threshold:
+                return True
+    return False
@@ -0,0 +1,370 @@
+"""Deterministic metric extraction from company documents.
+
+Briefs usually state ARR, NDR, burn and headcount in plain sentences
+("ARR of EUR 1.2M", "130% NDR", "team of 15"). Pulling those out with
+patterns lets the profile start populated, so gap prompts cover only
+what is really missing — without an extra LLM round trip.
+
+Every fact carries a confidence and the character span it came from.
+Statements framed as targets or projections ("Target: 50 customers by
+year 2") are down-weighted. An explicitly negated value ("NOT 15
+employees") is rejected for its field everywhere in the text, so a
+stale figure in an older document cannot win. When confident statements
+disagree, the chosen fact drops below MIN_CONFIDENCE and the gap prompt
+asks the user instead of guessing.
+"""
+
+import re
+from typing import Callable, Iterator, Optional
+
+from pitchdeck.models import CompanyProfile, ExtractedFact
+
+# Facts at or above this confidence are written into the profile
+MIN_CONFIDENCE = 0.6
+# Confidence of a field whose confident statements disagree
+CONFLICT_CONFIDENCE = 0.3
+# Multiplier applied to forward-looking statements
+FORWARD_LOOKING_PENALTY = 0.5
+# Ranges ("EUR 80-100K") use their midpoint, with this confidence cut
+RANGE_PENALTY = 0.1
+# Characters around a match inspected for negation/forward-looking cues
+CONTEXT_CHARS = 80
+AFTER_CONTEXT_CHARS = 20
+
+_MULTIPLIERS = {
+    "k": 1e3, "thousand": 1e3, "tsd": 1e3,
+    "m": 1e6, "mn": 1e6, "mio": 1e6, "million": 1e6, "millions": 1e6,
+    "b": 1e9, "bn": 1e9, "billion": 1e9, "mrd": 1e9,
+}
+
+_NUM = r"\d[\d.,]*"
+_SUFFIX = r"(?:k|thousand|tsd|mn|mio|millions?|m|bn|billion|mrd|b)\b\.?"
+_CURRENCY = r"(?:€|EUR\b|euros?\b)"
+
+# "EUR 1.2M", "€80-100k", "2,400,000 EUR", "1.5 Mio. €"
+AMOUNT = (
+    rf"(?P<cur1>{_CURRENCY})?\s*[>~≈]?\s*"
+    rf"(?P<num>{_NUM})(?:\s*[-–]\s*(?P<num2>{_NUM}))?"
+    rf"\s*(?P<suf>{_SUFFIX})?\s*(?P<cur2>{_CURRENCY})?"
+)
+PERCENT = rf"(?P<num>{_NUM})(?:\s*[-–]\s*(?P<num2>{_NUM}))?\s*%"
+COUNT = rf"(?P<num>{_NUM})(?:\s*[-–]\s*(?P<num2>{_NUM}))?\+?"
+YEAR = r"(?P<num>(?:19|20)\d{2})\b"
+MULTIPLE = r"(?P<num>\d+(?:[.,]\d+)?)\s*[x×]"
+
+# Filler allowed between a keyword and its value: short, same sentence,
+# no other figures or quotes ("NDR: "100% of pilots..."" must not match)
+_GAP = r"[^\n\d%€.;:\"“”]{0,25}?:?[^\n\d%€.;\"“”]{0,6}?"
+_BACK_GAP = r"[^\n\d%€.;:\"“”]{0,15}?"
+
+_NEGATION_RE = re.compile(r"\bnot\b[^\n.;]*$", re.IGNORECASE)
+_FORWARD_RE = re.compile(
+    r"\b(?:target(?:ing)?|projected|projection|forecast|plan(?:ned)?|goal|"
+    r"expected|post-seed|will|gets?\s+us\s+to|reach|"
+    r"by\s+(?:end\s+of\s+)?(?:year|20\d\d)|year\s+\d)\b"
+    r"[^\n.;]*$",
+    re.IGNORECASE,
+)
+# Figures about the market or ICP, not the company ("market growing at
+# 38% CAGR", "SOM: 50 customers", "companies with 50-500 employees")
+_MARKET_BEFORE_RE = re.compile(
+    r"\b(?:market|TAM|SAM|SOM|ICP|industry|compan(?:y|ies)\s*(?:with|\())"
+    r"[^\n.;]*$",
+    re.IGNORECASE,
+)
+_MARKET_AFTER_RE = re.compile(r"^\s*(?:CAGR|market)\b", re.IGNORECASE)
+
+_NDR = r"(?:NDR|NRR|net\s+(?:dollar|revenue)\s+retention(?:\s*\((?:NDR|NRR)\))?)"
+_GROSS_MARGIN = r"gross\s+margins?"
+_YOY = r"(?:YoY|y/y|year[-\s]over[-\s]year|annual(?:ly)?)"
+_GROWTH = rf"(?:{_YOY}\s+(?:revenue\s+|ARR\s+)?growth(?:\s+rate)?|growth\s+rate|grew|growing)"
+_ARR = r"(?:ARR|annual\s+recurring\s+revenue)"
+_MRR = r"(?:MRR|monthly\s+recurring\s+revenue)"
+_REVENUE = r"(?:revenues?|turnover|sales)"
+_BURN = r"(?:(?:monthly\s+)?(?:net\s+|cash\s+)?burn(?:\s+rate)?|burning)"
+_PER_MONTH = r"\s*(?:/|per|a|each)\s*(?:month|mo)\b"
+_PER_YEAR = r"\s*(?:/|per|a|each)\s*(?:year|yr|annum)\b"
+_CUSTOMERS = r"(?:(?:paying|active|enterprise|B2B)\s+)?(?:customers|clients|logos)"
+_EMPLOYEES = r"(?:employees|FTEs?|people|team\s+members|staff)"
+_RAISING = r"(?:raising|(?:looking|seeking|aiming)\s+(?:to\s+raise|for)|target(?:ed)?\s+raise|round\s+size|the\s+ask|raise)\b"
+_RAISED = r"(?:raised|total\s+funding(?:\s+raised)?|funded\s+with)\b"
+_FOUNDED = r"(?:founded|established|incorporated|est\.)(?:\s+in)?"
+
+
+def parse_number(text: str, has_suffix: bool = False) -> Optional[float]:
+    """Parse "1.2", "1,2", "2,400,000" or "2.400.000" into a float.
+
+    When both separators appear the last one is the decimal mark; a lone
+    separator followed by exactly three digits is a thousands separator
+    unless a magnitude suffix follows ("1.200k" is unusual, "1.2M" common).
+    """
+    text = text.rstrip(".,")
+    if not text:
+        return None
+    if "," in text and "." in text:
+        decimal = "," if text.rfind(",") > text.rfind(".") else "."
+        thousands = "." if decimal == "," else ","
+        text = text.replace(thousands, "").replace(decimal, ".")
+    elif "," in text or "." in text:
+        sep = "," if "," in text else "."
+        groups = text.split(sep)
+        is_thousands = len(groups) > 2 or (
+            len(groups[-1]) == 3 and not has_suffix
+        )
+        text = text.replace(sep, "") if is_thousands else text.replace(sep, ".")
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _value(match: re.Match) -> tuple[Optional[float], bool]:
+    """Return (numeric value, is_range) for a match with num/num2/suf groups."""
+    groups = match.groupdict()
+    has_suffix = bool(groups.get("suf"))
+    low = parse_number(groups["num"], has_suffix)
+    if low is None:
+        return None, False
+    is_range = bool(groups.get("num2"))
+    if is_range:
+        high = parse_number(groups["num2"], has_suffix)
+        if high is None:
+            return None, False
+        low = (low + high) / 2
+    if has_suffix:
+        low *= _MULTIPLIERS[groups["suf"].lower().rstrip(".")]
+    return low, is_range
+
+
+def _has_currency(match: re.Match) -> bool:
+    groups = match.groupdict()
+    return bool(groups.get("cur1") or groups.get("cur2"))
+
+
+class _Rule:
+    """One pattern for one profile field."""
+
+    def __init__(
+        self,
+        field: str,
+        pattern: str,
+        confidence: float,
+        convert: Callable[[float, re.Match], Optional[float]] = lambda v, m: v,
+        require_unit: bool = False,
+    ):
+        self.field = field
+        self.regex = re.compile(pattern, re.IGNORECASE)
+        self.confidence = confidence
+        self.convert = convert
+        # Money rules need a currency or a k/M suffix to rule out bare numbers
+        self.require_unit = require_unit
+
+
+def _between(low: float, high: float) -> Callable[[float, re.Match], Optional[float]]:
+    return lambda v, m: v if low <= v <= high else None
+
+
+_percent = _between(0, 1000)
+
+
+def _count(v: float, m: re.Match) -> Optional[int]:
+    return int(v) if v >= 1 and v == int(v) else None
+
+
+def _year(v: float, m: re.Match) -> Optional[int]:
+    return int(v) if 1900 <= v <= 2100 else None
+
+
+def _per_period(v: float, m: re.Match) -> float:
+    return v / 12 if m.groupdict().get("year") else v
+
+
+def _min_amount(v: float, m: re.Match) -> Optional[float]:
+    # "EUR 3" without suffix is almost never a company-level figure
+    return v if v >= 1000 else None
+
+
+_RULES: list[_Rule] = [
+    # NDR
+    _Rule("ndr_percent", rf"\b{_NDR}{_GAP}{PERCENT}", 0.9, _between(30, 300)),
+    _Rule("ndr_percent", rf"{PERCENT}{_BACK_GAP}\b{_NDR}", 0.9, _between(30, 300)),
+    # Gross margin
+    _Rule("gross_margin_percent", rf"\b{_GROSS_MARGIN}{_GAP}{PERCENT}", 0.9, _between(0, 100)),
+    _Rule("gross_margin_percent", rf"{PERCENT}{_BACK_GAP}\b{_GROSS_MARGIN}", 0.9, _between(0, 100)),
+    # Growth
+    _Rule("growth_rate_yoy", rf"\b{_GROWTH}{_GAP}{PERCENT}", 0.8, _percent),
+    _Rule("growth_rate_yoy", rf"{PERCENT}{_BACK_GAP}\b{_YOY}", 0.85, _percent),
+    _Rule(
+        "growth_rate_yoy", rf"{MULTIPLE}\s+{_YOY}", 0.75,
+        lambda v, m: (v - 1) * 100 if v > 1 else None,
+    ),
+    _Rule(
+        "growth_rate_yoy", rf"\b(?:grew|growing){_GAP}{MULTIPLE}", 0.7,
+        lambda v, m: (v - 1) * 100 if v > 1 else None,
+    ),
+    # Revenue (revenue_type is set from the rule's keyword, see _REVENUE_TYPES)
+    _Rule("revenue_eur", rf"\b{_ARR}{_GAP}{AMOUNT}", 0.9, _min_amount, require_unit=True),
+    _Rule("revenue_eur", rf"{AMOUNT}{_BACK_GAP}\b{_ARR}\b", 0.9, _min_amount, require_unit=True),
+    _Rule(
+        "revenue_eur", rf"\b{_MRR}{_GAP}{AMOUNT}", 0.7,
+        lambda v, m: v * 12 if v >= 100 else None, require_unit=True,
+    ),
+    _Rule("revenue_eur", rf"\b{_REVENUE}{_GAP}{AMOUNT}(?:{_PER_YEAR})?", 0.75, _min_amount, require_unit=True),
+    _Rule("revenue_eur", rf"{AMOUNT}{_BACK_GAP}\b(?:in\s+)?{_REVENUE}\b", 0.75, _min_amount, require_unit=True),
+    # Burn
+    _Rule(
+        "burn_rate_monthly_eur",
+        rf"\b{_BURN}{_GAP}{AMOUNT}(?:(?P<month>{_PER_MONTH})|(?P<year>{_PER_YEAR}))",
+        0.9, lambda v, m: _per_period(v, m) if v >= 1000 else None, require_unit=True,
+    ),
+    _Rule("burn_rate_monthly_eur", rf"\b{_BURN}{_GAP}{AMOUNT}", 0.7, _min_amount, require_unit=True),
+    # Customers
+    _Rule("customer_count", rf"\b{COUNT}\s+{_CUSTOMERS}\b", 0.85, _count),
+    _Rule("customer_count", rf"\b{_CUSTOMERS}\s*:\s*{COUNT}", 0.8, _count),
+    # Employees
+    _Rule("employee_count", rf"\b{COUNT}\s+{_EMPLOYEES}\b", 0.85, _count),
+    _Rule("employee_count", rf"\b(?:team\s+(?:of|size)|headcount)\s*(?:of|:)?\s*~?\s*{COUNT}", 0.8, _count),
+    # Funding
+    _Rule("target_raise_eur", rf"\b{_RAISING}{_GAP}{AMOUNT}", 0.85, _min_amount, require_unit=True),
+    _Rule("funding_raised_eur", rf"\b{_RAISED}{_GAP}{AMOUNT}", 0.8, _min_amount, require_unit=True),
+    # Founding year
+    _Rule("founded_year", rf"\b{_FOUNDED}\s+{YEAR}", 0.9, _year),
+]
+
+# Revenue type implied by the keyword a revenue rule matched
+_REVENUE_TYPES = [
+    (re.compile(rf"\b{_ARR}|\b{_MRR}", re.IGNORECASE), "ARR"),
+    (re.compile(rf"\b{_REVENUE}", re.IGNORECASE), "revenue"),
+]
+
+
+def _context_confidence(
+    text: str, start: int, end: int, confidence: float
+) -> float:
+    """Adjust confidence for cues around the match on the same line."""
+    before = _before(text, start)
+    after = text[end:end + AFTER_CONTEXT_CHARS]
+    if _MARKET_BEFORE_RE.search(before) or _MARKET_AFTER_RE.search(after):
+        return 0.0
+    if _FORWARD_RE.search(before):
+        return confidence * FORWARD_LOOKING_PENALTY
+    return confidence
+
+
+def _before(text: str, start: int) -> str:
+    line_start = text.rfind("\n", 0, start) + 1
+    return text[max(line_start, start - CONTEXT_CHARS):start]
+
+
+def _is_negated(text: str, match: re.Match) -> bool:
+    # The "not" can precede the match or sit inside it ("NOT EUR 2M")
+    return bool(
+        _NEGATION_RE.search(_before(text, match.start()))
+        or re.search(r"\bnot\b", match.group(), re.IGNORECASE)
+    )
+
+
+def _iter_facts(text: str) -> Iterator[tuple[ExtractedFact, bool]]:
+    """Yield (fact, negated) for every match; negated facts keep the
+    rule's confidence so their value can be rejected elsewhere."""
+    for rule in _RULES:
+        for match in rule.regex.finditer(text):
+            if rule.require_unit and not (
+                _has_currency(match) or match.groupdict().get("suf")
+            ):
+                continue
+            raw, is_range = _value(match)
+            if raw is None:
+                continue
+            value = rule.convert(raw, match)
+            if value is None:
+                continue
+            confidence = rule.confidence
+            if rule.require_unit and not _has_currency(match):
+                confidence -= 0.2
+            if is_range:
+                confidence -= RANGE_PENALTY
+            negated = _is_negated(text, match)
+            if not negated:
+                confidence = _context_confidence(
+                    text, match.start(), match.end(), confidence
+                )
+                if confidence <= 0:
+                    continue
+            yield ExtractedFact(
+                field=rule.field,
+                value=round(value, 2) if isinstance(value, float) else value,
+                confidence=round(confidence, 2),
+                start=match.start(),
+                end=match.end(),
+                snippet=match.group().strip(),
+            ), negated
+
+
+def extract_metrics(text: str) -> dict[str, ExtractedFact]:
+    """Return the most confident fact per profile field (earliest on ties).
+
+    Values negated anywhere in the text are dropped for their field. If
+    the facts at or above MIN_CONFIDENCE for a field disagree, the one
+    returned gets CONFLICT_CONFIDENCE so it is not applied.
+    """
+    facts: list[ExtractedFact] = []
+    negated: dict[str, set] = {}
+    for fact, is_negated in _iter_facts(text):
+        if is_negated:
+            negated.setdefault(fact.field, set()).add(fact.value)
+        else:
+            facts.append(fact)
+
+    # Most confident first (earliest on ties); a match overlapping an
+    # accepted one for the same field reuses its keyword ("130% NDR and a
+    # 78% margin") and is not a statement of its own
+    facts.sort(key=lambda f: (-f.confidence, f.start))
+    accepted: dict[str, list[ExtractedFact]] = {}
+    for fact in facts:
+        if fact.value in negated.get(fact.field, ()):
+            continue
+        same_field = accepted.setdefault(fact.field, [])
+        if any(f.start < fact.end and fact.start < f.end for f in same_field):
+            continue
+        same_field.append(fact)
+
+    best = {field: kept[0] for field, kept in accepted.items() if kept}
+    claims = {
+        field: {f.value for f in kept if f.confidence >= MIN_CONFIDENCE}
+        for field, kept in accepted.items()
+    }
+    for field, values in claims.items():
+        if len(values) > 1:
+            best[field] = best[field].model_copy(
+                update={"confidence": CONFLICT_CONFIDENCE}
+            )
+    return best
+
+
+def apply_extracted_metrics(
+    profile: CompanyProfile,
+    facts: dict[str, ExtractedFact],
+    min_confidence: float = MIN_CONFIDENCE,
+) -> tuple[CompanyProfile, list[ExtractedFact]]:
+    """Fill empty profile fields from facts; return the profile and what was used.
+
+    Fields that already hold a value (non-zero, non-empty) are never
+    overwritten.
+    """
+    updates: dict = {}
+    applied = []
+    for field, fact in facts.items():
+        if fact.confidence < min_confidence:
+            continue
+        current = getattr(profile, field)
+        if current not in (None, "", 0):
+            continue
+        updates[field] = fact.value
+        applied.append(fact)
+        if field == "revenue_eur":
+            for regex, revenue_type in _REVENUE_TYPES:
+                if regex.search(fact.snippet):
+                    updates["revenue_type"] = revenue_type
+                    break
+    return profile.model_copy(update=updates), applied
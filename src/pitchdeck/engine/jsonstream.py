@@ -0,0 +1,254 @@
+"""Locating and parsing the JSON objects in Claude's output text.
+
+The deck response is one JSON object whose "slides" array takes most of
+the generation time. ArrayItemStream scans each delta once, tracking
+string/escape state and nesting depth, and hands every element of the
+watched array to a callback as soon as its closing brace arrives, so
+callers can use early slides while later ones are still being written.
+
+extract_json_object() finds the object in a complete response: the JSON
+decoder parses from each candidate "{", and a string-aware brace matcher
+skips spans that fail, so prose with braces before or after the JSON is
+ignored, the work stays linear, and failures name exact offsets.
+"""
+
+import json
+import re
+from typing import Callable, Iterator, Optional
+
+# Outside strings only braces matter; a whole JSON string (escapes
+# included) is skipped in one match, and a lone quote is one never closed
+_OBJECT_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]|"', re.DOTALL)
+_DECODER = json.JSONDecoder()
+
+
+class JSONExtractError(ValueError):
+    """No JSON object could be extracted from the text.
+
+    start and end delimit the offending object in the text (None when
+    there is no "{" at all); position is the offset of the error itself.
+    For an object that is never closed, unclosed holds the offsets of
+    every "{" still open when the text ends.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        position: Optional[int] = None,
+        unclosed: tuple[int, ...] = (),
+    ):
+        super().__init__(message)
+        self.start = start
+        self.end = end
+        self.position = position
+        self.unclosed = unclosed
+
+
+def iter_json_object_spans(text: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) of each balanced top-level {...} in text.
+
+    A single left-to-right pass: braces inside JSON strings (including
+    escaped quotes) do not count, and text between objects is skipped
+    without interpretation. Raises JSONExtractError if the text ends
+    inside an object.
+    """
+    pos = 0
+    while (start := text.find("{", pos)) >= 0:
+        pos = _object_end(text, start)
+        yield start, pos
+
+
+def _object_end(text: str, start: int) -> int:
+    """Offset just past the "}" that balances the "{" at start."""
+    open_braces = []
+    i = start
+    while True:
+        match = _OBJECT_TOKEN.search(text, i)
+        if match is None or match.group() == '"':
+            raise JSONExtractError(
+                f"JSON object starting at offset {start} is never closed "
+                f"(text ends at offset {len(text)}"
+                f"{', inside a string' if match else ''})",
+                start, len(text), len(text), tuple(open_braces),
+            )
+        i = match.end()
+        token = match.group()
+        if token == "{":
+            open_braces.append(match.start())
+        elif token == "}":
+            open_braces.pop()
+            if not open_braces:
+                return i
+
+
+def _decode_at(text: str, start: int) -> tuple[dict, int]:
+    """Decode the object whose "{" is at start; return it and its end.
+
+    The decoder does the common case in one C-speed pass; only when it
+    fails does the brace matcher walk the span, to report the failure
+    and let the caller resume after it, so no text is scanned more than
+    twice.
+    """
+    try:
+        return _DECODER.raw_decode(text, start)
+    except json.JSONDecodeError as e:
+        end = _object_end(text, start)  # raises if never closed
+        raise JSONExtractError(
+            f"invalid JSON in the object at offsets {start}-{end}: "
+            f"{e.msg} at offset {e.pos}",
+            start, end, e.pos,
+        ) from e
+
+
+def extract_json_object(text: str) -> dict:
+    """Return the first complete top-level JSON object in text.
+
+    A brace-delimited span that is not valid JSON (a "{placeholder}" in
+    a preamble) is passed over for the next one, as is a "{" that is
+    never closed ("Fill {placeholder then {...}"). Raises JSONExtractError
+    for the first failure when no object parses.
+    """
+    first_error: Optional[JSONExtractError] = None
+    # Braces a failed scan left open; scanning from one of them would
+    # reach the same tokens and fail again, so each is tried only once
+    unclosed: set[int] = set()
+    pos = 0
+    while (start := text.find("{", pos)) >= 0:
+        if start in unclosed:
+            pos = start + 1
+            continue
+        try:
+            return _decode_at(text, start)[0]
+        except JSONExtractError as e:
+            first_error = first_error or e
+            if e.unclosed:
+                unclosed.update(e.unclosed)
+                pos = start + 1
+            else:
+                pos = e.end
+    if first_error is not None:
+        raise first_error
+    raise JSONExtractError("no JSON object found")
+
+
+def extract_json_objects(text: str) -> list[dict]:
+    """Return every top-level JSON object in text, in order.
+
+    Unlike extract_json_object(), every brace-delimited span must parse;
+    the first one that does not raises JSONExtractError.
+    """
+    objects = []
+    pos = 0
+    while (start := text.find("{", pos)) >= 0:
+        value, pos = _decode_at(text, start)
+        objects.append(value)
+    return objects
+
+
+class ArrayItemStream:
+    """Emit the objects of a top-level array field as they complete.
+
+    Text before the first "{" (a preamble or a Markdown fence) is
+    skipped; scanning stops when the root object closes. Items that are
+    not valid JSON are skipped — the caller's final parse of the full
+    text reports the error.
+    """
+
+    def __init__(self, key: str, on_item: Callable[[dict], None]):
+        self.key = key
+        self.on_item = on_item
+        self.items_emitted = 0
+        self.items: list[dict] = []
+        self.done = False
+        # Offsets into the whole fed text: the root "{" and the end of the
+        # last emitted item, so a cut-off response can be closed after it
+        self.root_start: Optional[int] = None
+        self.last_item_end: Optional[int] = None
+        self._offset = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._array_depth: Optional[int] = None  # depth inside the watched array
+        self._last_string: list[str] = []
+        self._current_key: Optional[str] = None
+        self._string_start: Optional[int] = None  # within the current chunk
+        self._item_parts: list[str] = []
+        self._item_start: Optional[int] = None  # within the current chunk
+
+    def feed(self, text: str) -> None:
+        """Scan the next delta of the streamed text."""
+        if self.done:
+            return
+        if self._item_start is not None:
+            self._item_start = 0
+        if self._string_start is not None:
+            self._string_start = 0
+
+        for i, ch in enumerate(text):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._string_start is not None:
+                        self._last_string.append(text[self._string_start:i])
+                        self._string_start = None
+                continue
+
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                    self.root_start = self._offset + i
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._last_string = []
+                    self._string_start = i + 1
+            elif ch == ":" and self._depth == 1:
+                self._current_key = "".join(self._last_string)
+            elif ch == "," and self._depth == 1:
+                self._current_key = None
+            elif ch in "{[":
+                if ch == "[" and self._depth == 1 and self._current_key == self.key:
+                    self._array_depth = 2
+                elif ch == "{" and self._depth == self._array_depth:
+                    self._item_parts = []
+                    self._item_start = i
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == self._array_depth and ch == "}":
+                    self._item_parts.append(text[self._item_start:i + 1])
+                    self._item_start = None
+                    if self._emit("".join(self._item_parts)):
+                        self.last_item_end = self._offset + i + 1
+                elif self._array_depth is not None and self._depth < self._array_depth:
+                    self._array_depth = None
+                if self._depth == 0:
+                    self.done = True
+                    return
+
+        # Carry partial strings/items over into the next delta
+        if self._string_start is not None:
+            self._last_string.append(text[self._string_start:])
+        if self._item_start is not None:
+            self._item_parts.append(text[self._item_start:])
+        self._offset += len(text)
+
+    def _emit(self, item_text: str) -> bool:
+        try:
+            item = json.loads(item_text)
+        except json.JSONDecodeError:
+            return False
+        if not isinstance(item, dict):
+            return False
+        self.items_emitted += 1
+        self.items.append(item)
+        self.on_item(item)
+        return True
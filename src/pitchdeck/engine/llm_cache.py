@@ -0,0 +1,96 @@
+"""Disk cache of Claude responses keyed by the full request fingerprint.
+
+Re-running generate or validate on unchanged inputs (e.g. to tweak the
+renderer) would otherwise re-bill the call and wait for it again. The key
+covers everything that shapes the response — model, temperature, system
+blocks, messages and max_tokens — so any prompt change is a miss. Entries
+expire after a TTL and the directory is size-capped with LRU eviction.
+"""
+
+import json
+import time
+from typing import Optional
+
+from pydantic import ValidationError
+
+from pitchdeck.cache import DiskCache, get_cache_dir, make_key
+from pitchdeck.models import LLMCompletion, LLMUsage
+
+LLM_CACHE_MAX_BYTES = 64 * 1024 * 1024
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Bump when the stored format changes
+LLM_CACHE_REVISION = "1"
+
+
+def get_llm_cache() -> DiskCache:
+    """Return the on-disk cache of Claude responses."""
+    return DiskCache(get_cache_dir("llm"), LLM_CACHE_MAX_BYTES, suffix=".json")
+
+
+def request_key(
+    model: str,
+    temperature: Optional[float],
+    system: list[dict],
+    messages: list[dict],
+    max_tokens: int,
+) -> str:
+    """Fingerprint of a Messages API request."""
+    request = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "system": system,
+            "messages": messages,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return make_key("llm", LLM_CACHE_REVISION, request)
+
+
+def lookup(
+    key: str, ttl_seconds: float = LLM_CACHE_TTL_SECONDS
+) -> Optional[LLMCompletion]:
+    """Return the cached completion for key, or None if missing or expired."""
+    cached = get_llm_cache().get(key)
+    if cached is None:
+        return None
+    try:
+        completion = LLMCompletion.model_validate_json(cached)
+    except ValidationError:
+        return None  # corrupt or outdated entry — treat as a miss
+    if time.time() - completion.created_at > ttl_seconds:
+        return None
+    return completion
+
+
+def store(key: str, completion: LLMCompletion) -> None:
+    """Cache a completion; failures to write are ignored."""
+    try:
+        get_llm_cache().put(key, completion.model_dump_json())
+    except OSError:
+        pass  # a read-only or full cache dir must never fail the run
+
+
+def usage_from(usage) -> LLMUsage:
+    """Build LLMUsage from an API usage object, tolerating missing fields."""
+    values = {}
+    for field in LLMUsage.model_fields:
+        value = getattr(usage, field, None)
+        if isinstance(value, int):
+            values[field] = value
+    return LLMUsage(**values)
+
+
+def completion_from_message(model: str, message) -> LLMCompletion:
+    """Build a cacheable LLMCompletion from a (non-streamed) API Message."""
+    stop_reason = getattr(message, "stop_reason", None)
+    return LLMCompletion(
+        model=model,
+        text=message.content[0].text,
+        stop_reason=stop_reason if isinstance(stop_reason, str) else None,
+        usage=usage_from(getattr(message, "usage", None)),
+        created_at=time.time(),
+    )
@@ -1,23 +1,48 @@
 """Claude API-powered narrative engine for pitch deck generation."""
 
+import asyncio
 import json
 import os
-import re
-from typing import List
+import time
+from typing import Callable, List, Optional
 
 from anthropic import (
-    Anthropic,
+    AsyncAnthropic,
     APIStatusError,
     APITimeoutError,
     AuthenticationError,
     RateLimitError,
 )
+from pydantic import ValidationError
 
-from pitchdeck.engine.slides import get_narrative_arc
+from pitchdeck.engine.compaction import (
+    combine_documents,
+    compact_documents,
+    split_documents,
+)
+from pitchdeck.engine import clients, llm_cache, ratelimit, telemetry
+from pitchdeck.engine.backends import LLMBackend, backend_model
+from pitchdeck.engine.jsonstream import (
+    ArrayItemStream,
+    JSONExtractError,
+    extract_json_object,
+)
+from pitchdeck.engine.slides import get_narrative_arc, group_templates_by_arc
+from pitchdeck.engine.tokens import (
+    check_input_budget,
+    default_input_budget,
+    estimate_request,
+    estimate_tokens,
+)
 from pitchdeck.models import (
+    CallMetrics,
     CompanyProfile,
+    DocumentSection,
+    LLMCompletion,
+    LLMUsage,
     PitchDeck,
     PitchDeckError,
+    PromptEstimate,
     SlideContent,
     SlideTemplate,
     VCProfile,
@@ -41,56 +66,262 @@ RULES:
 - Transitions between slides must be explicit narrative connectors"""
 
 
-def generate_deck(
+# Output token limit for the generation call
+MODEL = "claude-sonnet-4-6"
+MAX_OUTPUT_TOKENS = 16384
+
+# Grouped generation: concurrent requests, and output caps per group and
+# for the stitching pass that joins them
+DEFAULT_GROUP_CONCURRENCY = 3
+GROUP_MAX_OUTPUT_TOKENS = 8192
+STITCH_MAX_OUTPUT_TOKENS = 2048
+
+COMPACTION_ATTEMPTS = 3
+
+# Follow-up requests for the rest of a response cut off at max_tokens
+MAX_CONTINUATIONS = 2
+
+# Labels for the system blocks, in order, used in preflight reports
+SYSTEM_BLOCK_LABELS = ["instructions", "company + VC context"]
+
+
+def build_generation_request(
     company: CompanyProfile,
     vc_profile: VCProfile,
     slide_templates: list[SlideTemplate],
-) -> PitchDeck:
-    """Generate a complete pitch deck using Claude API."""
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise PitchDeckError(
-            "ANTHROPIC_API_KEY environment variable not set. "
-            "Get your key at https://console.anthropic.com/"
-        )
-
-    client = Anthropic()
-
-    vc_context = build_vc_context(vc_profile)
+) -> tuple[list[dict], list[dict]]:
+    """Build the (system, messages) pair sent to Claude for deck generation."""
     slide_instructions = _build_slide_instructions(slide_templates)
     narrative_arc = get_narrative_arc()
+    system_messages = _build_system_blocks(company, vc_profile)
+
+    user_prompt = f"""Generate a complete {len(slide_templates)}-slide pitch deck for \
+{company.product_name or company.name} targeting {vc_profile.name}.
+
+NARRATIVE ARC:
+{narrative_arc}
+
+SLIDE STRUCTURE:
+{slide_instructions}
+
+OUTPUT FORMAT:
+Return a JSON object with this exact structure:
+{{
+  "narrative_arc": "Brief summary of the overall story arc",
+  "gaps_identified": ["list of missing data points that would strengthen the deck"],
+  "slides": [
+    {{
+      "slide_number": 1,
+      "slide_type": "cover",
+      "title": "Concise slide title (5-8 words)",
+      "headline": "Key takeaway (one sentence)",
+      "bullets": ["bullet 1", "bullet 2"],
+      "metrics": ["metric 1"],
+      "speaker_notes": "2-3 sentences of what to SAY",
+      "transition_to_next": "One sentence connecting to next slide",
+      "vc_alignment_notes": ["How this maps to {vc_profile.name}'s thesis"]
+    }}
+  ]
+}}
+
+Generate ALL {len(slide_templates)} slides in order. Return ONLY the JSON object, no other text."""
+
+    return system_messages, [{"role": "user", "content": user_prompt}]
+
 
-    system_messages = [
+def _build_system_blocks(
+    company: CompanyProfile, vc_profile: VCProfile
+) -> list[dict]:
+    """System blocks shared by every generation request for one deck.
+
+    The second block ends in a cache breakpoint, so requests for the same
+    company and VC (slide groups, the stitching pass) reuse the prefix.
+    """
+    vc_context = build_vc_context(vc_profile)
+    # The document text is already in <company_document>; don't send it twice
+    profile_json = company.model_dump_json(
+        indent=2, exclude={"raw_document_text"}
+    )
+    return [
         {"type": "text", "text": SYSTEM_PROMPT},
         {
             "type": "text",
             "text": (
                 f"<company_document>\n{company.raw_document_text}\n</company_document>\n\n"
-                f"<company_profile>\n{company.model_dump_json(indent=2)}\n</company_profile>\n\n"
+                f"<company_profile>\n{profile_json}\n</company_profile>\n\n"
                 f"<vc_profile>\n{vc_context}\n</vc_profile>"
             ),
             "cache_control": {"type": "ephemeral"},
         },
     ]
 
-    user_prompt = f"""Generate a complete {len(slide_templates)}-slide pitch deck for \
-{company.product_name or company.name} targeting {vc_profile.name}.
+
+def build_group_request(
+    company: CompanyProfile,
+    vc_profile: VCProfile,
+    slide_templates: list[SlideTemplate],
+    stage: str,
+    group: list[tuple[int, SlideTemplate]],
+) -> tuple[list[dict], list[dict]]:
+    """Build the request for one narrative arc stage of the deck.
+
+    The system blocks are the same as for the whole deck; the user prompt
+    shows the full outline for context but asks only for this group's
+    slides, numbered by their position in the deck.
+    """
+    numbers = [number for number, _ in group]
+    outline = "\n".join(
+        f"{i}. {t.slide_type} — {t.purpose}"
+        for i, t in enumerate(slide_templates, 1)
+    )
+    slide_instructions = "\n".join(
+        _build_slide_instructions([template], start=number)
+        for number, template in group
+    )
+    stage_label = stage.replace("-", " ").upper()
+
+    user_prompt = f"""You are writing one section of a {len(slide_templates)}-slide pitch deck for \
+{company.product_name or company.name} targeting {vc_profile.name}. The other \
+sections are being written in parallel.
 
 NARRATIVE ARC:
-{narrative_arc}
+{get_narrative_arc()}
 
-SLIDE STRUCTURE:
-{slide_instructions}
+FULL DECK OUTLINE:
+{outline}
 
+YOUR SECTION: {stage_label} (slides {", ".join(map(str, numbers))})
+{slide_instructions}
 OUTPUT FORMAT:
 Return a JSON object with this exact structure:
+{{
+  "gaps_identified": ["missing data points that would strengthen these slides"],
+  "slides": [
+    {{
+      "slide_number": {numbers[0]},
+      "slide_type": "{group[0][1].slide_type}",
+      "title": "Concise slide title (5-8 words)",
+      "headline": "Key takeaway (one sentence)",
+      "bullets": ["bullet 1", "bullet 2"],
+      "metrics": ["metric 1"],
+      "speaker_notes": "2-3 sentences of what to SAY",
+      "transition_to_next": "One sentence connecting to next slide",
+      "vc_alignment_notes": ["How this maps to {vc_profile.name}'s thesis"]
+    }}
+  ]
+}}
+
+Generate ONLY slides {", ".join(map(str, numbers))}, in order, with the slide numbers above. \
+Leave transition_to_next empty on slide {numbers[-1]}; it is written when the sections \
+are joined. Return ONLY the JSON object, no other text."""
+
+    return _build_system_blocks(company, vc_profile), [
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def build_stitch_request(
+    company: CompanyProfile,
+    vc_profile: VCProfile,
+    slides: list[SlideContent],
+    boundaries: list[int],
+) -> tuple[list[dict], list[dict]]:
+    """Build the short final request that joins separately written groups.
+
+    Asks for the deck's narrative_arc summary and a transition_to_next
+    for each slide number in boundaries (the last slide of every group
+    but the final one).
+    """
+    outline = json.dumps(
+        [
+            {
+                "slide_number": s.slide_number,
+                "slide_type": s.slide_type,
+                "title": s.title,
+                "headline": s.headline,
+                "transition_to_next": s.transition_to_next,
+            }
+            for s in slides
+        ],
+        indent=2,
+        ensure_ascii=False,
+    )
+    user_prompt = f"""These slides of a pitch deck for {company.product_name or company.name} \
+targeting {vc_profile.name} were written in separate sections.
+
+NARRATIVE ARC:
+{get_narrative_arc()}
+
+<slides>
+{outline}
+</slides>
+
+Write one transition_to_next sentence for each of slides {", ".join(map(str, boundaries))} \
+(the last slide of a section), leading into the slide after it, and a brief summary of \
+the deck's overall story arc.
+
+OUTPUT FORMAT (return ONLY this JSON):
 {{
   "narrative_arc": "Brief summary of the overall story arc",
-  "gaps_identified": ["list of missing data points that would strengthen the deck"],
+  "transitions": [
+    {{"slide_number": {boundaries[0] if boundaries else 1}, "transition_to_next": "One sentence"}}
+  ]
+}}"""
+    return _build_system_blocks(company, vc_profile), [
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def build_continuation_request(
+    company: CompanyProfile,
+    vc_profile: VCProfile,
+    slide_templates: list[SlideTemplate],
+    written: list[dict],
+    remaining: list[tuple[int, SlideTemplate]],
+) -> tuple[list[dict], list[dict]]:
+    """Build the follow-up request for slides a cut-off response missed.
+
+    The system blocks are the same as for the first request, so the
+    cached prefix is reused; the prompt lists the slides already written
+    (number, type, title, headline) and asks only for the remaining ones.
+    """
+    numbers = [number for number, _ in remaining]
+    outline = json.dumps(
+        [
+            {key: slide.get(key) for key in (
+                "slide_number", "slide_type", "title", "headline"
+            )}
+            for slide in written
+        ],
+        indent=2,
+        ensure_ascii=False,
+    )
+    slide_instructions = "\n".join(
+        _build_slide_instructions([template], start=number)
+        for number, template in remaining
+    )
+
+    user_prompt = f"""You are finishing a {len(slide_templates)}-slide pitch deck for \
+{company.product_name or company.name} targeting {vc_profile.name}. The previous \
+response was cut off; these slides were already written:
+
+<written_slides>
+{outline}
+</written_slides>
+
+NARRATIVE ARC:
+{get_narrative_arc()}
+
+REMAINING SLIDES:
+{slide_instructions}
+OUTPUT FORMAT:
+Return a JSON object with this exact structure:
+{{
+  "gaps_identified": ["missing data points that would strengthen these slides"],
   "slides": [
     {{
-      "slide_number": 1,
-      "slide_type": "cover",
+      "slide_number": {numbers[0]},
+      "slide_type": "{remaining[0][1].slide_type}",
       "title": "Concise slide title (5-8 words)",
       "headline": "Key takeaway (one sentence)",
       "bullets": ["bullet 1", "bullet 2"],
@@ -102,14 +333,480 @@ Return a JSON object with this exact structure:
   ]
 }}
 
-Generate ALL {len(slide_templates)} slides in order. Return ONLY the JSON object, no other text."""
+Generate ONLY slides {", ".join(map(str, numbers))}, in order, with the slide numbers \
+above, continuing the story from the slides already written. Return ONLY the JSON \
+object, no other text."""
+
+    return _build_system_blocks(company, vc_profile), [
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def estimate_generation_prompt(
+    company: CompanyProfile,
+    vc_profile: VCProfile,
+    slide_templates: list[SlideTemplate],
+) -> PromptEstimate:
+    """Estimate the input tokens of the generation request, per block."""
+    system, messages = build_generation_request(company, vc_profile, slide_templates)
+    return estimate_request(system, messages, SYSTEM_BLOCK_LABELS)
+
+
+def preflight_generation(
+    company: CompanyProfile,
+    vc_profile: VCProfile,
+    slide_templates: list[SlideTemplate],
+    max_input_tokens: Optional[int] = None,
+    auto_compact: bool = True,
+    documents: Optional[list[list[DocumentSection]]] = None,
+) -> tuple[CompanyProfile, PromptEstimate]:
+    """Size the generation prompt locally and fit it to max_input_tokens.
+
+    When the estimate is over budget and auto_compact is set, the least
+    relevant document sections are dropped until it fits. documents are
+    the parsed sections company.raw_document_text was joined from (see
+    combine_documents); without them the text is split back into
+    sections. Raises PromptTooLargeError when it still does not fit.
+    """
+    if max_input_tokens is None:
+        max_input_tokens = default_input_budget(MAX_OUTPUT_TOKENS)
+    estimate = estimate_generation_prompt(company, vc_profile, slide_templates)
+    # Section joins and document headers make token counts slightly
+    # non-additive, so a first pass can land a few tokens over
+    for _ in range(COMPACTION_ATTEMPTS):
+        overflow = estimate.total_tokens - max_input_tokens
+        if overflow <= 0 or not auto_compact or not company.raw_document_text:
+            break
+        if documents is None:
+            documents = split_documents(company.raw_document_text)
+        document_tokens = sum(
+            estimate_tokens(s.text) for doc in documents for s in doc
+        )
+        if document_tokens <= overflow:
+            break
+        documents, _ = compact_documents(
+            documents, slide_templates, vc_profile, document_tokens - overflow
+        )
+        company = company.model_copy(
+            update={"raw_document_text": combine_documents(documents)}
+        )
+        estimate = estimate_generation_prompt(company, vc_profile, slide_templates)
+    check_input_budget(estimate, max_input_tokens)
+    return company, estimate
+
+
+def generate_deck(
+    company: CompanyProfile,
+    vc_profile: VCProfile,
+    slide_templates: list[SlideTemplate],
+    max_input_tokens: Optional[int] = None,
+    auto_compact: bool = True,
+    on_preflight: Optional[Callable[[PromptEstimate], None]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    on_slide: Optional[Callable[[SlideContent], None]] = None,
+    parallel_groups: int = 0,
+    use_llm_cache: bool = True,
+    on_call: Optional[Callable[[CallMetrics], None]] = None,
+    backend: Optional[LLMBackend] = None,
+    documents: Optional[list[list[DocumentSection]]] = None,
+) -> PitchDeck:
+    """Generate a complete pitch deck using Claude API.
+
+    Blocking wrapper around generate_deck_async, or, when parallel_groups
+    is set, generate_deck_grouped_async with that many concurrent
+    requests. Call those directly from code that already runs an event
+    loop. backend selects where requests go (default: the Anthropic API;
+    see pitchdeck.engine.backends). documents, the parsed sections behind
+    company.raw_document_text, let preflight compaction skip re-splitting.
+    """
+    options = dict(
+        max_input_tokens=max_input_tokens,
+        auto_compact=auto_compact,
+        on_preflight=on_preflight,
+        on_progress=on_progress,
+        on_slide=on_slide,
+        use_llm_cache=use_llm_cache,
+        on_call=on_call,
+        backend=backend,
+        documents=documents,
+    )
+    if parallel_groups > 0:
+        generation = generate_deck_grouped_async(
+            company,
+            vc_profile,
+            slide_templates,
+            max_concurrency=parallel_groups,
+            **options,
+        )
+    else:
+        generation = generate_deck_async(
+            company, vc_profile, slide_templates, **options
+        )
+    return asyncio.run(_run_and_close_clients(generation))
+
+
+async def _run_and_close_clients(generation):
+    # The shared async client is bound to this loop, which ends here
+    try:
+        return await generation
+    finally:
+        await clients.close_loop_clients()
+
+
+async def generate_deck_async(
+    company: CompanyProfile,
+    vc_profile: VCProfile,
+    slide_templates: list[SlideTemplate],
+    max_input_tokens: Optional[int] = None,
+    auto_compact: bool = True,
+    on_preflight: Optional[Callable[[PromptEstimate], None]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    on_slide: Optional[Callable[[SlideContent], None]] = None,
+    use_llm_cache: bool = True,
+    on_call: Optional[Callable[[CallMetrics], None]] = None,
+    backend: Optional[LLMBackend] = None,
+    documents: Optional[list[list[DocumentSection]]] = None,
+) -> PitchDeck:
+    """Generate a complete pitch deck, streaming the response.
+
+    The prompt is sized locally before sending (see preflight_generation);
+    on_preflight, if given, receives the final estimate. While the
+    response streams in, each slide is passed to on_slide as soon as it
+    is complete, and on_progress is called as (slides received, slides
+    expected). With use_llm_cache, an identical earlier request is
+    answered from the LLM response cache. on_call receives the usage and
+    timing of every Claude call.
+
+    If the response hits the output token limit, the slides that did
+    arrive are kept and the rest are requested in a continuation call
+    with the same cached prefix (see _continue_truncated).
+    """
+    _require_api_key(backend)
+    company, estimate = preflight_generation(
+        company, vc_profile, slide_templates, max_input_tokens, auto_compact,
+        documents,
+    )
+    if on_preflight is not None:
+        on_preflight(estimate)
+
+    client = _async_client(backend)
+    system_messages, messages = build_generation_request(
+        company, vc_profile, slide_templates
+    )
+    emitter = _SlideEmitter(len(slide_templates), on_progress, on_slide)
+    parser = emitter.parser(first_number=1)
+    completion = await _stream_completion(
+        client, system_messages, messages, MAX_OUTPUT_TOKENS,
+        on_text=parser.feed,
+        use_cache=use_llm_cache,
+        on_call=on_call,
+        backend=backend,
+        cache_truncated=True,
+    )
+    if completion.stop_reason != "max_tokens":
+        return _parse_deck_text(completion.text, company, vc_profile)
+
+    data = await _continue_truncated(
+        client, company, vc_profile, slide_templates,
+        completion.text, parser, list(enumerate(slide_templates, 1)),
+        emitter, MAX_OUTPUT_TOKENS, "generate",
+        use_llm_cache, on_call, backend,
+    )
+    return _assemble_deck(
+        [
+            _slide_from_dict(slide_data, position)
+            for position, slide_data in enumerate(data["slides"], 1)
+        ],
+        company,
+        vc_profile,
+        narrative_arc=data.get("narrative_arc", ""),
+        gaps_identified=data.get("gaps_identified", []),
+    )
+
+
+async def generate_deck_grouped_async(
+    company: CompanyProfile,
+    vc_profile: VCProfile,
+    slide_templates: list[SlideTemplate],
+    max_concurrency: int = DEFAULT_GROUP_CONCURRENCY,
+    max_input_tokens: Optional[int] = None,
+    auto_compact: bool = True,
+    on_preflight: Optional[Callable[[PromptEstimate], None]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    on_slide: Optional[Callable[[SlideContent], None]] = None,
+    use_llm_cache: bool = True,
+    on_call: Optional[Callable[[CallMetrics], None]] = None,
+    backend: Optional[LLMBackend] = None,
+    documents: Optional[list[list[DocumentSection]]] = None,
+) -> PitchDeck:
+    """Generate the deck as concurrent narrative-arc groups, then stitch.
+
+    Templates are split into the arc stages of get_narrative_arc() (see
+    group_templates_by_arc) and each stage is generated as its own
+    streaming request, at most max_concurrency at a time. All requests
+    share the cached system prefix: the first group is sent alone until
+    its response starts, so the prefix is cached before the rest go out.
+    A short final request writes the transitions across group boundaries
+    and the deck's narrative_arc. Wall-clock time approaches that of the
+    slowest group.
+
+    The whole-deck prompt is sized as in generate_deck_async; each group
+    prompt is smaller.
+    """
+    _require_api_key(backend)
+    company, estimate = preflight_generation(
+        company, vc_profile, slide_templates, max_input_tokens, auto_compact,
+        documents,
+    )
+    if on_preflight is not None:
+        on_preflight(estimate)
+
+    groups = group_templates_by_arc(slide_templates)
+    client = _async_client(backend)
+    emitter = _SlideEmitter(len(slide_templates), on_progress, on_slide)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    prefix_cached = asyncio.Event()
+
+    async def _generate_group(index: int, stage: str, group) -> dict:
+        if index > 0:
+            await prefix_cached.wait()
+        async with semaphore:
+            system_messages, messages = build_group_request(
+                company, vc_profile, slide_templates, stage, group
+            )
+            parser = emitter.parser(first_number=group[0][0])
+            try:
+                completion = await _stream_completion(
+                    client, system_messages, messages, GROUP_MAX_OUTPUT_TOKENS,
+                    on_text=parser.feed,
+                    on_start=prefix_cached.set,
+                    use_cache=use_llm_cache,
+                    label=f"generate:{stage}",
+                    on_call=on_call,
+                    backend=backend,
+                    cache_truncated=True,
+                )
+            finally:
+                prefix_cached.set()  # never leave the other groups waiting
+            if completion.stop_reason == "max_tokens":
+                return await _continue_truncated(
+                    client, company, vc_profile, slide_templates,
+                    completion.text, parser, group,
+                    emitter, GROUP_MAX_OUTPUT_TOKENS, f"generate:{stage}",
+                    use_llm_cache, on_call, backend,
+                )
+        data = _extract_json_object(completion.text)
+        if not data.get("slides"):
+            raise PitchDeckError(
+                f"Claude returned no slides for the {stage} group. "
+                f"Top-level keys in response: {list(data.keys())}"
+            )
+        return data
+
+    outcomes = await asyncio.gather(
+        *(_generate_group(i, stage, group) for i, (stage, group) in enumerate(groups)),
+        return_exceptions=True,
+    )
+    failed = [
+        (stage, outcome)
+        for (stage, _), outcome in zip(groups, outcomes)
+        if isinstance(outcome, BaseException)
+    ]
+    if failed:
+        stage, error = failed[0]
+        stages = ", ".join(stage for stage, _ in failed)
+        raise PitchDeckError(
+            f"Generation failed for slide group(s): {stages}. {error}"
+        ) from error
+
+    slides: list[SlideContent] = []
+    gaps: list[str] = []
+    for (stage, group), data in zip(groups, outcomes):
+        for position, slide_data in enumerate(data["slides"]):
+            fallback = group[min(position, len(group) - 1)][0]
+            slides.append(_slide_from_dict(slide_data, fallback))
+        gaps.extend(data.get("gaps_identified", []))
+    slides.sort(key=lambda s: s.slide_number)
+
+    # Stitching pass: transitions across group boundaries + overall arc
+    last_in_group = {group[-1][0] for _, group in groups[:-1]}
+    boundaries = [s.slide_number for s in slides if s.slide_number in last_in_group]
+    system_messages, messages = build_stitch_request(
+        company, vc_profile, slides, boundaries
+    )
+    stitch = _extract_json_object(
+        (await _stream_completion(
+            client, system_messages, messages, STITCH_MAX_OUTPUT_TOKENS,
+            use_cache=use_llm_cache,
+            label="generate:stitch",
+            on_call=on_call,
+            backend=backend,
+        )).text
+    )
+    transitions = {
+        t.get("slide_number"): t.get("transition_to_next", "")
+        for t in stitch.get("transitions", [])
+        if isinstance(t, dict)
+    }
+    slides = [
+        s.model_copy(update={"transition_to_next": transitions[s.slide_number]})
+        if transitions.get(s.slide_number) else s
+        for s in slides
+    ]
+
+    return _assemble_deck(
+        slides,
+        company,
+        vc_profile,
+        narrative_arc=stitch.get("narrative_arc", ""),
+        gaps_identified=list(dict.fromkeys(gaps)),
+    )
+
+
+def _require_api_key(backend: Optional[LLMBackend] = None) -> None:
+    if backend is not None and not backend.requires_api_key:
+        return
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        raise PitchDeckError(
+            "ANTHROPIC_API_KEY environment variable not set. "
+            "Get your key at https://console.anthropic.com/"
+        )
+
+
+def _async_client(backend: Optional[LLMBackend]):
+    if backend is not None:
+        return backend.async_client()
+    return clients.shared_async_client(AsyncAnthropic)
+
+
+async def _stream_completion(
+    client: AsyncAnthropic,
+    system_messages: list[dict],
+    messages: list[dict],
+    max_tokens: int,
+    on_text: Optional[Callable[[str], None]] = None,
+    on_start: Optional[Callable[[], None]] = None,
+    use_cache: bool = True,
+    label: str = "generate",
+    on_call: Optional[Callable[[CallMetrics], None]] = None,
+    backend: Optional[LLMBackend] = None,
+    cache_truncated: bool = False,
+) -> LLMCompletion:
+    """Send one streaming request and return its completion.
+
+    on_start is called when the first event arrives (the prompt has been
+    processed and its cacheable prefix cached); on_text with each text
+    delta. With use_cache, an identical earlier request is answered from
+    the LLM response cache, replaying its text through on_text. on_call
+    receives the call's usage and timing under label. API errors are
+    mapped to PitchDeckError. Responses from a non-default backend are
+    cached and reported under their own model name. Responses cut off at
+    max_tokens are only cached with cache_truncated, for callers that
+    recover them (see _continue_truncated).
+    """
+    model = backend_model(backend, MODEL)
+    timer = telemetry.CallTimer(label, model)
+    key = llm_cache.request_key(model, None, system_messages, messages, max_tokens)
+    if use_cache:
+        cached = llm_cache.lookup(key)
+        if cached is not None:
+            if on_start is not None:
+                on_start()
+            if on_text is not None:
+                on_text(cached.text)
+            telemetry.report(on_call, timer.finish(
+                stop_reason=cached.stop_reason, llm_cache_hit=True
+            ))
+            return cached
+
+    def _on_first_event() -> None:
+        timer.mark_first_byte()
+        if on_start is not None:
+            on_start()
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-6",
-            max_tokens=16384,
+        raw_text, usage, stop_reason = await _stream_from_api(
+            client, system_messages, messages, max_tokens, on_text, _on_first_event,
+            on_retry=timer.count_retry,
+        )
+    except PitchDeckError as e:
+        telemetry.report(on_call, timer.finish(error=str(e)))
+        raise
+    telemetry.report(on_call, timer.finish(usage, stop_reason))
+
+    if not raw_text:
+        raise PitchDeckError(
+            "Claude returned an empty response. "
+            "The input documents may be too large — try reducing input size."
+        )
+    completion = LLMCompletion(
+        model=model,
+        text=raw_text,
+        stop_reason=stop_reason,
+        usage=usage,
+        created_at=time.time(),
+    )
+    # Unless the caller recovers it, a truncated response would only fail
+    # to parse again on every rerun
+    if use_cache and (cache_truncated or stop_reason != "max_tokens"):
+        llm_cache.store(key, completion)
+    return completion
+
+
+async def _stream_from_api(
+    client: AsyncAnthropic,
+    system_messages: list[dict],
+    messages: list[dict],
+    max_tokens: int,
+    on_text: Optional[Callable[[str], None]],
+    on_first_event: Callable[[], None],
+    on_retry: Optional[Callable[[int, float, BaseException], None]] = None,
+) -> tuple[str, LLMUsage, Optional[str]]:
+    """Stream one request; return (text, usage, stop_reason).
+
+    The request goes through the shared rate-limit scheduler, which
+    retries 429/529/5xx and timeouts — but only until text has reached
+    on_text, since a retried stream would replay it.
+    """
+    first = True
+    streamed_text = False
+
+    async def _attempt() -> tuple[str, LLMUsage, Optional[str]]:
+        nonlocal first, streamed_text
+        parts: list[str] = []
+        usage = LLMUsage()
+        stop_reason = None
+        stream = await client.messages.create(
+            model=MODEL,
+            max_tokens=max_tokens,
             system=system_messages,
-            messages=[{"role": "user", "content": user_prompt}],
+            messages=messages,
+            stream=True,
+        )
+        async for event in stream:
+            if first:
+                on_first_event()
+                first = False
+            if event.type == "message_start":
+                usage = llm_cache.usage_from(event.message.usage)
+            elif event.type == "message_delta":
+                stop_reason = event.delta.stop_reason
+                output_tokens = getattr(event.usage, "output_tokens", None)
+                if isinstance(output_tokens, int):
+                    usage.output_tokens = output_tokens
+            elif event.type == "content_block_delta" and event.delta.type == "text_delta":
+                parts.append(event.delta.text)
+                if on_text is not None:
+                    streamed_text = True
+                    on_text(event.delta.text)
+        return "".join(parts), usage, stop_reason
+
+    try:
+        return await ratelimit.get_scheduler().call_async(
+            _attempt,
+            tokens=estimate_request(system_messages, messages).total_tokens,
+            can_retry=lambda _: not streamed_text,
+            on_retry=on_retry,
         )
     except AuthenticationError:
         raise PitchDeckError(
@@ -133,7 +830,132 @@ Generate ALL {len(slide_templates)} slides in order. Return ONLY the JSON object
             f"Unexpected {type(e).__name__} calling Claude API: {e}"
         ) from e
 
-    return _parse_deck_response(response, company, vc_profile)
+
+async def _continue_truncated(
+    client,
+    company: CompanyProfile,
+    vc_profile: VCProfile,
+    slide_templates: list[SlideTemplate],
+    raw_text: str,
+    parser: ArrayItemStream,
+    pending: list[tuple[int, SlideTemplate]],
+    emitter: "_SlideEmitter",
+    max_tokens: int,
+    label: str,
+    use_cache: bool,
+    on_call: Optional[Callable[[CallMetrics], None]],
+    backend: Optional[LLMBackend],
+) -> dict:
+    """Recover a response cut off at max_tokens.
+
+    pending lists the (number, template) pairs the response was asked
+    for. The slides that arrived complete are kept, and the rest are
+    requested with build_continuation_request, up to MAX_CONTINUATIONS
+    times. Only the one half-written slide is paid for twice. Returns the
+    merged JSON object (slides, gaps_identified and any narrative_arc).
+    """
+    data = _truncated_json(raw_text, parser)
+    slides = [s for s in data.get("slides") or [] if isinstance(s, dict)]
+    gaps = list(data.get("gaps_identified") or [])
+    for _ in range(MAX_CONTINUATIONS):
+        remaining = pending[len(slides):]
+        if not remaining:
+            break
+        system_messages, messages = build_continuation_request(
+            company, vc_profile, slide_templates, slides, remaining
+        )
+        parser = emitter.parser(first_number=remaining[0][0])
+        completion = await _stream_completion(
+            client, system_messages, messages, max_tokens,
+            on_text=parser.feed,
+            use_cache=use_cache,
+            label=f"{label}:continue",
+            on_call=on_call,
+            backend=backend,
+            cache_truncated=True,
+        )
+        if completion.stop_reason == "max_tokens":
+            part = _truncated_json(completion.text, parser)
+        else:
+            part = _extract_json_object(completion.text)
+        # A slide repeated from the written part must not shift the rest
+        written = {s.get("slide_number") for s in slides}
+        new_slides = [
+            s for s in part.get("slides") or []
+            if isinstance(s, dict) and s.get("slide_number") not in written
+        ]
+        if not new_slides:
+            break
+        slides.extend(new_slides)
+        gaps.extend(part.get("gaps_identified") or [])
+
+    if len(slides) < len(pending):
+        raise PitchDeckError(
+            f"Claude's response hit the {max_tokens}-token output limit; "
+            f"only {len(slides)} of {len(pending)} slides could be recovered "
+            f"after {MAX_CONTINUATIONS} continuation request(s)."
+        )
+    return {
+        **data,
+        "slides": slides[: len(pending)],
+        "gaps_identified": list(dict.fromkeys(gaps)),
+    }
+
+
+def _truncated_json(raw_text: str, parser: ArrayItemStream) -> dict:
+    """The complete part of a JSON response cut off inside its slides array.
+
+    The text up to the last complete slide is closed with "]}" so fields
+    written before the slides (narrative_arc, gaps_identified) are kept;
+    if that does not parse, only the streamed slides are returned.
+    """
+    if parser.root_start is not None and parser.last_item_end is not None:
+        try:
+            data = json.loads(
+                raw_text[parser.root_start:parser.last_item_end] + "]}"
+            )
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, dict):
+            return data
+    return {"slides": list(parser.items)}
+
+
+class _SlideEmitter:
+    """Turns streamed slide objects into on_slide/on_progress callbacks.
+
+    One emitter is shared by every stream of a deck, so progress counts
+    slides across concurrent groups. Each slide is validated into
+    SlideContent the moment its closing brace arrives.
+    """
+
+    def __init__(
+        self,
+        expected_slides: int,
+        on_progress: Optional[Callable[[int, int], None]],
+        on_slide: Optional[Callable[[SlideContent], None]],
+    ):
+        self.expected_slides = expected_slides
+        self.on_progress = on_progress
+        self.on_slide = on_slide
+        self.received = 0
+
+    def parser(self, first_number: int) -> ArrayItemStream:
+        """A parser for one stream whose slides start at first_number."""
+        def _on_item(data: dict) -> None:
+            position = first_number + parser.items_emitted - 1
+            try:
+                slide = _slide_from_dict(data, position)
+            except ValidationError:
+                return  # the final parse of the whole response reports it
+            self.received += 1
+            if self.on_slide is not None:
+                self.on_slide(slide)
+            if self.on_progress is not None:
+                self.on_progress(self.received, self.expected_slides)
+
+        parser = ArrayItemStream("slides", _on_item)
+        return parser
 
 
 def build_vc_context(vc_profile: VCProfile) -> str:
@@ -172,10 +994,12 @@ def build_vc_context(vc_profile: VCProfile) -> str:
     return "\n".join(lines)
 
 
-def _build_slide_instructions(templates: list[SlideTemplate]) -> str:
+def _build_slide_instructions(
+    templates: list[SlideTemplate], start: int = 1
+) -> str:
     """Format slide templates into numbered instructions."""
     lines = []
-    for i, t in enumerate(templates, 1):
+    for i, t in enumerate(templates, start):
         lines.append(f"Slide {i}: {t.slide_type}")
         lines.append(f"  Purpose: {t.purpose}")
         lines.append(f"  Required: {', '.join(t.required_elements)}")
@@ -192,8 +1016,6 @@ def _parse_deck_response(
     response, company: CompanyProfile, vc_profile: VCProfile
 ) -> PitchDeck:
     """Extract structured content from Claude response into PitchDeck model."""
-    from datetime import datetime
-
     if not response.content:
         raise PitchDeckError(
             "Claude returned an empty response. "
@@ -205,24 +1027,14 @@ def _parse_deck_response(
             f"Unexpected Claude response format: "
             f"expected text block, got {type(content_block).__name__}"
         )
-    raw_text = content_block.text
+    return _parse_deck_text(content_block.text, company, vc_profile)
 
-    # Try to extract JSON from the response
-    json_match = re.search(r"\{[\s\S]*\}", raw_text)
-    if not json_match:
-        raise PitchDeckError(
-            "Failed to parse deck response — no JSON found in Claude output"
-        )
 
-    try:
-        data = json.loads(json_match.group())
-    except json.JSONDecodeError as e:
-        extracted = json_match.group()
-        snippet = extracted[:200] + ("..." if len(extracted) > 200 else "")
-        raise PitchDeckError(
-            f"Failed to parse deck JSON: {e}. "
-            f"Extracted text starts with: {snippet}"
-        ) from e
+def _parse_deck_text(
+    raw_text: str, company: CompanyProfile, vc_profile: VCProfile
+) -> PitchDeck:
+    """Parse the deck JSON in Claude's output text into a PitchDeck."""
+    data = _extract_json_object(raw_text)
 
     raw_slides = data.get("slides")
     if not raw_slides:
@@ -233,26 +1045,67 @@ def _parse_deck_response(
 
     slides = []
     for slide_data in raw_slides:
-        slides.append(
-            SlideContent(
-                slide_number=slide_data.get("slide_number", len(slides) + 1),
-                slide_type=slide_data.get("slide_type", "unknown"),
-                title=slide_data.get("title", ""),
-                headline=slide_data.get("headline", ""),
-                bullets=slide_data.get("bullets", []),
-                metrics=slide_data.get("metrics", []),
-                speaker_notes=slide_data.get("speaker_notes", ""),
-                transition_to_next=slide_data.get("transition_to_next", ""),
-                vc_alignment_notes=slide_data.get("vc_alignment_notes", []),
-            )
-        )
+        slides.append(_slide_from_dict(slide_data, len(slides) + 1))
+
+    return _assemble_deck(
+        slides,
+        company,
+        vc_profile,
+        narrative_arc=data.get("narrative_arc", ""),
+        gaps_identified=data.get("gaps_identified", []),
+    )
+
+
+def _extract_json_object(raw_text: str) -> dict:
+    """Return the JSON object in Claude's output text."""
+    try:
+        return extract_json_object(raw_text)
+    except JSONExtractError as e:
+        if e.start is None:
+            raise PitchDeckError(
+                "Failed to parse deck response — no JSON found in Claude output"
+            ) from e
+        extracted = raw_text[e.start:e.end]
+        snippet = extracted[:200] + ("..." if len(extracted) > 200 else "")
+        raise PitchDeckError(
+            f"Failed to parse deck JSON: {e}. "
+            f"Extracted text starts with: {snippet}"
+        ) from e
+
+
+def _assemble_deck(
+    slides: list[SlideContent],
+    company: CompanyProfile,
+    vc_profile: VCProfile,
+    narrative_arc: str,
+    gaps_identified: list[str],
+) -> PitchDeck:
+    from datetime import datetime
 
     return PitchDeck(
         company_name=company.name or company.product_name,
         target_vc=vc_profile.name,
         generated_at=datetime.now().isoformat(),
         slides=slides,
-        narrative_arc=data.get("narrative_arc", ""),
-        gaps_identified=data.get("gaps_identified", []),
+        narrative_arc=narrative_arc,
+        gaps_identified=gaps_identified,
         gaps_filled=dict(company.model_dump().get("gaps_filled", {})),
     )
+
+
+def _slide_from_dict(slide_data: dict, position: int) -> SlideContent:
+    """Build a SlideContent from one slide object of Claude's JSON output.
+
+    position (1-based) stands in for a missing slide_number.
+    """
+    return SlideContent(
+        slide_number=slide_data.get("slide_number", position),
+        slide_type=slide_data.get("slide_type", "unknown"),
+        title=slide_data.get("title", ""),
+        headline=slide_data.get("headline", ""),
+        bullets=slide_data.get("bullets", []),
+        metrics=slide_data.get("metrics", []),
+        speaker_notes=slide_data.get("speaker_notes", ""),
+        transition_to_next=slide_data.get("transition_to_next", ""),
+        vc_alignment_notes=slide_data.get("vc_alignment_notes", []),
+    )
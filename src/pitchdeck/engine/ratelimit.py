@@ -0,0 +1,266 @@
+"""Rate-limit-aware scheduling and retries for Claude calls.
+
+Every Claude call goes through one process-wide RequestScheduler. Before
+sending, a call takes its share of the requests/min and tokens/min
+budgets; when a budget is spent the caller waits instead of provoking a
+429. Retryable failures (429, 529 overloaded, 5xx, timeouts, dropped
+connections) are retried with exponential backoff and full jitter, or
+after the server's ``retry-after``. A 429 pauses every caller, not just
+the one that hit it, so concurrent requests queue behind the limit.
+
+The budgets come from PITCHDECK_RPM and PITCHDECK_TPM (unset = no local
+limit) and the retry count from PITCHDECK_MAX_RETRIES.
+"""
+
+import asyncio
+import email.utils
+import os
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from anthropic import APIConnectionError, APIStatusError
+
+from pitchdeck.models import PitchDeckError
+
+T = TypeVar("T")
+
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 60.0
+
+# Same set the Anthropic SDK retries; 529 is "overloaded"
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class TokenBucket:
+    """A per-minute budget that refills continuously.
+
+    reserve() takes the amount at once and returns how long the caller
+    must wait for it. The level may go negative, so concurrent callers
+    are spaced out in arrival order rather than racing for refills.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        if per_minute <= 0:
+            raise ValueError("per_minute must be positive")
+        self.per_minute = per_minute
+        self._clock = clock
+        self._level = float(per_minute)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take amount from the bucket; return the seconds to wait first."""
+        with self._lock:
+            now = self._clock()
+            refill = (now - self._updated) * self.per_minute / 60
+            self._level = min(self.per_minute, self._level + refill)
+            self._updated = now
+            # A request larger than the whole budget waits for a full bucket
+            self._level -= min(amount, self.per_minute)
+            if self._level >= 0:
+                return 0.0
+            return -self._level * 60 / self.per_minute
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed Claude call is worth sending again."""
+    if isinstance(error, APIStatusError):
+        should_retry = _header(error, "x-should-retry")
+        if should_retry in ("true", "false"):
+            return should_retry == "true"
+        return error.status_code in RETRYABLE_STATUS
+    return isinstance(error, APIConnectionError)  # includes timeouts
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait, from retry-after(-ms)."""
+    value = _header(error, "retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+    value = _header(error, "retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _header(error: BaseException, name: str) -> Optional[str]:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    try:
+        value = headers.get(name) if headers is not None else None
+    except Exception:
+        return None
+    return value.strip().lower() if isinstance(value, str) else None
+
+
+class RequestScheduler:
+    """Shared request/token budgets plus retry with backoff for API calls.
+
+    Safe to share between threads and event loops: budget bookkeeping is
+    under a lock and waiting happens outside it, with time.sleep in
+    call() and asyncio.sleep in call_async().
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.requests = TokenBucket(requests_per_minute, clock) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute, clock) if tokens_per_minute else None
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._rng = rng
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def admission_delay(self, tokens: int = 0) -> float:
+        """Reserve budget for one request; return the seconds to wait."""
+        delay = 0.0
+        with self._lock:
+            delay = max(delay, self._paused_until - self._clock())
+        if self.requests is not None:
+            delay = max(delay, self.requests.reserve(1))
+        if self.tokens is not None and tokens > 0:
+            delay = max(delay, self.tokens.reserve(tokens))
+        return delay
+
+    def backoff(self, attempt: int, error: BaseException) -> float:
+        """Delay before retry number attempt (1-based).
+
+        The server's retry-after wins when present (capped at max_delay);
+        otherwise exponential backoff with full jitter. A 429 also pauses
+        admission of every other request for that long.
+        """
+        delay = retry_after(error)
+        if delay is None:
+            ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+            delay = ceiling * self._rng()
+        delay = min(delay, self.max_delay)
+        if isinstance(error, APIStatusError) and error.status_code == 429:
+            with self._lock:
+                self._paused_until = max(self._paused_until, self._clock() + delay)
+        return delay
+
+    def _should_retry(
+        self,
+        attempt: int,
+        error: BaseException,
+        can_retry: Optional[Callable[[BaseException], bool]],
+    ) -> bool:
+        if attempt > self.max_retries or not is_retryable(error):
+            return False
+        return can_retry is None or can_retry(error)
+
+    def call(
+        self,
+        fn: Callable[[], T],
+        tokens: int = 0,
+        can_retry: Optional[Callable[[BaseException], bool]] = None,
+        on_retry: Optional[Callable[[int, float, BaseException], None]] = None,
+    ) -> T:
+        """Run fn under the budgets, retrying retryable API errors.
+
+        tokens is the request's estimated input size, charged against the
+        tokens/min budget on every attempt. can_retry may veto a retry
+        (e.g. once a stream has delivered text); on_retry is called with
+        (attempt, delay, error) before each wait. The last error is
+        re-raised when retries run out.
+        """
+        attempt = 0
+        while True:
+            delay = self.admission_delay(tokens)
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                return fn()
+            except Exception as e:
+                attempt += 1
+                if not self._should_retry(attempt, e, can_retry):
+                    raise
+                delay = self.backoff(attempt, e)
+                if on_retry is not None:
+                    on_retry(attempt, delay, e)
+                time.sleep(delay)
+
+    async def call_async(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        tokens: int = 0,
+        can_retry: Optional[Callable[[BaseException], bool]] = None,
+        on_retry: Optional[Callable[[int, float, BaseException], None]] = None,
+    ) -> T:
+        """Async counterpart of call(); fn returns a fresh awaitable per attempt."""
+        attempt = 0
+        while True:
+            delay = self.admission_delay(tokens)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                return await fn()
+            except Exception as e:
+                attempt += 1
+                if not self._should_retry(attempt, e, can_retry):
+                    raise
+                delay = self.backoff(attempt, e)
+                if on_retry is not None:
+                    on_retry(attempt, delay, e)
+                await asyncio.sleep(delay)
+
+
+_scheduler: Optional[RequestScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def _env_number(name: str) -> Optional[float]:
+    value = os.environ.get(name)
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise PitchDeckError(f"{name} must be a number, got {value!r}")
+
+
+def get_scheduler() -> RequestScheduler:
+    """Return the process-wide scheduler, creating it from the environment."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            retries = _env_number("PITCHDECK_MAX_RETRIES")
+            _scheduler = RequestScheduler(
+                requests_per_minute=_env_number("PITCHDECK_RPM"),
+                tokens_per_minute=_env_number("PITCHDECK_TPM"),
+                max_retries=DEFAULT_MAX_RETRIES if retries is None else int(retries),
+            )
+        return _scheduler
+
+
+def set_scheduler(scheduler: Optional[RequestScheduler]) -> Optional[RequestScheduler]:
+    """Replace the process-wide scheduler (None = rebuild from the
+    environment on next use); return the previous one."""
+    global _scheduler
+    with _scheduler_lock:
+        previous, _scheduler = _scheduler, scheduler
+    return previous
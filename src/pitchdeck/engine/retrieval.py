@@ -0,0 +1,216 @@
+"""BM25 retrieval over document sections, queried per slide.
+
+The traction slide needs the KPI section and the team slide needs the
+bios — not the whole data room. An in-memory inverted index over the
+parsed sections lets each slide (or slide group) be sent only the
+sections that match its template. Built indexes are stored in the parse
+cache, keyed by the section contents, so unchanged inputs skip the build.
+"""
+
+import hashlib
+import json
+import math
+import re
+from collections import Counter
+from typing import Optional
+
+from pitchdeck.cache import make_key
+from pitchdeck.models import DocumentSection, SlideTemplate
+
+# Bump when tokenization or the stored format changes
+INDEX_REVISION = "1"
+
+# Standard Okapi BM25 parameters
+K1 = 1.5
+B = 0.75
+
+DEFAULT_TOP_K = 5
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*")
+
+_STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that
+the this to was we were will with you your not but can than into per
+""".split())
+
+# Template identifiers are terse ("ndr", "cac", "tam_eur"); expand them to
+# the words documents actually use.
+QUERY_SYNONYMS: dict[str, tuple[str, ...]] = {
+    "arr": ("recurring", "revenue"),
+    "mrr": ("recurring", "revenue"),
+    "ndr": ("retention", "expansion", "nrr"),
+    "acv": ("contract", "value", "pricing"),
+    "arpu": ("revenue", "customer", "pricing"),
+    "ltv": ("lifetime", "value"),
+    "cac": ("acquisition", "cost"),
+    "roi": ("savings", "return"),
+    "tam": ("market", "addressable"),
+    "sam": ("market", "serviceable"),
+    "som": ("market", "obtainable"),
+    "icp": ("customer", "profile", "segment"),
+    "gtm": ("sales", "channel"),
+    "yoy": ("growth",),
+    "burn": ("runway", "costs"),
+    "moat": ("defensibility", "differentiation"),
+    "founders": ("team", "ceo", "cto"),
+    "hires": ("team", "hiring"),
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords, plural "s" stripped."""
+    tokens = []
+    for word in _WORD_RE.findall(text.lower()):
+        if word in _STOPWORDS or len(word) < 2:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def slide_query(template: SlideTemplate) -> list[str]:
+    """Build a BM25 query from a slide template's fields.
+
+    Uses the slide type, purpose, required/optional elements and needed
+    metrics, with abbreviations expanded via QUERY_SYNONYMS. Terms are
+    de-duplicated so no single field dominates the score.
+    """
+    phrases = [
+        template.slide_type.replace("-", " "),
+        template.purpose,
+        *template.required_elements,
+        *template.optional_elements,
+        *template.metrics_needed,
+    ]
+    terms: list[str] = []
+    for phrase in phrases:
+        for term in tokenize(phrase.replace("_", " ")):
+            terms.append(term)
+            terms.extend(tokenize(" ".join(QUERY_SYNONYMS.get(term, ()))))
+    return list(dict.fromkeys(terms))
+
+
+class BM25Index:
+    """Okapi BM25 inverted index over a fixed list of sections."""
+
+    def __init__(
+        self,
+        sections: list[DocumentSection],
+        postings: dict[str, list[tuple[int, int]]],
+        doc_lengths: list[int],
+    ):
+        self.sections = sections
+        self.postings = postings
+        self.doc_lengths = doc_lengths
+        self.avg_length = (
+            sum(doc_lengths) / len(doc_lengths) if doc_lengths else 0.0
+        )
+
+    @classmethod
+    def build(cls, sections: list[DocumentSection]) -> "BM25Index":
+        postings: dict[str, list[tuple[int, int]]] = {}
+        doc_lengths = []
+        for doc_id, section in enumerate(sections):
+            tokens = tokenize(f"{section.heading}\n{section.text}")
+            doc_lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                postings.setdefault(term, []).append((doc_id, tf))
+        return cls(sections, postings, doc_lengths)
+
+    def idf(self, term: str) -> float:
+        n = len(self.doc_lengths)
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def scores(self, query: list[str]) -> dict[int, float]:
+        """Return {section position: BM25 score} for sections matching query."""
+        scores: dict[int, float] = {}
+        if not self.avg_length:
+            return scores
+        for term in query:
+            idf = self.idf(term)
+            for doc_id, tf in self.postings.get(term, ()):
+                norm = K1 * (1 - B + B * self.doc_lengths[doc_id] / self.avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+        return scores
+
+    def search(
+        self, query: list[str], top_k: int = DEFAULT_TOP_K
+    ) -> list[tuple[DocumentSection, float]]:
+        """Return the top_k (section, score) pairs, best first."""
+        ranked = sorted(self.scores(query).items(), key=lambda item: (-item[1], item[0]))
+        return [(self.sections[doc_id], score) for doc_id, score in ranked[:top_k]]
+
+    def for_slide(
+        self, template: SlideTemplate, top_k: int = DEFAULT_TOP_K
+    ) -> list[DocumentSection]:
+        """Return the sections most relevant to a slide, in document order."""
+        hits = self.search(slide_query(template), top_k)
+        position = {id(section): i for i, section in enumerate(self.sections)}
+        return sorted((section for section, _ in hits), key=lambda s: position[id(s)])
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "revision": INDEX_REVISION,
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+        }, separators=(",", ":"))
+
+    @classmethod
+    def from_json(
+        cls, data: str, sections: list[DocumentSection]
+    ) -> Optional["BM25Index"]:
+        """Rebuild a stored index for sections, or None if it doesn't fit."""
+        try:
+            payload = json.loads(data)
+        except json.JSONDecodeError:
+            return None
+        if payload.get("revision") != INDEX_REVISION:
+            return None
+        if len(payload.get("doc_lengths", ())) != len(sections):
+            return None
+        postings = {
+            term: [(doc_id, tf) for doc_id, tf in entries]
+            for term, entries in payload["postings"].items()
+        }
+        return cls(sections, postings, payload["doc_lengths"])
+
+
+def _index_key(sections: list[DocumentSection]) -> str:
+    digest = hashlib.sha256()
+    for section in sections:
+        digest.update(section.heading.encode("utf-8"))
+        digest.update(b"\x1f")
+        digest.update(section.text.encode("utf-8"))
+        digest.update(b"\x1e")
+    return make_key("bm25", INDEX_REVISION, digest.hexdigest())
+
+
+def load_or_build_index(
+    sections: list[DocumentSection], use_cache: bool = True
+) -> BM25Index:
+    """Return the BM25 index for sections, reusing a stored one if present.
+
+    Indexes live in the parse cache (same directory and size budget as
+    the extracted text), keyed by the section contents.
+    """
+    if not use_cache:
+        return BM25Index.build(sections)
+
+    from pitchdeck.parsers import get_parse_cache
+
+    cache = get_parse_cache()
+    key = _index_key(sections)
+    cached = cache.get(key)
+    if cached is not None:
+        index = BM25Index.from_json(cached, sections)
+        if index is not None:
+            return index
+
+    index = BM25Index.build(sections)
+    try:
+        cache.put(key, index.to_json())
+    except OSError:
+        pass  # a read-only or full cache dir must never fail the run
+    return index
@@ -151,3 +151,40 @@ def get_narrative_arc() -> str:
         "5. TRUST (Team + Competitive + Go-to-Market): Build confidence — we can execute\n"
         "6. CALL TO ACTION (Financials + The Ask + AI Architecture): Close — here's what we need and why it's worth it"
     )
+
+
+# The arc stages of get_narrative_arc() and the slide types each covers
+NARRATIVE_STAGES: list[tuple[str, tuple[str, ...]]] = [
+    ("hook", ("cover", "executive-summary")),
+    ("tension", ("problem", "why-now")),
+    ("resolution", ("solution", "product")),
+    ("proof", ("market-sizing", "traction", "business-model")),
+    ("trust", ("team", "competitive-landscape", "go-to-market")),
+    ("call-to-action", ("financials", "the-ask", "ai-architecture")),
+]
+
+
+def group_templates_by_arc(
+    templates: list[SlideTemplate],
+) -> list[tuple[str, list[tuple[int, SlideTemplate]]]]:
+    """Split templates into narrative arc stages, keeping slide positions.
+
+    Returns (stage, [(slide number, template), ...]) for each non-empty
+    stage, in arc order; slide numbers are 1-based positions in
+    templates. A slide type no stage lists joins the stage of the slide
+    before it (or the first stage).
+    """
+    stage_of = {
+        slide_type: stage
+        for stage, slide_types in NARRATIVE_STAGES
+        for slide_type in slide_types
+    }
+    groups: dict[str, list[tuple[int, SlideTemplate]]] = {
+        stage: [] for stage, _ in NARRATIVE_STAGES
+    }
+    previous = NARRATIVE_STAGES[0][0]
+    for number, template in enumerate(templates, 1):
+        stage = stage_of.get(template.slide_type, previous)
+        groups[stage].append((number, template))
+        previous = stage
+    return [(stage, slides) for stage, slides in groups.items() if slides]
@@ -0,0 +1,177 @@
+"""Token usage, prompt-cache and latency metrics for Claude calls.
+
+Engine functions report one CallMetrics per call through an on_call
+callback; the CLI collects them into a RunMetrics, writes it next to the
+run's output, optionally appends it to a JSONL log, and prints a
+one-line summary. Cache-read vs cache-creation tokens show whether the
+``cache_control`` prefix is actually reused.
+
+Streamed calls mark their first byte on the first stream event. Plain
+request/response calls mark it from the pooled client's response hook
+(mark_response_started), inside first_byte_of(timer), when the headers
+of a successful response arrive.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from pitchdeck.models import CallMetrics, LLMUsage, RunMetrics
+
+# USD list prices per million tokens: (input, output, cache write, cache read).
+# Update when pricing changes; unknown models are costed at 0.
+PRICES_PER_MTOK: dict[str, tuple[float, float, float, float]] = {
+    "claude-sonnet-4-6": (3.00, 15.00, 3.75, 0.30),
+}
+
+
+class CallTimer:
+    """Measure one call: start on creation, mark the first byte, finish."""
+
+    def __init__(self, label: str, model: str):
+        self.label = label
+        self.model = model
+        self.started = time.perf_counter()
+        self.first_byte: Optional[float] = None
+        self.retries = 0
+
+    def count_retry(self, *_) -> None:
+        """on_retry callback for RequestScheduler.call/call_async."""
+        self.retries += 1
+
+    def mark_first_byte(self) -> None:
+        if self.first_byte is None:
+            self.first_byte = time.perf_counter() - self.started
+
+    def finish(
+        self,
+        usage: Optional[LLMUsage] = None,
+        stop_reason: Optional[str] = None,
+        llm_cache_hit: bool = False,
+        error: Optional[str] = None,
+    ) -> CallMetrics:
+        return CallMetrics(
+            label=self.label,
+            model=self.model,
+            usage=usage or LLMUsage(),
+            llm_cache_hit=llm_cache_hit,
+            time_to_first_byte_s=self.first_byte,
+            latency_s=time.perf_counter() - self.started,
+            stop_reason=stop_reason,
+            error=error,
+            retries=self.retries,
+        )
+
+
+_awaiting_first_byte: ContextVar[Optional[CallTimer]] = ContextVar(
+    "awaiting_first_byte", default=None
+)
+
+
+@contextmanager
+def first_byte_of(timer: CallTimer) -> Iterator[CallTimer]:
+    """Attribute responses started in this context to timer."""
+    token = _awaiting_first_byte.set(timer)
+    try:
+        yield timer
+    finally:
+        _awaiting_first_byte.reset(token)
+
+
+def mark_response_started(response=None) -> None:
+    """HTTP response hook: the headers of a response have arrived.
+
+    Error responses (a 429 before a retry) are not the call's first byte.
+    """
+    timer = _awaiting_first_byte.get()
+    if timer is not None and getattr(response, "is_success", True):
+        timer.mark_first_byte()
+
+
+def report(
+    on_call: Optional[Callable[[CallMetrics], None]], metrics: CallMetrics
+) -> None:
+    if on_call is not None:
+        on_call(metrics)
+
+
+def estimate_cost_usd(calls: list[CallMetrics]) -> float:
+    """List-price cost of the calls; LLM-cache hits are free."""
+    cost = 0.0
+    for call in calls:
+        if call.llm_cache_hit:
+            continue
+        prices = PRICES_PER_MTOK.get(call.model)
+        if prices is None:
+            continue
+        u = call.usage
+        cost += (
+            u.input_tokens * prices[0]
+            + u.output_tokens * prices[1]
+            + u.cache_creation_input_tokens * prices[2]
+            + u.cache_read_input_tokens * prices[3]
+        ) / 1_000_000
+    return cost
+
+
+def metrics_record(run: RunMetrics) -> dict:
+    """JSON-ready dict of a run, including its estimated cost."""
+    record = run.model_dump()
+    record["estimated_cost_usd"] = round(estimate_cost_usd(run.calls), 6)
+    return record
+
+
+def write_run_metrics(run: RunMetrics, path: str) -> None:
+    """Write the run's metrics as indented JSON.
+
+    Raises OSError if the file cannot be written.
+    """
+    with open(path, "w") as f:
+        json.dump(metrics_record(run), f, indent=2)
+        f.write("\n")
+
+
+def append_metrics_log(run: RunMetrics, path: str) -> None:
+    """Append the run's metrics as one JSON line to an append-only log.
+
+    Raises OSError if the file cannot be written.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(metrics_record(run)) + "\n")
+
+
+def summarize(run: RunMetrics) -> str:
+    """One line: calls, tokens by kind, cache hits, latency and cost."""
+    totals = run.totals
+    prompt_tokens = (
+        totals.input_tokens
+        + totals.cache_creation_input_tokens
+        + totals.cache_read_input_tokens
+    )
+    cache_share = (
+        totals.cache_read_input_tokens / prompt_tokens if prompt_tokens else 0.0
+    )
+    first_bytes = [
+        c.time_to_first_byte_s for c in run.calls
+        if c.time_to_first_byte_s is not None and not c.llm_cache_hit
+    ]
+    parts = [
+        f"{len(run.calls)} Claude call(s)",
+        f"{prompt_tokens:,} in ({cache_share:.0%} prompt-cache read, "
+        f"{totals.cache_creation_input_tokens:,} written)",
+        f"{totals.output_tokens:,} out",
+    ]
+    if run.llm_cache_hits:
+        parts.append(f"{run.llm_cache_hits} from LLM cache")
+    if first_bytes:
+        parts.append(f"first byte {min(first_bytes):.1f}s")
+    retries = sum(c.retries for c in run.calls)
+    if retries:
+        parts.append(f"{retries} retried")
+    parts.append(f"slowest {max((c.latency_s for c in run.calls), default=0):.1f}s")
+    parts.append(f"~${estimate_cost_usd(run.calls):.3f}")
+    return ", ".join(parts)
@@ -0,0 +1,101 @@
+"""Local token-count estimation and prompt-size preflight.
+
+Nothing here calls the API: prompts are sized before they are sent, so
+an oversized request fails (or is compacted) in milliseconds instead of
+after a long wait for a timeout or a context-length error.
+"""
+
+import math
+import re
+from typing import Optional
+
+from pitchdeck.models import PromptBlockEstimate, PromptEstimate, PromptTooLargeError
+
+# Claude models' context window (input + output tokens)
+CONTEXT_WINDOW = 200_000
+# Share of the window kept free to absorb estimation error
+ESTIMATE_HEADROOM = 0.1
+
+# Token costs per piece, tuned so plain English prose lands near the usual
+# ~4 chars/token while figures, Markdown tables and JSON punctuation —
+# which tokenize much worse than prose — are counted higher.
+CHARS_PER_WORD_TOKEN = 8  # a word costs one token per started 8 letters
+DIGITS_PER_TOKEN = 3
+SYMBOL_RUN_CHARS_PER_TOKEN = 4  # "----", "====", "    " in tables/indent
+
+_PIECE_RE = re.compile(
+    r"(?P<word>[A-Za-z]+)"
+    r"|(?P<digits>[0-9]+)"
+    r"|(?P<newlines>\n+)"
+    r"|(?P<space>[ \t]{2,})"
+    r"|(?P<run>([^\w\s])\6{2,})"
+    r"|(?P<other>[^\sA-Za-z0-9])"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without calling the API."""
+    if not text:
+        return 0
+    tokens = 0
+    for match in _PIECE_RE.finditer(text):
+        kind = match.lastgroup
+        size = match.end() - match.start()
+        if kind == "word":
+            tokens += math.ceil(size / CHARS_PER_WORD_TOKEN)
+        elif kind == "digits":
+            tokens += math.ceil(size / DIGITS_PER_TOKEN)
+        elif kind in ("space", "run"):
+            tokens += math.ceil(size / SYMBOL_RUN_CHARS_PER_TOKEN)
+        else:
+            # Newline runs, punctuation and non-ASCII characters (€, ü, —)
+            tokens += 1
+    return max(1, tokens)
+
+
+def default_input_budget(max_output_tokens: int) -> int:
+    """Input tokens that safely fit next to max_output_tokens of output."""
+    return int((CONTEXT_WINDOW - max_output_tokens) * (1 - ESTIMATE_HEADROOM))
+
+
+def estimate_request(
+    system: list[dict],
+    messages: list[dict],
+    labels: Optional[list[str]] = None,
+) -> PromptEstimate:
+    """Estimate input tokens of a Messages API request, block by block.
+
+    System blocks up to and including the last ``cache_control`` breakpoint
+    form the cached prefix; later blocks and the messages are uncached.
+    """
+    labels = labels or [f"system[{i}]" for i in range(len(system))]
+    last_breakpoint = max(
+        (i for i, block in enumerate(system) if block.get("cache_control")),
+        default=-1,
+    )
+    blocks = [
+        PromptBlockEstimate(
+            name=label,
+            tokens=estimate_tokens(block["text"]),
+            cached=i <= last_breakpoint,
+        )
+        for i, (label, block) in enumerate(zip(labels, system))
+    ]
+    for message in messages:
+        content = message["content"]
+        if not isinstance(content, str):
+            content = "".join(part.get("text", "") for part in content)
+        blocks.append(
+            PromptBlockEstimate(
+                name=f"{message['role']} message",
+                tokens=estimate_tokens(content),
+                cached=False,
+            )
+        )
+    return PromptEstimate(blocks=blocks)
+
+
+def check_input_budget(estimate: PromptEstimate, max_input_tokens: int) -> None:
+    """Raise PromptTooLargeError if the estimate exceeds max_input_tokens."""
+    if estimate.total_tokens > max_input_tokens:
+        raise PromptTooLargeError(estimate, max_input_tokens)
@@ -1,10 +1,9 @@
 """Pitch deck validation engine — rule-based + LLM scoring."""
 
-import json
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Union
 
 from anthropic import (
     Anthropic,
@@ -14,15 +13,25 @@ from anthropic import (
     RateLimitError,
 )
 
+from pitchdeck.engine import clients, llm_cache, ratelimit, telemetry
+from pitchdeck.engine.backends import LLMBackend, backend_model
+from pitchdeck.engine.jsonstream import JSONExtractError, extract_json_object
 from pitchdeck.engine.narrative import build_vc_context
 
 from pitchdeck.engine.slides import SLIDE_TEMPLATES
+from pitchdeck.engine.tokens import (
+    check_input_budget,
+    default_input_budget,
+    estimate_request,
+)
 from pitchdeck.models import (
+    CallMetrics,
     CustomCheckResult,
     DeckValidationResult,
     DimensionScore,
     PitchDeck,
     PitchDeckError,
+    PromptEstimate,
     SlideContent,
     SlideTemplate,
     SlideValidationScore,
@@ -38,6 +47,12 @@ SCORING_DIMENSIONS = [
     {"dimension": "common_mistakes", "weight": 0.15, "method": "llm"},
 ]
 
+VALIDATOR_MODEL = "claude-sonnet-4-6"
+VALIDATOR_MAX_OUTPUT_TOKENS = 8192
+
+# Concurrent LLM calls when validating against several profiles
+DEFAULT_FANOUT_WORKERS = 4
+
 COMMON_MISTAKES = [
     "Over-indexing on architecture/technical detail vs business proof",
     "Missing simplified operating plan or use-of-funds breakdown",
@@ -142,6 +157,11 @@ def _score_slide_rules(slide: SlideContent) -> SlideValidationScore:
     )
 
 
+def score_slides(deck: PitchDeck) -> List[SlideValidationScore]:
+    """Rule-based scores for every slide; the same for any VC profile."""
+    return [_score_slide_rules(slide) for slide in deck.slides]
+
+
 def _score_completeness(deck: PitchDeck, vc_profile: VCProfile) -> DimensionScore:
     """Score deck completeness: slide count vs preferred, required slide type coverage, and speaker notes presence.
 
@@ -367,6 +387,12 @@ def _score_qualitative(
     deck: PitchDeck,
     vc_profile: VCProfile,
     rule_findings: str,
+    max_input_tokens: Optional[int] = None,
+    on_preflight: Optional[Callable[[PromptEstimate], None]] = None,
+    client: Optional[Anthropic] = None,
+    use_cache: bool = True,
+    on_call: Optional[Callable[[CallMetrics], None]] = None,
+    backend: Optional[LLMBackend] = None,
 ) -> dict:
     """Use Claude to score narrative coherence, thesis alignment, and common mistakes.
 
@@ -378,15 +404,24 @@ def _score_qualitative(
             slide_quality (list of {slide_number, quality_note}),
             top_strengths (list[str]), critical_gaps (list[str]),
             recommendation (str).
+
+    Raises PromptTooLargeError, before any API call, when the estimated
+    prompt exceeds max_input_tokens (default: what fits next to the
+    response in the context window). A client may be passed in;
+    otherwise the process-wide pooled one is used (see clients).
+    With use_cache an identical earlier request is answered from the LLM
+    response cache, so reruns score the same deck the same. on_call receives
+    the call's usage and timing; time to first byte comes from the pooled
+    client's response hook (or the backend), not from a client passed in.
+    backend selects where the request goes (default: the Anthropic API).
     """
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
+    needs_key = backend is None or backend.requires_api_key
+    if needs_key and not os.environ.get("ANTHROPIC_API_KEY"):
         raise PitchDeckError(
             "ANTHROPIC_API_KEY environment variable not set. "
             "Get your key at https://console.anthropic.com/"
         )
 
-    client = Anthropic()
     vc_context = build_vc_context(vc_profile)
 
     system_messages = [
@@ -454,14 +489,83 @@ OUTPUT FORMAT (return ONLY this JSON):
     "critical_gaps": ["<gap1>", "<gap2>", "<gap3>"],
     "recommendation": "<one paragraph>"
 }}"""
+    messages = [{"role": "user", "content": user_prompt}]
 
+    estimate = estimate_request(
+        system_messages, messages, ["instructions", "VC context + rule findings"]
+    )
+    if max_input_tokens is None:
+        max_input_tokens = default_input_budget(VALIDATOR_MAX_OUTPUT_TOKENS)
+    # Report first: an oversized prompt is when the breakdown matters most
+    if on_preflight is not None:
+        on_preflight(estimate)
+    check_input_budget(estimate, max_input_tokens)
+
+    model = backend_model(backend, VALIDATOR_MODEL)
+    timer = telemetry.CallTimer(f"validate:{vc_profile.name}", model)
+    key = llm_cache.request_key(
+        model, None, system_messages, messages, VALIDATOR_MAX_OUTPUT_TOKENS
+    )
+    if use_cache:
+        cached = llm_cache.lookup(key)
+        if cached is not None:
+            telemetry.report(on_call, timer.finish(
+                stop_reason=cached.stop_reason, llm_cache_hit=True
+            ))
+            return _parse_validation_text(cached.text)
+
+    if client is None:
+        client = _client(backend)
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-6",
-            max_tokens=8192,
-            temperature=0.0,
-            system=system_messages,
-            messages=[{"role": "user", "content": user_prompt}],
+        with telemetry.first_byte_of(timer):
+            response = _create_message(
+                client, system_messages, messages,
+                tokens=estimate.total_tokens, on_retry=timer.count_retry,
+            )
+    except PitchDeckError as e:
+        telemetry.report(on_call, timer.finish(error=str(e)))
+        raise
+    stop_reason = getattr(response, "stop_reason", None)
+    telemetry.report(on_call, timer.finish(
+        llm_cache.usage_from(getattr(response, "usage", None)),
+        stop_reason if isinstance(stop_reason, str) else None,
+    ))
+
+    data = _parse_validation_response(response)
+    if use_cache:
+        # Only responses that parsed are worth replaying
+        llm_cache.store(key, llm_cache.completion_from_message(model, response))
+    return data
+
+
+def _client(backend: Optional[LLMBackend]):
+    if backend is not None:
+        return backend.client()
+    return clients.shared_client(Anthropic)
+
+
+def _create_message(
+    client: Anthropic,
+    system_messages: list,
+    messages: list,
+    tokens: int = 0,
+    on_retry: Optional[Callable[[int, float, BaseException], None]] = None,
+):
+    """Send the scoring request through the shared rate-limit scheduler.
+
+    Transient errors are retried there; what remains is mapped to
+    PitchDeckError.
+    """
+    try:
+        return ratelimit.get_scheduler().call(
+            lambda: client.messages.create(
+                model=VALIDATOR_MODEL,
+                max_tokens=VALIDATOR_MAX_OUTPUT_TOKENS,
+                system=system_messages,
+                messages=messages,
+            ),
+            tokens=tokens,
+            on_retry=on_retry,
         )
     except AuthenticationError:
         raise PitchDeckError(
@@ -485,8 +589,6 @@ OUTPUT FORMAT (return ONLY this JSON):
             f"Unexpected {type(e).__name__} calling Claude API: {e}"
         ) from e
 
-    return _parse_validation_response(response)
-
 
 def _parse_validation_response(response) -> dict:
     """Extract structured validation data from Claude response."""
@@ -501,20 +603,21 @@ def _parse_validation_response(response) -> dict:
             f"Unexpected Claude response format: "
             f"expected text block, got {type(content_block).__name__}"
         )
-    raw_text = content_block.text
+    return _parse_validation_text(content_block.text)
 
-    json_match = re.search(r"\{[\s\S]*\}", raw_text)
-    if not json_match:
-        snippet = raw_text[:200] + ("..." if len(raw_text) > 200 else "")
-        raise PitchDeckError(
-            "Failed to parse validation response — "
-            f"no JSON found in Claude output. Response starts with: {snippet}"
-        )
 
+def _parse_validation_text(raw_text: str) -> dict:
+    """Parse the validation JSON in Claude's output text."""
     try:
-        return json.loads(json_match.group())
-    except json.JSONDecodeError as e:
-        extracted = json_match.group()
+        return extract_json_object(raw_text)
+    except JSONExtractError as e:
+        if e.start is None:
+            snippet = raw_text[:200] + ("..." if len(raw_text) > 200 else "")
+            raise PitchDeckError(
+                "Failed to parse validation response — "
+                f"no JSON found in Claude output. Response starts with: {snippet}"
+            ) from e
+        extracted = raw_text[e.start:e.end]
         snippet = extracted[:200] + ("..." if len(extracted) > 200 else "")
         raise PitchDeckError(
             f"Failed to parse validation JSON: {e}. "
@@ -587,6 +690,13 @@ def validate_deck(
     vc_profile: VCProfile,
     pass_threshold: int = 60,
     skip_llm: bool = False,
+    max_input_tokens: Optional[int] = None,
+    on_preflight: Optional[Callable[[PromptEstimate], None]] = None,
+    slide_scores: Optional[List[SlideValidationScore]] = None,
+    client: Optional[Anthropic] = None,
+    use_llm_cache: bool = True,
+    on_call: Optional[Callable[[CallMetrics], None]] = None,
+    backend: Optional[LLMBackend] = None,
 ) -> DeckValidationResult:
     """Validate a pitch deck using rule-based + optional LLM scoring.
 
@@ -597,13 +707,29 @@ def validate_deck(
         skip_llm: If True, skip LLM scoring (rule-based only).
             When True, LLM dimension weights are set to 0.0 and
             rule-based dimension weights are rescaled to sum to 1.0.
+        max_input_tokens: Refuse the LLM call if its estimated prompt is
+            larger than this (default: fit the context window).
+        on_preflight: Called with the prompt-size estimate before the
+            LLM call is sent, and before an oversized prompt is refused.
+        slide_scores: Precomputed rule-based slide scores. They do not
+            depend on the profile, so fan-out validation computes them
+            once per deck.
+        client: Anthropic client to reuse for the LLM call.
+        use_llm_cache: Answer an identical earlier LLM request from the
+            response cache.
+        on_call: Called with the LLM call's token usage and latency.
+        backend: Where the LLM request goes (default: the Anthropic API;
+            see pitchdeck.engine.backends).
 
     Returns:
         DeckValidationResult with dimension scores, per-slide scores,
         custom check results, and prioritized improvements.
     """
-    # 1. Rule-based per-slide scoring
-    slide_scores = [_score_slide_rules(slide) for slide in deck.slides]
+    # 1. Rule-based per-slide scoring (profile-independent)
+    if slide_scores is None:
+        slide_scores = score_slides(deck)
+    else:
+        slide_scores = list(slide_scores)  # LLM notes replace entries below
 
     # 2. Rule-based dimension scoring
     completeness = _score_completeness(deck, vc_profile)
@@ -617,7 +743,10 @@ def validate_deck(
         rule_summary = _build_rule_summary(
             slide_scores, completeness, metrics_density, custom_check_results
         )
-        llm_data = _score_qualitative(deck, vc_profile, rule_summary)
+        llm_data = _score_qualitative(
+            deck, vc_profile, rule_summary, max_input_tokens, on_preflight, client,
+            use_llm_cache, on_call, backend,
+        )
 
         def _extract_dimension(data: dict, key: str) -> dict:
             """Safely extract a dimension dict from LLM response."""
@@ -746,3 +875,84 @@ def validate_deck(
         improvement_priorities=improvement_priorities,
         recommendation=recommendation,
     )
+
+
+def validate_deck_against_profiles(
+    deck: PitchDeck,
+    vc_profiles: Dict[str, VCProfile],
+    pass_threshold: int = 60,
+    skip_llm: bool = False,
+    max_input_tokens: Optional[int] = None,
+    max_workers: int = DEFAULT_FANOUT_WORKERS,
+    on_result: Optional[Callable[[str], None]] = None,
+    use_llm_cache: bool = True,
+    on_call: Optional[Callable[[CallMetrics], None]] = None,
+    backend: Optional[LLMBackend] = None,
+) -> Dict[str, Union[DeckValidationResult, PitchDeckError]]:
+    """Validate one deck against several VC profiles concurrently.
+
+    Per-slide rule scores are computed once and shared. All LLM calls go
+    through the pooled process-wide client, so workers reuse keep-alive
+    connections, and through the shared rate-limit scheduler, so they
+    queue behind requests/min limits instead of failing. Profiles are
+    scored on a thread pool (the work is network-bound). A failure for
+    one profile does not stop the others: its entry holds the
+    PitchDeckError instead of a result.
+
+    Args:
+        deck: The PitchDeck to validate.
+        vc_profiles: Profiles keyed by profile name.
+        max_workers: Upper bound on concurrent LLM calls.
+        on_result: Called with the profile name as each one finishes.
+        on_call: Called with each LLM call's usage and latency; calls
+            come from the worker threads.
+        backend: Where the LLM requests go (default: the Anthropic API).
+
+    Returns:
+        {profile name: result or error}, in the order of vc_profiles.
+        Each result's target_vc is the profile's name (VCProfile.name).
+    """
+    slide_scores = score_slides(deck)
+    # Without a key each profile fails with the usual message instead
+    needs_key = backend is None or backend.requires_api_key
+    client = (
+        _client(backend)
+        if not skip_llm and (os.environ.get("ANTHROPIC_API_KEY") or not needs_key)
+        else None
+    )
+
+    def _one(vc_profile: VCProfile) -> DeckValidationResult:
+        result = validate_deck(
+            deck,
+            vc_profile,
+            pass_threshold,
+            skip_llm,
+            max_input_tokens=max_input_tokens,
+            slide_scores=slide_scores,
+            client=client,
+            use_llm_cache=use_llm_cache,
+            on_call=on_call,
+            backend=backend,
+        )
+        return result.model_copy(update={"target_vc": vc_profile.name})
+
+    results: Dict[str, Union[DeckValidationResult, PitchDeckError]] = {}
+    workers = max(1, min(max_workers, len(vc_profiles)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_one, profile): name
+            for name, profile in vc_profiles.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except PitchDeckError as e:
+                results[name] = e
+            except Exception as e:
+                results[name] = PitchDeckError(
+                    f"Unexpected {type(e).__name__} validating against {name}: {e}"
+                )
+            if on_result is not None:
+                on_result(name)
+    return {name: results[name] for name in vc_profiles}
@@ -1,6 +1,6 @@
 """Pydantic data models for the pitch deck generator."""
 
-from typing import Dict, List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, computed_field, model_validator
 
@@ -19,6 +19,10 @@ class DocumentParseError(PitchDeckError):
         self.reason = reason
         super().__init__(f"Failed to parse {path}: {reason}")
 
+    def __reduce__(self):
+        # Rebuild from (path, reason) so the error survives a process pool.
+        return (type(self), (self.path, self.reason))
+
 
 class ProfileNotFoundError(PitchDeckError):
     """Raised when VC profile YAML not found."""
@@ -26,6 +30,19 @@ class ProfileNotFoundError(PitchDeckError):
     pass
 
 
+class PromptTooLargeError(PitchDeckError):
+    """Raised before an API call whose estimated input exceeds the budget."""
+
+    def __init__(self, estimate: "PromptEstimate", max_input_tokens: int):
+        self.estimate = estimate
+        self.max_input_tokens = max_input_tokens
+        super().__init__(
+            f"Prompt is too large: ~{estimate.total_tokens} input tokens "
+            f"estimated, budget is {max_input_tokens}. "
+            "Reduce the input documents or lower --token-budget."
+        )
+
+
 class TeamMember(BaseModel):
     name: str
     role: str
@@ -59,6 +76,116 @@ class CompanyProfile(BaseModel):
     raw_document_text: str = ""
 
 
+class DocumentSection(BaseModel):
+    source: str  # file name the section came from
+    index: int  # position within its document, 0-based
+    page: Optional[int] = None  # 1-based page number (PDFs only)
+    heading: str = ""
+    text: str
+
+
+class PromptBlockEstimate(BaseModel):
+    name: str
+    tokens: int
+    cached: bool  # part of the prompt-cache prefix
+
+
+class PromptEstimate(BaseModel):
+    blocks: List[PromptBlockEstimate]
+
+    @computed_field
+    @property
+    def total_tokens(self) -> int:
+        return sum(b.tokens for b in self.blocks)
+
+    @computed_field
+    @property
+    def cached_tokens(self) -> int:
+        return sum(b.tokens for b in self.blocks if b.cached)
+
+    @computed_field
+    @property
+    def uncached_tokens(self) -> int:
+        return self.total_tokens - self.cached_tokens
+
+
+class ExtractedFact(BaseModel):
+    field: str  # CompanyProfile field name
+    value: Union[int, float, str]
+    confidence: float  # 0-1
+    start: int  # character span in raw_document_text
+    end: int
+    snippet: str
+
+
+class DedupeReport(BaseModel):
+    paragraphs_total: int = 0
+    paragraphs_dropped: int = 0
+    chars_saved: int = 0
+    tokens_saved: int = 0
+
+
+class CompactionReport(BaseModel):
+    token_budget: int
+    tokens_before: int
+    tokens_after: int
+    dropped: List[DocumentSection] = Field(default_factory=list)
+
+
+class LLMUsage(BaseModel):
+    """Token counts reported by the API for one call."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+
+class LLMCompletion(BaseModel):
+    """The text and metadata of one Claude call, as kept in the LLM cache."""
+
+    model: str
+    text: str
+    stop_reason: Optional[str] = None
+    usage: LLMUsage = Field(default_factory=LLMUsage)
+    created_at: float = 0.0  # Unix time the response was received
+
+
+class CallMetrics(BaseModel):
+    """Usage and timing of one Claude call."""
+
+    label: str  # e.g. "generate", "generate:proof", "validate:Earlybird"
+    model: str
+    usage: LLMUsage = Field(default_factory=LLMUsage)
+    llm_cache_hit: bool = False  # answered from the LLM response cache
+    time_to_first_byte_s: Optional[float] = None  # streamed calls only
+    latency_s: float = 0.0
+    stop_reason: Optional[str] = None
+    error: Optional[str] = None
+    retries: int = 0  # attempts retried after 429/529/5xx/timeouts
+
+
+class RunMetrics(BaseModel):
+    """All Claude calls of one CLI run, with totals."""
+
+    command: str
+    started_at: str
+    calls: List[CallMetrics] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def totals(self) -> LLMUsage:
+        return LLMUsage(**{
+            field: sum(getattr(c.usage, field) for c in self.calls)
+            for field in LLMUsage.model_fields
+        })
+
+    @computed_field
+    @property
+    def llm_cache_hits(self) -> int:
+        return sum(1 for c in self.calls if c.llm_cache_hit)
+
+
 class VCPartner(BaseModel):
     name: str
     focus: str
@@ -87,6 +214,21 @@ class VCProfile(BaseModel):
     custom_checks: List[str] = Field(default_factory=list)
 
 
+class ProfileSummary(BaseModel):
+    """The searchable fields of one VC profile, as kept in the profile index."""
+
+    profile: str  # file stem, as passed to --vc
+    name: str
+    fund_name: str
+    aum_eur: Optional[float] = None
+    stage_focus: List[str]
+    sector_focus: List[str]
+    geo_focus: List[str]
+    keywords: List[str] = Field(default_factory=list)
+    mtime_ns: int
+    size: int
+
+
 class SlideTemplate(BaseModel):
     slide_type: str
     purpose: str
@@ -2,7 +2,10 @@
 
 from pitchdeck.output.markdown import render_markdown, save_markdown
 from pitchdeck.output.validation_report import (
+    rank_validation_results,
+    render_validation_comparison,
     render_validation_report,
+    save_validation_comparison,
     save_validation_report,
 )
 
@@ -11,4 +14,7 @@ __all__ = [
     "save_markdown",
     "render_validation_report",
     "save_validation_report",
+    "rank_validation_results",
+    "render_validation_comparison",
+    "save_validation_comparison",
 ]
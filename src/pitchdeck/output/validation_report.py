@@ -1,5 +1,7 @@
 """Markdown renderer for deck validation reports."""
 
+from typing import Dict, List, Tuple, Union
+
 from pitchdeck.models import DeckValidationResult
 
 
@@ -153,3 +155,74 @@ def save_validation_report(
     content = render_validation_report(result)
     with open(path, "w") as f:
         f.write(content)
+
+
+def rank_validation_results(
+    results: Dict[str, Union[DeckValidationResult, Exception]],
+) -> List[Tuple[str, DeckValidationResult]]:
+    """Successful results as (profile, result), best overall score first."""
+    ranked = [
+        (name, result) for name, result in results.items()
+        if isinstance(result, DeckValidationResult)
+    ]
+    return sorted(ranked, key=lambda item: (-item[1].overall_score, item[0]))
+
+
+def render_validation_comparison(
+    results: Dict[str, Union[DeckValidationResult, Exception]],
+    report_paths: Dict[str, str],
+) -> str:
+    """Render a ranked Markdown comparison of one deck across VC profiles."""
+    ranked = rank_validation_results(results)
+    deck_name = ranked[0][1].deck_name if ranked else ""
+    lines = [
+        "# Deck Validation Comparison",
+        "",
+        f"**Deck**: {deck_name}",
+        f"**Profiles**: {len(results)}",
+        "",
+        "| Rank | Profile | VC | Overall | Result | Thesis Alignment | VC Checks | Report |",
+        "|------|---------|----|---------|--------|------------------|-----------|--------|",
+    ]
+    for rank, (name, result) in enumerate(ranked, 1):
+        alignment = next(
+            (d.score for d in result.dimension_scores
+             if d.dimension == "thesis_alignment"),
+            0,
+        )
+        passed = sum(1 for c in result.custom_check_results if c.passed)
+        lines.append(
+            f"| {rank} | {name} | {result.target_vc} "
+            f"| {result.overall_score}/100 "
+            f"| {'PASS' if result.pass_fail else 'FAIL'} "
+            f"| {alignment}/100 "
+            f"| {passed}/{len(result.custom_check_results)} "
+            f"| {report_paths.get(name, '')} |"
+        )
+    lines.append("")
+
+    failed = [
+        (name, error) for name, error in results.items()
+        if not isinstance(error, DeckValidationResult)
+    ]
+    if failed:
+        lines.extend(["## Not Scored", ""])
+        for name, error in failed:
+            lines.append(f"- **{name}**: {error}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def save_validation_comparison(
+    results: Dict[str, Union[DeckValidationResult, Exception]],
+    report_paths: Dict[str, str],
+    path: str,
+) -> None:
+    """Save the ranked comparison as a Markdown file.
+
+    Raises OSError if the file cannot be written.
+    """
+    content = render_validation_comparison(results, report_paths)
+    with open(path, "w") as f:
+        f.write(content)
@@ -1,20 +1,253 @@
-"""Document parsers for PDF and DOCX files."""
+"""Document parsers for PDF, DOCX, Markdown, and text files."""
 
-from pitchdeck.models import DocumentParseError
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+from typing import Callable, Iterator, Optional, TypeVar, Union
 
+from pitchdeck.cache import DiskCache, get_cache_dir, hash_file, make_key
+from pitchdeck.models import DocumentSection
 
-def extract_document(path: str) -> str:
-    """Extract text from PDF, DOCX, Markdown, or plain text file."""
-    if path.lower().endswith(".pdf"):
-        from .pdf import extract_pdf
+from . import formats  # noqa: F401 — registers the built-in formats
+from .registry import ParseOptions, ParserSpec, register_parser, resolve_parser
+from .sections import split_markdown
 
-        return extract_pdf(path)
-    elif path.lower().endswith((".docx", ".doc")):
-        from .docx_parser import extract_docx
+# Bump when our own extraction logic changes so stale cache entries are
+# ignored even if the backend library version stays the same.
+PARSER_REVISION = "2"
 
-        return extract_docx(path)
-    elif path.lower().endswith((".md", ".txt")):
-        with open(path, encoding="utf-8") as f:
-            return f.read()
+PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# "layout" runs pymupdf4llm's full layout reconstruction; "fast" uses plain
+# PyMuPDF text extraction with font-size heading detection. DOCX, Markdown,
+# and text files ignore the mode.
+PARSE_MODES = ("layout", "fast")
+
+T = TypeVar("T")
+
+
+def _parser_version(spec: ParserSpec) -> str:
+    if spec.backend is None:
+        return PARSER_REVISION
+    try:
+        return f"{metadata.version(spec.backend)}+{PARSER_REVISION}"
+    except metadata.PackageNotFoundError:
+        return f"unknown+{PARSER_REVISION}"
+
+
+def get_parse_cache() -> DiskCache:
+    """Return the on-disk cache holding extracted document text and sections."""
+    return DiskCache(get_cache_dir("parse"), PARSE_CACHE_MAX_BYTES)
+
+
+def _cache_key(path: str, spec: ParserSpec, options: ParseOptions, kind: str) -> str:
+    option_values = ";".join(
+        f"{name}={getattr(options, name)}" for name in spec.option_keys
+    )
+    return make_key(
+        hash_file(path), spec.name, _parser_version(spec), option_values, kind
+    )
+
+
+def _resolve(
+    path: str, mode: str, pdf_shard_threshold: Optional[int], pdf_workers: Optional[int]
+):
+    if mode not in PARSE_MODES:
+        raise ValueError(f"Unknown parse mode {mode!r}. Use one of: {', '.join(PARSE_MODES)}")
+    spec = resolve_parser(path)
+    return spec, ParseOptions(
+        mode=mode, pdf_shard_threshold=pdf_shard_threshold, pdf_workers=pdf_workers
+    )
+
+
+def extract_document(
+    path: str,
+    use_cache: bool = True,
+    pdf_shard_threshold: Optional[int] = None,
+    mode: str = "layout",
+    pdf_workers: Optional[int] = None,
+) -> str:
+    """Extract text from PDF, DOCX, Markdown, or plain text file.
+
+    The format is sniffed from the file's leading bytes (falling back to
+    the extension), so a mislabelled file still reaches the right parser.
+    PDF and DOCX results are cached on disk keyed by the file's SHA-256
+    plus the parser name, version, and options, so re-running against
+    unchanged inputs skips parsing entirely. Pass use_cache=False to
+    bypass it. PDFs longer than pdf_shard_threshold pages (default:
+    pdf.PAGE_SHARD_THRESHOLD) are extracted page-range-parallel; 0
+    disables sharding; pdf_workers caps that pool (default: CPU count).
+    mode selects "layout" (pymupdf4llm) or "fast" (plain PyMuPDF text)
+    extraction for PDFs.
+    """
+    spec, options = _resolve(path, mode, pdf_shard_threshold, pdf_workers)
+    if not use_cache or not spec.cacheable or not os.path.isfile(path):
+        return spec.extract(path, options)
+
+    cache = get_parse_cache()
+    key = _cache_key(path, spec, options, "text")
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    text = spec.extract(path, options)
+    try:
+        cache.put(key, text)
+    except OSError:
+        pass  # a read-only or full cache dir must never fail the parse
+    return text
+
+
+def _iter_sections(
+    path: str, spec: ParserSpec, options: ParseOptions
+) -> Iterator[DocumentSection]:
+    if spec.iter_pages is not None:
+        chunks = spec.iter_pages(path, options)
     else:
-        raise DocumentParseError(path, "Unsupported format. Use PDF, DOCX, MD, or TXT.")
+        chunks = iter([(None, spec.extract(path, options).splitlines())])
+    source = os.path.basename(path)
+    index = 0
+    for page, lines in chunks:
+        for heading, text in split_markdown(lines):
+            yield DocumentSection(
+                source=source, index=index, page=page, heading=heading, text=text
+            )
+            index += 1
+
+
+def iter_document_sections(
+    path: str,
+    use_cache: bool = True,
+    pdf_shard_threshold: Optional[int] = None,
+    mode: str = "layout",
+    pdf_workers: Optional[int] = None,
+) -> Iterator[DocumentSection]:
+    """Stream a document as heading-delimited sections with source metadata.
+
+    PDFs are read one page range at a time, DOCX one body element at a
+    time, and text files line by line, so memory stays flat regardless of
+    input size. Sections carry their file name, position, page (for
+    PDFs), and heading, so later stages can rank or index them without
+    re-splitting the text. Options and caching behave as in
+    extract_document.
+    """
+    spec, options = _resolve(path, mode, pdf_shard_threshold, pdf_workers)
+    if not use_cache or not spec.cacheable or not os.path.isfile(path):
+        yield from _iter_sections(path, spec, options)
+        return
+
+    cache = get_parse_cache()
+    key = _cache_key(path, spec, options, "sections")
+    cached = cache.get(key)
+    if cached is not None:
+        for line in cached.splitlines():
+            yield DocumentSection.model_validate_json(line)
+        return
+
+    lines = []
+    for section in _iter_sections(path, spec, options):
+        lines.append(section.model_dump_json())
+        yield section
+    # Only reached when the consumer read every section
+    try:
+        cache.put(key, "\n".join(lines))
+    except OSError:
+        pass
+
+
+def _collect_sections(
+    path: str,
+    use_cache: bool,
+    pdf_shard_threshold: Optional[int],
+    mode: str,
+    pdf_workers: Optional[int],
+) -> list[DocumentSection]:
+    return list(
+        iter_document_sections(path, use_cache, pdf_shard_threshold, mode, pdf_workers)
+    )
+
+
+def _resolve_workers(workers: Optional[int], n_docs: int) -> int:
+    """Clamp a requested worker count; 0/None means one per document up to CPU count."""
+    if not workers:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, n_docs))
+
+
+def _pdf_worker_share(n_workers: int) -> Optional[int]:
+    """CPUs each document worker may use for PDF sharding.
+
+    Splitting the CPU count keeps a pool of document workers, each with
+    its own shard pool, from oversubscribing the machine. None (use every
+    CPU) when documents are parsed one at a time.
+    """
+    if n_workers == 1:
+        return None
+    return max(1, (os.cpu_count() or 1) // n_workers)
+
+
+def _map_in_order(
+    func: Callable[..., T], paths: list[str], workers: Optional[int], *args
+) -> Iterator[tuple[str, Union[T, BaseException]]]:
+    """Run func(path, *args) for each path, yielding (path, result_or_error) in order.
+
+    With more than one worker the calls run in a process pool (PDF layout
+    analysis is CPU-bound, so threads would not help). Failures are
+    yielded as the exception instead of being raised, so callers can
+    report per-file OK/FAIL and stop wherever they choose.
+    """
+    n_workers = _resolve_workers(workers, len(paths))
+    if n_workers == 1:
+        for path in paths:
+            try:
+                yield path, func(path, *args)
+            except Exception as e:
+                yield path, e
+        return
+
+    executor = ProcessPoolExecutor(max_workers=n_workers)
+    try:
+        futures = [executor.submit(func, path, *args) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                yield path, future.result()
+            except Exception as e:
+                yield path, e
+    finally:
+        # Callers may stop at the first failure — don't wait on the rest.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def extract_documents(
+    paths: list[str],
+    workers: Optional[int] = 1,
+    use_cache: bool = True,
+    pdf_shard_threshold: Optional[int] = None,
+    mode: str = "layout",
+) -> Iterator[tuple[str, Union[str, BaseException]]]:
+    """Extract several documents, yielding (path, text_or_error) in input order.
+
+    Documents are parsed concurrently when workers > 1 (0/None = one per
+    document, up to CPU count); the CPUs are then shared out among the
+    workers for sharded PDFs.
+    """
+    n_workers = _resolve_workers(workers, len(paths))
+    return _map_in_order(
+        extract_document, paths, n_workers, use_cache, pdf_shard_threshold, mode,
+        _pdf_worker_share(n_workers),
+    )
+
+
+def extract_documents_sections(
+    paths: list[str],
+    workers: Optional[int] = 1,
+    use_cache: bool = True,
+    pdf_shard_threshold: Optional[int] = None,
+    mode: str = "layout",
+) -> Iterator[tuple[str, Union[list[DocumentSection], BaseException]]]:
+    """Like extract_documents, but yields each document's sections."""
+    n_workers = _resolve_workers(workers, len(paths))
+    return _map_in_order(
+        _collect_sections, paths, n_workers, use_cache, pdf_shard_threshold, mode,
+        _pdf_worker_share(n_workers),
+    )
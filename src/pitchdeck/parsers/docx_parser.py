@@ -1,38 +1,195 @@
-"""DOCX document parser using python-docx."""
+"""Streaming DOCX document parser.
 
-import os
+Reads ``word/document.xml`` straight from the zip with iterparse instead of
+building a python-docx object model, so large briefs parse quickly in
+bounded memory, and emits tables (where our KPI data lives) as Markdown.
+"""
 
-from docx import Document
+import os
+import re
+import zipfile
+from typing import Iterator, Optional
+from xml.etree import ElementTree
 
 from pitchdeck.models import DocumentParseError
 
+DOCUMENT_PART = "word/document.xml"
+STYLES_PART = "word/styles.xml"
+
+# Default heading level when a "Heading ..." style carries no number
+DEFAULT_HEADING_LEVEL = 2
+
+HEADING_STYLE_RE = re.compile(r"heading\s*(\d*)", re.IGNORECASE)
+
 
 def extract_docx(path: str) -> str:
     """Extract DOCX content as Markdown-formatted text.
 
-    Preserves heading hierarchy and paragraph structure.
+    Preserves heading hierarchy and paragraph structure, and renders
+    tables as Markdown tables in document order.
+    """
+    return "\n\n".join(iter_docx_blocks(path))
+
+
+def iter_docx_blocks(path: str) -> Iterator[str]:
+    """Yield Markdown blocks (headings, paragraphs, tables) in document order.
+
+    Each top-level body element is rendered as soon as its closing tag is
+    parsed and then discarded, so memory is bounded by the largest single
+    paragraph or table rather than the whole document.
     """
     if not os.path.exists(path):
         raise DocumentParseError(path, "File not found")
     try:
-        doc = Document(path)
-    except Exception as e:
+        archive = zipfile.ZipFile(path)
+    except (zipfile.BadZipFile, OSError) as e:
         raise DocumentParseError(path, str(e)) from e
 
-    sections = []
-    for para in doc.paragraphs:
-        style = para.style.name
-        text = para.text.strip()
-        if not text:
-            continue
-        if style.startswith("Heading"):
-            level_str = style.split()[-1]
+    with archive:
+        try:
+            heading_levels = _read_heading_styles(archive)
+            stream = archive.open(DOCUMENT_PART)
+        except KeyError as e:
+            raise DocumentParseError(path, f"Not a Word document: {e}") from e
+        except ElementTree.ParseError as e:
+            raise DocumentParseError(path, f"Malformed styles.xml: {e}") from e
+
+        with stream:
             try:
-                level = int(level_str)
-            except ValueError:
-                level = 2
-            sections.append(f"{'#' * level} {text}")
-        else:
-            sections.append(text)
-
-    return "\n\n".join(sections)
+                yield from _iter_body_blocks(stream, heading_levels)
+            except ElementTree.ParseError as e:
+                raise DocumentParseError(path, f"Malformed document.xml: {e}") from e
+
+
+def _local(tag: str) -> str:
+    """Strip the XML namespace, so transitional and strict OOXML both match."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _attr(elem, name: str) -> Optional[str]:
+    for key, value in elem.attrib.items():
+        if _local(key) == name:
+            return value
+    return None
+
+
+def _read_heading_styles(archive: zipfile.ZipFile) -> dict[str, int]:
+    """Map paragraph style IDs to heading levels using word/styles.xml."""
+    try:
+        data = archive.read(STYLES_PART)
+    except KeyError:
+        return {}
+    levels = {}
+    for style in ElementTree.fromstring(data):
+        if _local(style.tag) != "style":
+            continue
+        style_id = _attr(style, "styleId")
+        name = next(
+            (_attr(child, "val") for child in style if _local(child.tag) == "name"),
+            None,
+        )
+        level = _heading_level(name or "")
+        if style_id and level:
+            levels[style_id] = level
+    return levels
+
+
+def _heading_level(style_name: str) -> Optional[int]:
+    """Return the level for a "heading 2" style name or "Heading2" style ID."""
+    match = HEADING_STYLE_RE.match(style_name)
+    if not match:
+        return None
+    return int(match.group(1)) if match.group(1) else DEFAULT_HEADING_LEVEL
+
+
+def _iter_body_blocks(stream, heading_levels: dict[str, int]) -> Iterator[str]:
+    path_tags: list[str] = []
+    parents: list = []
+    for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+        tag = _local(elem.tag)
+        if event == "start":
+            path_tags.append(tag)
+            parents.append(elem)
+            continue
+
+        path_tags.pop()
+        parents.pop()
+        # Top-level blocks sit directly under <w:body>, or inside a body-level
+        # content control (<w:sdt><w:sdtContent>).
+        container = path_tags[-1] if path_tags else ""
+        is_block = container == "body" or (
+            container == "sdtContent" and "tbl" not in path_tags
+        )
+        if not is_block or tag not in ("p", "tbl"):
+            continue
+
+        block = (
+            _render_paragraph(elem, heading_levels)
+            if tag == "p"
+            else _render_table(elem)
+        )
+        if block:
+            yield block
+        # Drop the finished subtree so the tree never grows with the document
+        parents[-1].remove(elem)
+
+
+def _paragraph_text(p) -> str:
+    parts = []
+    for node in p.iter():
+        tag = _local(node.tag)
+        if tag == "t" and node.text:
+            parts.append(node.text)
+        elif tag == "tab":
+            parts.append("\t")
+        elif tag in ("br", "cr"):
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _render_paragraph(p, heading_levels: dict[str, int]) -> str:
+    text = _paragraph_text(p).strip()
+    if not text:
+        return ""
+    style_id = None
+    for child in p:
+        if _local(child.tag) == "pPr":
+            for prop in child:
+                if _local(prop.tag) == "pStyle":
+                    style_id = _attr(prop, "val")
+            break
+    level = heading_levels.get(style_id or "") or _heading_level(style_id or "")
+    if level:
+        return f"{'#' * level} {text}"
+    return text
+
+
+def _render_table(tbl) -> str:
+    rows = []
+    for tr in tbl:
+        if _local(tr.tag) != "tr":
+            continue
+        cells = []
+        for tc in tr:
+            if _local(tc.tag) != "tc":
+                continue
+            paragraphs = [
+                _paragraph_text(p).strip()
+                for p in tc.iter()
+                if _local(p.tag) == "p"
+            ]
+            cell = " ".join(text for text in paragraphs if text)
+            cells.append(cell.replace("|", "\\|").replace("\n", " "))
+        if any(cells):
+            rows.append(cells)
+    if not rows:
+        return ""
+
+    width = max(len(row) for row in rows)
+    rows = [row + [""] * (width - len(row)) for row in rows]
+    lines = [
+        "| " + " | ".join(rows[0]) + " |",
+        "|" + "---|" * width,
+    ]
+    lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+    return "\n".join(lines)
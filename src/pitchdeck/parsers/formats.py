@@ -0,0 +1,203 @@
+"""Built-in document formats: sniffers and lazily-importing extractors."""
+
+import struct
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from pitchdeck.models import DocumentParseError
+
+from .registry import PageChunks, ParseOptions, ParserSpec, register_parser
+
+PDF_MAGIC = b"%PDF-"
+ZIP_MAGIC = b"PK\x03\x04"
+OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+DOCX_CONTENT_TYPE = b"wordprocessingml.document.main+xml"
+# Zip local file header: signature, version, flags, method, time, date,
+# CRC-32, compressed size, uncompressed size, name length, extra length
+_ZIP_LOCAL = struct.Struct("<4sHHHHHIIIHH")
+
+
+# --- PDF ---------------------------------------------------------------------
+
+
+def _sniff_pdf(header: bytes, path: str) -> bool:
+    # Only a leading marker (after a BOM or whitespace) counts: text that
+    # merely mentions "%PDF-" must not be routed here. PDFs with other junk
+    # before the marker still resolve by their .pdf extension.
+    return header.lstrip(b"\xef\xbb\xbf").lstrip().startswith(PDF_MAGIC)
+
+
+def _pdf_kwargs(options: ParseOptions) -> dict:
+    kwargs = {"workers": options.pdf_workers}
+    if options.pdf_shard_threshold is not None:
+        kwargs["shard_threshold"] = options.pdf_shard_threshold
+    return kwargs
+
+
+def _extract_pdf(path: str, options: ParseOptions) -> str:
+    if options.mode == "fast":
+        from .pdf_fast import extract_pdf_fast
+
+        return extract_pdf_fast(path)
+    from .pdf import extract_pdf
+
+    return extract_pdf(path, **_pdf_kwargs(options))
+
+
+def _iter_pdf_pages(path: str, options: ParseOptions) -> PageChunks:
+    if options.mode == "fast":
+        from .pdf_fast import iter_pdf_fast_pages
+
+        pages = iter_pdf_fast_pages(path)
+    else:
+        from .pdf import iter_pdf_pages
+
+        pages = iter_pdf_pages(path, **_pdf_kwargs(options))
+    for page, text in pages:
+        yield page, text.splitlines()
+
+
+# --- DOCX --------------------------------------------------------------------
+
+
+def _sniff_docx(header: bytes, path: str) -> bool:
+    """A zip whose local file headers, within header, show a Word package.
+
+    Only the bytes already read are inspected, never the central
+    directory at the end of the file. A "word/" entry decides it; so does
+    the content type declared in a leading [Content_Types].xml (Excel and
+    PowerPoint packages have one too). When neither fits in the header
+    the file falls back to its extension.
+    """
+    for name, data in _zip_local_entries(header):
+        if name.startswith(b"word/"):
+            return True
+        if name == b"[Content_Types].xml" and data is not None:
+            return DOCX_CONTENT_TYPE in data
+    return False
+
+
+def _zip_local_entries(header: bytes) -> Iterator[tuple[bytes, Optional[bytes]]]:
+    """Yield (name, contents or None) for each zip local file header in header.
+
+    Contents are given when the whole member is stored or deflated within
+    header. Stops at the first entry that cannot be skipped.
+    """
+    offset = 0
+    while header.startswith(ZIP_MAGIC, offset) and offset + _ZIP_LOCAL.size <= len(header):
+        (_, _, flags, method, _, _, _, compressed_size, _,
+         name_length, extra_length) = _ZIP_LOCAL.unpack_from(header, offset)
+        name_start = offset + _ZIP_LOCAL.size
+        data_start = name_start + name_length + extra_length
+        name = header[name_start:name_start + name_length]
+        # Bit 3: sizes follow the data, so the next entry cannot be found
+        sized = not flags & 0x08
+        data_end = data_start + compressed_size
+        data = None
+        if sized and data_end <= len(header):
+            raw = header[data_start:data_end]
+            try:
+                if method == 0:
+                    data = raw
+                elif method == 8:
+                    data = zlib.decompress(raw, -zlib.MAX_WBITS)
+            except zlib.error:
+                pass
+        yield name, data
+        if not sized:
+            return
+        offset = data_end
+
+
+def _extract_docx(path: str, options: ParseOptions) -> str:
+    from .docx_parser import extract_docx
+
+    return extract_docx(path)
+
+
+def _block_lines(blocks: Iterable[str]) -> Iterator[str]:
+    """Flatten Markdown blocks into lines, blank-line separated."""
+    for block in blocks:
+        yield from block.split("\n")
+        yield ""
+
+
+def _iter_docx_pages(path: str, options: ParseOptions) -> PageChunks:
+    from .docx_parser import iter_docx_blocks
+
+    yield None, _block_lines(iter_docx_blocks(path))
+
+
+# --- Legacy binary Word (.doc) ------------------------------------------------
+
+
+def _sniff_ole2(header: bytes, path: str) -> bool:
+    return header.startswith(OLE2_MAGIC)
+
+
+def _reject_ole2(path: str, options: ParseOptions) -> str:
+    raise DocumentParseError(
+        path,
+        "Legacy binary Office file (e.g. Word .doc) is not supported. "
+        "Save it as DOCX or PDF and try again.",
+    )
+
+
+# --- Markdown / plain text ------------------------------------------------------
+
+
+def _sniff_text(header: bytes, path: str) -> bool:
+    if b"\x00" in header:
+        return False
+    # The header may cut a multi-byte character in half — allow for that
+    for trim in range(4):
+        try:
+            header[: len(header) - trim].decode("utf-8")
+            return True
+        except UnicodeDecodeError:
+            continue
+    return False
+
+
+def _extract_text(path: str, options: ParseOptions) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _iter_text_pages(path: str, options: ParseOptions) -> PageChunks:
+    with open(path, encoding="utf-8") as f:
+        yield None, f
+
+
+register_parser(ParserSpec(
+    name="pdf",
+    sniff=_sniff_pdf,
+    extract=_extract_pdf,
+    iter_pages=_iter_pdf_pages,
+    extensions=(".pdf",),
+    backend="pymupdf4llm",
+    option_keys=("mode", "pdf_shard_threshold"),
+))
+register_parser(ParserSpec(
+    name="docx",
+    sniff=_sniff_docx,
+    extract=_extract_docx,
+    iter_pages=_iter_docx_pages,
+    extensions=(".docx",),
+))
+register_parser(ParserSpec(
+    name="ole2",
+    sniff=_sniff_ole2,
+    extract=_reject_ole2,
+    cacheable=False,
+))
+register_parser(ParserSpec(
+    name="text",
+    sniff=_sniff_text,
+    extract=_extract_text,
+    iter_pages=_iter_text_pages,
+    extensions=(".md", ".txt"),
+    weak=True,
+    # Hashing a text file costs as much as reading it
+    cacheable=False,
+))
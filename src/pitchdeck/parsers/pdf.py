@@ -1,21 +1,121 @@
 """PDF document parser using pymupdf4llm."""
 
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator, Optional
 
+import pymupdf
 import pymupdf4llm
 
 from pitchdeck.models import DocumentParseError
 
+# PDFs with more pages than this are split into page ranges and extracted
+# across a process pool. 0 disables sharding.
+PAGE_SHARD_THRESHOLD = 60
+PAGE_SHARD_SIZE = 16
 
-def extract_pdf(path: str) -> str:
+
+def extract_pdf(
+    path: str,
+    shard_threshold: int = PAGE_SHARD_THRESHOLD,
+    workers: Optional[int] = None,
+) -> str:
     """Extract PDF content as LLM-ready Markdown.
 
     Uses pymupdf4llm which preserves headings, tables, and lists
-    in a format optimized for LLM consumption.
+    in a format optimized for LLM consumption. Documents longer than
+    shard_threshold pages are extracted page-range-parallel and stitched
+    back together with a ``<!-- page N -->`` marker before each page.
     """
     if not os.path.exists(path):
         raise DocumentParseError(path, "File not found")
+    page_count = _page_count(path)
+    if shard_threshold and page_count > shard_threshold:
+        return "\n\n".join(
+            f"<!-- page {page} -->\n\n{text.strip()}"
+            for page, text in iter_pdf_pages(path, shard_threshold, workers)
+        )
     try:
         return pymupdf4llm.to_markdown(path)
     except Exception as e:
         raise DocumentParseError(path, str(e)) from e
+
+
+def _page_count(path: str) -> int:
+    """Return the page count, or 0 if PyMuPDF cannot open the file.
+
+    A file that fails here is handed to pymupdf4llm unsharded, which then
+    reports the real parse error.
+    """
+    try:
+        with pymupdf.open(path) as doc:
+            return doc.page_count
+    except Exception:
+        return 0
+
+
+def _page_shards(page_count: int, shard_size: int = PAGE_SHARD_SIZE) -> list[list[int]]:
+    """Split 0-based page numbers into contiguous ranges of shard_size."""
+    return [
+        list(range(start, min(start + shard_size, page_count)))
+        for start in range(0, page_count, shard_size)
+    ]
+
+
+def _extract_shard(path: str, pages: list[int]) -> list[str]:
+    """Extract one page range, returning the Markdown of each page in order."""
+    chunks = pymupdf4llm.to_markdown(path, pages=pages, page_chunks=True)
+    return [chunk["text"] for chunk in chunks]
+
+
+def iter_pdf_pages(
+    path: str,
+    shard_threshold: int = PAGE_SHARD_THRESHOLD,
+    workers: Optional[int] = None,
+) -> Iterator[tuple[int, str]]:
+    """Yield (page_number, markdown) for each page, one page range at a time.
+
+    Below shard_threshold pages only one range is held in memory at once.
+    Above it the ranges are extracted in a pool of up to workers
+    processes (default: CPU count), still yielded in page order. At most
+    one range per worker is in flight, so a slow consumer never leaves
+    more than that many ranges waiting in memory.
+    """
+    if not os.path.exists(path):
+        raise DocumentParseError(path, "File not found")
+    page_count = _page_count(path)
+    if page_count == 0:
+        # Unreadable by PyMuPDF — whole-file extraction reports the real error
+        yield 1, extract_pdf(path, shard_threshold=0)
+        return
+
+    shards = _page_shards(page_count)
+    try:
+        if shard_threshold and page_count > shard_threshold:
+            max_workers = max(1, min(workers or os.cpu_count() or 1, len(shards)))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                queued = iter(shards)
+                pending = deque(
+                    (pages, executor.submit(_extract_shard, path, pages))
+                    for pages in islice(queued, max_workers)
+                )
+                while pending:
+                    pages, future = pending.popleft()
+                    texts = future.result()
+                    # Refill before yielding so the pool stays busy
+                    for next_pages in islice(queued, 1):
+                        pending.append(
+                            (next_pages, executor.submit(_extract_shard, path, next_pages))
+                        )
+                    yield from zip((p + 1 for p in pages), texts)
+        else:
+            for pages in shards:
+                texts = _extract_shard(path, pages)
+                yield from zip((p + 1 for p in pages), texts)
+    except DocumentParseError:
+        raise
+    except Exception as e:
+        raise DocumentParseError(path, str(e)) from e
+
@@ -0,0 +1,100 @@
+"""Pluggable parser registry with content-based format sniffing.
+
+Each format registers a ParserSpec: a sniffer that looks at the first
+bytes of a file, plus extractor callables. Extractors import their heavy
+backends (pymupdf4llm, PyMuPDF, ...) inside the function body, so a
+backend is only loaded when a file of that format is actually parsed.
+Adding a format means calling register_parser — the dispatcher in
+pitchdeck.parsers never changes.
+"""
+
+import os
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+from pitchdeck.models import DocumentParseError
+
+HEADER_BYTES = 4096
+
+
+class ParseOptions(NamedTuple):
+    mode: str = "layout"
+    pdf_shard_threshold: Optional[int] = None
+    # Process count for a sharded PDF; doesn't change the output
+    pdf_workers: Optional[int] = None
+
+
+PageChunks = Iterator[tuple[Optional[int], Iterable[str]]]
+
+
+class ParserSpec(NamedTuple):
+    name: str
+    # (header_bytes, path) -> True if this parser handles the file
+    sniff: Callable[[bytes, str], bool]
+    # (path, options) -> Markdown text
+    extract: Callable[[str, ParseOptions], str]
+    # (path, options) -> (page, markdown_lines) chunks; falls back to extract
+    iter_pages: Optional[Callable[[str, ParseOptions], PageChunks]] = None
+    extensions: tuple[str, ...] = ()
+    # Weak sniffers (e.g. "looks like text") only apply when no magic-byte
+    # sniffer and no file extension claimed the file.
+    weak: bool = False
+    # Distribution whose version is part of the parse cache key
+    backend: Optional[str] = None
+    # ParseOptions fields that change this parser's output (cache key)
+    option_keys: tuple[str, ...] = ()
+    cacheable: bool = True
+
+
+_REGISTRY: dict[str, ParserSpec] = {}
+
+
+def register_parser(spec: ParserSpec) -> None:
+    """Register (or replace) a parser. Sniffers run in registration order."""
+    _REGISTRY[spec.name] = spec
+
+
+def get_parser(name: str) -> ParserSpec:
+    return _REGISTRY[name]
+
+
+def registered_parsers() -> list[ParserSpec]:
+    return list(_REGISTRY.values())
+
+
+def read_header(path: str, size: int = HEADER_BYTES) -> bytes:
+    with open(path, "rb") as f:
+        return f.read(size)
+
+
+def resolve_parser(path: str) -> ParserSpec:
+    """Pick the parser for a file from its leading bytes.
+
+    Order: magic-byte sniffers, then the file extension, then weak
+    sniffers. A missing or unreadable file falls back to the extension so
+    the extractor reports the error in its usual form.
+    """
+    try:
+        header = read_header(path)
+    except OSError:
+        header = None
+
+    specs = registered_parsers()
+    if header is not None:
+        for spec in specs:
+            if not spec.weak and spec.sniff(header, path):
+                return spec
+
+    ext = os.path.splitext(path)[1].lower()
+    for spec in specs:
+        if ext and ext in spec.extensions:
+            return spec
+
+    if header is not None:
+        for spec in specs:
+            if spec.weak and spec.sniff(header, path):
+                return spec
+
+    supported = sorted({e.lstrip(".").upper() for s in specs for e in s.extensions})
+    raise DocumentParseError(
+        path, f"Unsupported format. Use {', '.join(supported)}."
+    )
@@ -0,0 +1,47 @@
+"""Split extracted Markdown into heading-delimited sections."""
+
+import re
+from typing import Iterable, Iterator
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+
+# Sections longer than this are cut at the next blank line so a document
+# without headings still streams in bounded pieces.
+SECTION_MAX_CHARS = 8000
+
+
+def split_markdown(
+    lines: Iterable[str], max_chars: int = SECTION_MAX_CHARS
+) -> Iterator[tuple[str, str]]:
+    """Yield (heading, text) pairs from Markdown lines, in order.
+
+    A new section starts at every heading outside a code fence. The
+    heading line stays part of the section text; the heading field holds
+    the bare title ("" before the first heading). Overflow pieces of an
+    oversized section repeat their parent heading.
+    """
+    buf: list[str] = []
+    size = 0
+    heading = ""
+    in_fence = False
+
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_RE.match(line)
+        overflow = size >= max_chars and not line.strip() and not in_fence
+        if match or overflow:
+            text = "\n".join(buf).strip()
+            if text:
+                yield heading, text
+            buf = []
+            size = 0
+            if match:
+                heading = match.group(2)
+        buf.append(line)
+        size += len(line) + 1
+
+    text = "\n".join(buf).strip()
+    if text:
+        yield heading, text
@@ -1,5 +1,6 @@
 """VC profile loading and management."""
 
+from pitchdeck.profiles.index import ProfileIndex, load_profile_index
 from pitchdeck.profiles.loader import list_profiles, load_vc_profile
 
-__all__ = ["load_vc_profile", "list_profiles"]
+__all__ = ["load_vc_profile", "list_profiles", "load_profile_index", "ProfileIndex"]
@@ -0,0 +1,170 @@
+"""Searchable index of VC profiles by stage, sector, geography and thesis.
+
+Answering "which funds do series-a enterprise-ai in DACH" from the YAML
+files means loading every profile. The index keeps just the searchable
+fields of each profile in one JSON entry in the profile cache. On open it
+is refreshed incrementally: only files whose mtime or size changed are
+reloaded, and deleted files are dropped.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from pitchdeck.cache import make_key
+from pitchdeck.models import ProfileSummary, VCProfile
+from pitchdeck.profiles.loader import PROFILES_DIR, get_profile_cache, load_vc_profile
+
+# Bump when the stored format or keyword extraction changes
+PROFILE_INDEX_REVISION = "1"
+
+FACETS = ("stage_focus", "sector_focus", "geo_focus")
+
+
+def normalize_tag(value: str) -> str:
+    """Canonical form of a facet value: "Series A" and "series-a" match."""
+    return "-".join(value.lower().replace("_", " ").split())
+
+
+def thesis_keywords(profile: VCProfile) -> list[str]:
+    """Distinct keywords from a profile's thesis points, in order of use."""
+    from pitchdeck.engine.retrieval import tokenize
+
+    return list(dict.fromkeys(tokenize(" ".join(profile.thesis_points))))
+
+
+class ProfileIndex:
+    """Profile summaries plus per-facet postings (tag -> profile names)."""
+
+    def __init__(self, entries: dict[str, ProfileSummary]):
+        self.entries = entries
+        self.skipped: list[str] = []
+        self.postings: dict[str, dict[str, set[str]]] = {f: {} for f in FACETS}
+        self.postings["keywords"] = {}
+        for entry in entries.values():
+            for facet in FACETS:
+                for tag in getattr(entry, facet):
+                    self.postings[facet].setdefault(
+                        normalize_tag(tag), set()
+                    ).add(entry.profile)
+            for keyword in entry.keywords:
+                self.postings["keywords"].setdefault(keyword, set()).add(
+                    entry.profile
+                )
+
+    def search(
+        self,
+        stage: Optional[list[str]] = None,
+        sector: Optional[list[str]] = None,
+        geo: Optional[list[str]] = None,
+        keywords: Optional[list[str]] = None,
+        min_aum_eur: Optional[float] = None,
+    ) -> list[ProfileSummary]:
+        """Return matching profiles, sorted by name.
+
+        Several values for one facet match any of them; different facets
+        and every keyword must all match.
+        """
+        candidates = set(self.entries)
+        for facet, values in zip(FACETS, (stage, sector, geo)):
+            if values:
+                matched: set[str] = set()
+                for value in values:
+                    matched |= self.postings[facet].get(normalize_tag(value), set())
+                candidates &= matched
+        if keywords:
+            from pitchdeck.engine.retrieval import tokenize
+
+            for keyword in tokenize(" ".join(keywords)):
+                candidates &= self.postings["keywords"].get(keyword, set())
+        if min_aum_eur is not None:
+            candidates = {
+                name for name in candidates
+                if (self.entries[name].aum_eur or 0) >= min_aum_eur
+            }
+        return [self.entries[name] for name in sorted(candidates)]
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "revision": PROFILE_INDEX_REVISION,
+            "entries": [entry.model_dump() for entry in self.entries.values()],
+        })
+
+    @classmethod
+    def from_json(cls, data: str) -> Optional["ProfileIndex"]:
+        """Rebuild a stored index, or None if it is corrupt or outdated."""
+        try:
+            payload = json.loads(data)
+            if payload.get("revision") != PROFILE_INDEX_REVISION:
+                return None
+            entries = [ProfileSummary(**e) for e in payload["entries"]]
+        except (ValueError, KeyError, TypeError):
+            return None
+        return cls({entry.profile: entry for entry in entries})
+
+
+def _summarize(name: str, profile: VCProfile, st: os.stat_result) -> ProfileSummary:
+    return ProfileSummary(
+        profile=name,
+        name=profile.name,
+        fund_name=profile.fund_name,
+        aum_eur=profile.aum_eur,
+        stage_focus=profile.stage_focus,
+        sector_focus=profile.sector_focus,
+        geo_focus=profile.geo_focus,
+        keywords=thesis_keywords(profile),
+        mtime_ns=st.st_mtime_ns,
+        size=st.st_size,
+    )
+
+
+def load_profile_index(
+    profiles_dir: Optional[Path] = None, use_cache: bool = True
+) -> ProfileIndex:
+    """Return the index for a profiles directory, refreshing changed files.
+
+    Unchanged profiles are served from the stored index without being
+    opened. Profiles that fail to load are left out and listed in
+    ``skipped``; they are retried on the next call.
+    """
+    search_dir = profiles_dir or PROFILES_DIR
+    cache = get_profile_cache()
+    key = make_key("index", str(search_dir.resolve()), PROFILE_INDEX_REVISION)
+    stored = None
+    if use_cache:
+        cached = cache.get(key)
+        stored = ProfileIndex.from_json(cached) if cached is not None else None
+    previous = stored.entries if stored is not None else {}
+
+    entries: dict[str, ProfileSummary] = {}
+    skipped: list[str] = []
+    changed = False
+    try:
+        files = [f for f in os.scandir(search_dir) if f.name.endswith(".yaml")]
+    except FileNotFoundError:
+        files = []
+    for file in files:
+        name = file.name[: -len(".yaml")]
+        st = file.stat()
+        entry = previous.get(name)
+        if entry is not None and (entry.mtime_ns, entry.size) == (st.st_mtime_ns, st.st_size):
+            entries[name] = entry
+            continue
+        changed = True
+        try:
+            profile = load_vc_profile(name, search_dir, use_cache=use_cache)
+        except Exception:  # malformed YAML or a schema error
+            skipped.append(name)
+            continue
+        entries[name] = _summarize(name, profile, st)
+    changed = changed or set(entries) != set(previous)
+
+    index = ProfileIndex(entries)
+    index.skipped = sorted(skipped)
+    if use_cache and changed:
+        try:
+            cache.put(key, index.to_json())
+        except OSError:
+            pass  # a read-only or full cache dir must never fail the lookup
+    return index
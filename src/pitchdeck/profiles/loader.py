@@ -1,35 +1,114 @@
-"""YAML-based VC profile loader with Pydantic validation."""
+"""YAML-based VC profile loader with Pydantic validation.
 
+Parsing YAML with ruamel's round-trip loader and validating the result
+is the slow part of loading a profile, so the validated profile is
+compiled to JSON in the cache directory and reloaded with
+``model_validate_json``. An entry is reused while the YAML's mtime is
+unchanged; if only the mtime moved (touch, checkout) the content hash
+decides. Any edit invalidates it automatically.
+"""
+
+import hashlib
+import json
+import os
 from pathlib import Path
 from typing import Optional
 
-from ruamel.yaml import YAML
-
+from pitchdeck.cache import DiskCache, get_cache_dir, make_key
 from pitchdeck.models import ProfileNotFoundError, VCProfile
 
 PROFILES_DIR = Path(__file__).parent.parent.parent.parent / "profiles"
 
+PROFILE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Bump when compilation changes; the VCProfile field list is part of the
+# key too, so adding a model field invalidates old entries by itself.
+PROFILE_CACHE_REVISION = "1"
+
+
+def get_profile_cache() -> DiskCache:
+    """Return the on-disk cache of compiled (validated, JSON) profiles."""
+    return DiskCache(
+        get_cache_dir("profiles"), PROFILE_CACHE_MAX_BYTES, suffix=".json"
+    )
+
 
 def load_vc_profile(
-    name: str, profiles_dir: Optional[Path] = None
+    name: str, profiles_dir: Optional[Path] = None, use_cache: bool = True
 ) -> VCProfile:
     """Load a VC profile from YAML config.
 
-    Searches for {name}.yaml in the profiles directory.
+    Searches for {name}.yaml in the profiles directory. With use_cache,
+    a compiled copy is reused while the YAML is unchanged.
     """
     search_dir = profiles_dir or PROFILES_DIR
     profile_path = search_dir / f"{name}.yaml"
-    if not profile_path.exists():
+    try:
+        st = profile_path.stat()
+    except FileNotFoundError:
         available = [p.stem for p in search_dir.glob("*.yaml")]
         raise ProfileNotFoundError(
             f"Profile '{name}' not found. Available: {', '.join(available)}"
         )
-    yaml = YAML()
-    with open(profile_path) as f:
-        raw = yaml.load(f)
+    if not use_cache:
+        return _compile_profile(profile_path.read_bytes())
+
+    cache = get_profile_cache()
+    key = _cache_key(profile_path)
+    data = None
+    cached = cache.get(key)
+    if cached is not None:
+        try:
+            header, _, profile_json = cached.partition("\n")
+            meta = json.loads(header)
+            if (meta["mtime_ns"], meta["size"]) == (st.st_mtime_ns, st.st_size):
+                return VCProfile.model_validate_json(profile_json)
+            # mtime moved: only the content hash tells an edit from a touch
+            data = profile_path.read_bytes()
+            if meta["sha256"] == hashlib.sha256(data).hexdigest():
+                profile = VCProfile.model_validate_json(profile_json)
+                _store(cache, key, st, data, profile_json)
+                return profile
+        except (ValueError, KeyError):
+            pass  # corrupt or outdated entry — recompile below
+
+    if data is None:
+        data = profile_path.read_bytes()
+    profile = _compile_profile(data)
+    _store(cache, key, st, data, profile.model_dump_json())
+    return profile
+
+
+def _cache_key(profile_path: Path) -> str:
+    return make_key(
+        str(profile_path.resolve()),
+        PROFILE_CACHE_REVISION,
+        ",".join(VCProfile.model_fields),
+    )
+
+
+def _compile_profile(data: bytes) -> VCProfile:
+    # Only a cache miss pays for importing ruamel
+    from ruamel.yaml import YAML
+
+    raw = YAML().load(data)
     return VCProfile(**raw)
 
 
+def _store(
+    cache: DiskCache, key: str, st: os.stat_result, data: bytes, profile_json: str
+) -> None:
+    header = json.dumps({
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "sha256": hashlib.sha256(data).hexdigest(),
+    })
+    try:
+        cache.put(key, f"{header}\n{profile_json}")
+    except OSError:
+        pass  # a read-only or full cache dir must never fail the load
+
+
 def list_profiles(profiles_dir: Optional[Path] = None) -> list[str]:
     """List available VC profile names."""
     search_dir = profiles_dir or PROFILES_DIR
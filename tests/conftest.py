@@ -1,5 +1,9 @@
 """Shared test fixtures for pitch deck generator."""
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from ruamel.yaml import YAML
 
@@ -17,6 +21,132 @@ from pitchdeck.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point every on-disk cache at a per-test scratch directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("PITCHDECK_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def instant_retries():
+    """Retry transient API errors without backoff delays."""
+    from pitchdeck.engine.ratelimit import RequestScheduler, set_scheduler
+
+    set_scheduler(RequestScheduler(base_delay=0))
+    yield
+    set_scheduler(None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients():
+    """Don't let one test's shared API client leak into the next."""
+    from pitchdeck.engine.clients import reset_clients
+
+    yield
+    reset_clients()
+
+
+class FakeAnthropicServer:
+    """Local HTTP server standing in for the Messages API.
+
+    ``responses`` is consumed one per request: (status, headers, body),
+    where a list body is sent as server-sent events. When it runs out,
+    ``default`` is repeated. Request bodies are kept in ``requests``
+    and client addresses in ``connections``.
+    """
+
+    def __init__(self):
+        self.responses: list = []
+        self.default = self.error(500, "api_error")
+        self.requests: list[dict] = []
+        self.connections: set = set()  # client (host, port) pairs seen
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_POST(self):
+                length = int(self.headers.get("content-length", 0))
+                server.requests.append(json.loads(self.rfile.read(length)))
+                server.connections.add(self.client_address)
+                status, headers, body = (
+                    server.responses.pop(0) if server.responses else server.default
+                )
+                if isinstance(body, list):
+                    payload = "".join(
+                        f"event: {e['type']}\ndata: {json.dumps(e)}\n\n" for e in body
+                    ).encode()
+                    content_type = "text/event-stream"
+                else:
+                    payload = json.dumps(body).encode()
+                    content_type = "application/json"
+                self.send_response(status)
+                self.send_header("content-type", content_type)
+                self.send_header("content-length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    @staticmethod
+    def error(status: int, error_type: str, headers: dict = None):
+        body = {"type": "error", "error": {"type": error_type, "message": error_type}}
+        return (status, headers or {}, body)
+
+    @staticmethod
+    def message(text: str):
+        return (200, {}, {
+            "id": "msg_fake", "type": "message", "role": "assistant",
+            "model": "claude-sonnet-4-6",
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn", "stop_sequence": None,
+            "usage": {"input_tokens": 100, "output_tokens": 50},
+        })
+
+    @staticmethod
+    def stream(text: str, chunk_size: int = 40):
+        message = FakeAnthropicServer.message("")[2]
+        events = [
+            {"type": "message_start", "message": {**message, "content": [], "stop_reason": None}},
+            {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+        ]
+        events += [
+            {"type": "content_block_delta", "index": 0,
+             "delta": {"type": "text_delta", "text": text[i:i + chunk_size]}}
+            for i in range(0, len(text), chunk_size)
+        ]
+        events += [
+            {"type": "content_block_stop", "index": 0},
+            {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+             "usage": {"output_tokens": 50}},
+            {"type": "message_stop"},
+        ]
+        return (200, {}, events)
+
+
+@pytest.fixture
+def fake_anthropic(monkeypatch):
+    """A FakeAnthropicServer that real Anthropic clients talk to."""
+    server = FakeAnthropicServer()
+    thread = threading.Thread(
+        target=server.httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", server.url)
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
 @pytest.fixture
 def sample_company():
     return CompanyProfile(
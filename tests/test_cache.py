@@ -0,0 +1,97 @@
+"""Tests for the shared on-disk cache."""
+
+import os
+
+from pitchdeck.cache import DiskCache, get_cache_dir, hash_file, make_key
+
+
+class TestCacheDir:
+    def test_env_override(self, isolated_cache_dir):
+        assert get_cache_dir() == isolated_cache_dir
+        assert get_cache_dir("parse") == isolated_cache_dir / "parse"
+
+
+class TestHashing:
+    def test_hash_file_matches_content(self, tmp_path):
+        a = tmp_path / "a.bin"
+        b = tmp_path / "b.bin"
+        a.write_bytes(b"same bytes")
+        b.write_bytes(b"same bytes")
+        assert hash_file(str(a)) == hash_file(str(b))
+        b.write_bytes(b"other bytes")
+        assert hash_file(str(a)) != hash_file(str(b))
+
+    def test_make_key_separates_parts(self):
+        assert make_key("ab", "c") != make_key("a", "bc")
+
+
+class TestDiskCache:
+    def test_round_trip(self, tmp_path):
+        cache = DiskCache(tmp_path, max_bytes=1024)
+        assert cache.get("k") is None
+        cache.put("k", "value")
+        assert cache.get("k") == "value"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = DiskCache(tmp_path, max_bytes=25)
+        cache.put("old", "x" * 10)
+        cache.put("new", "y" * 10)
+        # Make "old" the most recently used, then overflow the budget
+        os.utime(tmp_path / "new.txt", ns=(1, 1))
+        assert cache.get("old") == "x" * 10
+        cache.put("third", "z" * 10)
+        assert cache.get("new") is None
+        assert cache.get("old") == "x" * 10
+        assert cache.get("third") == "z" * 10
+
+    def test_clear(self, tmp_path):
+        cache = DiskCache(tmp_path, max_bytes=1024)
+        cache.put("k", "value")
+        cache.clear()
+        assert cache.get("k") is None
+
+
+class TestLLMCache:
+    SYSTEM = [{"type": "text", "text": "instructions"}]
+    MESSAGES = [{"role": "user", "content": "Score this deck"}]
+
+    def _key(self, **overrides):
+        from pitchdeck.engine.llm_cache import request_key
+
+        args = dict(
+            model="m", temperature=0.0, system=self.SYSTEM,
+            messages=self.MESSAGES, max_tokens=100,
+        )
+        args.update(overrides)
+        return request_key(**args)
+
+    def test_key_covers_every_request_field(self):
+        base = self._key()
+        assert self._key() == base
+        assert self._key(model="other") != base
+        assert self._key(temperature=1.0) != base
+        assert self._key(max_tokens=200) != base
+        assert self._key(messages=[{"role": "user", "content": "Other"}]) != base
+        assert self._key(system=[{"type": "text", "text": "changed"}]) != base
+
+    def test_round_trip_and_ttl(self):
+        import time
+
+        from pitchdeck.engine import llm_cache
+        from pitchdeck.models import LLMCompletion, LLMUsage
+
+        key = self._key()
+        assert llm_cache.lookup(key) is None
+        llm_cache.store(key, LLMCompletion(
+            model="m", text="{}", usage=LLMUsage(input_tokens=5),
+            created_at=time.time() - 100,
+        ))
+        assert llm_cache.lookup(key).usage.input_tokens == 5
+        assert llm_cache.lookup(key, ttl_seconds=50) is None
+
+    def test_corrupt_entry_is_a_miss(self):
+        from pitchdeck.engine import llm_cache
+
+        key = self._key()
+        llm_cache.get_llm_cache().put(key, "not json")
+        assert llm_cache.lookup(key) is None
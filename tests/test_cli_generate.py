@@ -0,0 +1,79 @@
+"""Tests for the generate CLI command."""
+
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from pitchdeck.cli import app
+
+runner = CliRunner()
+
+
+class TestGenerateCLIParsing:
+    def test_missing_file_reports_fail_and_exits_1(self, tmp_path):
+        good = tmp_path / "brief.md"
+        good.write_text("# Brief\n\nContent", encoding="utf-8")
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            result = runner.invoke(app, [
+                "generate", str(good), str(tmp_path / "missing.pdf"),
+                "--parse-workers", "2",
+            ])
+        output = " ".join(result.output.split())  # undo Rich line wrapping
+        assert result.exit_code == 1
+        assert "OK" in output
+        assert "FAIL" in output
+        assert "File not found" in output
+
+
+class TestEstimateCLI:
+    def test_reports_blocks_without_api_key(self, tmp_path):
+        brief = tmp_path / "brief.md"
+        brief.write_text("# Brief\n\nARR grew 3x to €1.2M.", encoding="utf-8")
+        with patch.dict("os.environ", {}, clear=True):
+            result = runner.invoke(app, ["estimate", str(brief)])
+        output = " ".join(result.output.split())
+        assert result.exit_code == 0
+        assert "company + VC context" in output
+        assert "Within budget" in output
+
+    def test_parses_with_generate_options(self, tmp_path):
+        from pitchdeck.parsers import extract_documents_sections
+
+        brief = tmp_path / "brief.md"
+        brief.write_text("# Brief\n\nARR grew 3x to €1.2M.", encoding="utf-8")
+        with patch(
+            "pitchdeck.parsers.extract_documents_sections",
+            side_effect=extract_documents_sections,
+        ) as extract:
+            result = runner.invoke(app, [
+                "estimate", str(brief), "--no-parse-cache",
+                "--parse-workers", "2", "--pdf-shard-pages", "10",
+            ])
+        assert result.exit_code == 0, result.output
+        kwargs = extract.call_args.kwargs
+        assert kwargs["use_cache"] is False
+        assert kwargs["workers"] == 2
+        assert kwargs["pdf_shard_threshold"] == 10
+
+    def test_over_budget_exits_1(self, tmp_path):
+        brief = tmp_path / "brief.md"
+        brief.write_text("# Brief\n\nARR grew 3x to €1.2M.", encoding="utf-8")
+        result = runner.invoke(
+            app, ["estimate", str(brief), "--max-input-tokens", "100"]
+        )
+        output = " ".join(result.output.split())
+        assert result.exit_code == 1
+        assert "Over budget" in output
+
+    def test_per_slide_lists_retrieved_sections(self, tmp_path):
+        brief = tmp_path / "brief.md"
+        brief.write_text(
+            "# Team\n\nFounders with deep domain expertise.\n\n"
+            "# Traction\n\nARR of EUR 1.2M and 130% net revenue retention.",
+            encoding="utf-8",
+        )
+        result = runner.invoke(app, ["estimate", str(brief), "--per-slide"])
+        output = " ".join(result.output.split())
+        assert result.exit_code == 0
+        assert "Per-slide context" in output
+        assert "traction" in output
@@ -6,6 +6,7 @@ import pytest
 from typer.testing import CliRunner
 
 from pitchdeck.cli import app
+from pitchdeck.models import DocumentSection
 
 runner = CliRunner()
 
@@ -159,6 +160,14 @@ class TestValidateCLISaveErrors:
         assert "Failed to save report" in result.output
 
 
+def _parsed_as_text(paths, **kwargs):
+    """Stand-in for extract_documents_sections: every file parses to 'text'."""
+    return [
+        (path, [DocumentSection(source=path, index=0, text="text")])
+        for path in paths
+    ]
+
+
 class TestGenerateCLISaveErrors:
     def test_save_markdown_failure_exits_1(self, tmp_path):
         """When save_markdown raises OSError, generate command exits non-zero."""
@@ -168,7 +177,10 @@ class TestGenerateCLISaveErrors:
         mock_deck.model_dump_json.return_value = "{}"
 
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            with patch("pitchdeck.parsers.extract_document", return_value="text"):
+            with patch(
+                "pitchdeck.parsers.extract_documents_sections",
+                side_effect=_parsed_as_text,
+            ):
                 with patch("pitchdeck.profiles.load_vc_profile") as mock_profile:
                     mock_profile.return_value = MagicMock(
                         name="VC", thesis_points=["x"],
@@ -196,7 +208,10 @@ class TestGenerateCLISaveErrors:
         mock_deck.model_dump_json.side_effect = OSError("Disk full")
 
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            with patch("pitchdeck.parsers.extract_document", return_value="text"):
+            with patch(
+                "pitchdeck.parsers.extract_documents_sections",
+                side_effect=_parsed_as_text,
+            ):
                 with patch("pitchdeck.profiles.load_vc_profile") as mock_profile:
                     mock_profile.return_value = MagicMock(
                         name="VC", thesis_points=["x"],
@@ -212,3 +227,122 @@ class TestGenerateCLISaveErrors:
                             ])
         assert result.exit_code == 1
         assert "Failed to save JSON" in result.output
+
+
+class TestValidateCLIFanOut:
+    def test_vc_list_writes_comparison_and_reports(
+        self, sample_deck_json, sample_vc_profile, tmp_path
+    ):
+        profiles = {
+            "alpha": sample_vc_profile,
+            "beta": sample_vc_profile.model_copy(update={"name": "Beta VC"}),
+        }
+        output = tmp_path / "report.md"
+        with patch(
+            "pitchdeck.profiles.load_vc_profile", side_effect=profiles.__getitem__
+        ):
+            result = runner.invoke(app, [
+                "validate", str(sample_deck_json),
+                "--vc", "alpha,beta",
+                "--skip-llm",
+                "--output", str(output),
+            ])
+        assert result.exit_code == 0, result.output
+        comparison = output.read_text()
+        assert "| 1 | alpha |" in comparison or "| 1 | beta |" in comparison
+        assert (tmp_path / "report_alpha.md").exists()
+        assert (tmp_path / "report_beta.md").exists()
+        assert "Beta VC" in (tmp_path / "report_beta.md").read_text()
+
+    def test_vc_all_uses_every_profile(self, sample_deck_json, tmp_path):
+        with patch("pitchdeck.profiles.list_profiles", return_value=["earlybird"]):
+            result = runner.invoke(app, [
+                "validate", str(sample_deck_json),
+                "--vc", "all",
+                "--skip-llm",
+                "--output", str(tmp_path / "report.md"),
+            ])
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "report_earlybird.md").exists()
+
+
+class TestValidateCLIMetrics:
+    def test_llm_run_writes_metrics(self, sample_deck_json, tmp_path):
+        from pitchdeck.models import CallMetrics
+
+        def fake_validate(*args, on_call=None, **kwargs):
+            on_call(CallMetrics(label="validate:x", model="claude-sonnet-4-6",
+                                latency_s=1.0))
+            raise RuntimeError("boom")
+
+        output = tmp_path / "report.md"
+        log = tmp_path / "runs.jsonl"
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.validator.validate_deck",
+                      side_effect=fake_validate):
+            result = runner.invoke(app, [
+                "validate", str(sample_deck_json),
+                "--output", str(output),
+                "--metrics-log", str(log),
+            ])
+        assert result.exit_code == 1
+        assert "1 Claude call(s)" in result.output
+        assert (tmp_path / "report.metrics.json").exists()
+        assert len(log.read_text().splitlines()) == 1
+
+    def test_fan_out_failure_still_writes_metrics(
+        self, sample_deck_json, sample_vc_profile, tmp_path
+    ):
+        from pitchdeck.models import CallMetrics
+
+        def fake_validate_many(*args, on_call=None, **kwargs):
+            on_call(CallMetrics(label="validate:x", model="claude-sonnet-4-6",
+                                latency_s=1.0))
+            raise RuntimeError("boom")
+
+        output = tmp_path / "report.md"
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.profiles.load_vc_profile",
+                      return_value=sample_vc_profile), \
+                patch("pitchdeck.engine.validator.validate_deck_against_profiles",
+                      side_effect=fake_validate_many):
+            result = runner.invoke(app, [
+                "validate", str(sample_deck_json),
+                "--vc", "alpha,beta",
+                "--output", str(output),
+            ])
+        assert result.exit_code == 1
+        assert "Unexpected error during validation: RuntimeError" in result.output
+        assert (tmp_path / "report.metrics.json").exists()
+
+    def test_skip_llm_writes_no_metrics(self, sample_deck_json, tmp_path):
+        result = runner.invoke(app, [
+            "validate", str(sample_deck_json), "--skip-llm",
+            "--output", str(tmp_path / "report.md"),
+        ])
+        assert result.exit_code == 0
+        assert not (tmp_path / "report.metrics.json").exists()
+
+
+class TestValidateCLIBackend:
+    def test_mock_backend_needs_no_api_key(
+        self, sample_deck_json, tmp_path, monkeypatch
+    ):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        result = runner.invoke(app, [
+            "validate", str(sample_deck_json),
+            "--llm-backend", "mock",
+            "--output", str(tmp_path / "report.md"),
+        ])
+        assert result.exit_code == 0, result.output
+        assert "mock LLM backend" in result.output
+        assert (tmp_path / "report.metrics.json").exists()
+
+    def test_unknown_backend_exits_1(self, sample_deck_json, tmp_path):
+        result = runner.invoke(app, [
+            "validate", str(sample_deck_json),
+            "--llm-backend", "nope",
+            "--output", str(tmp_path / "report.md"),
+        ])
+        assert result.exit_code == 1
+        assert "Unknown LLM backend" in result.output
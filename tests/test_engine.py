@@ -1,5 +1,6 @@
 """Tests for engine components: slides, gaps, and narrative."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -213,7 +214,7 @@ class TestGenerateDeckAPIErrors:
 
         templates = get_slide_templates(sample_vc_profile)
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "bad-key"}):
-            with patch("pitchdeck.engine.narrative.Anthropic") as mock_anthropic:
+            with patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
                 mock_anthropic.return_value.messages.create.side_effect = (
                     AuthenticationError(
                         message="Invalid API key",
@@ -231,7 +232,7 @@ class TestGenerateDeckAPIErrors:
 
         templates = get_slide_templates(sample_vc_profile)
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            with patch("pitchdeck.engine.narrative.Anthropic") as mock_anthropic:
+            with patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
                 mock_anthropic.return_value.messages.create.side_effect = (
                     RateLimitError(
                         message="Rate limit exceeded",
@@ -249,7 +250,7 @@ class TestGenerateDeckAPIErrors:
 
         templates = get_slide_templates(sample_vc_profile)
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            with patch("pitchdeck.engine.narrative.Anthropic") as mock_anthropic:
+            with patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
                 mock_anthropic.return_value.messages.create.side_effect = (
                     APITimeoutError(request=MagicMock())
                 )
@@ -263,7 +264,7 @@ class TestGenerateDeckAPIErrors:
 
         templates = get_slide_templates(sample_vc_profile)
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            with patch("pitchdeck.engine.narrative.Anthropic") as mock_anthropic:
+            with patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
                 mock_anthropic.return_value.messages.create.side_effect = (
                     APIStatusError(
                         message="Internal server error",
@@ -279,7 +280,7 @@ class TestGenerateDeckAPIErrors:
 
         templates = get_slide_templates(sample_vc_profile)
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            with patch("pitchdeck.engine.narrative.Anthropic") as mock_anthropic:
+            with patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
                 mock_anthropic.return_value.messages.create.side_effect = (
                     ConnectionError("Connection refused")
                 )
@@ -314,3 +315,1239 @@ class TestParseDeckResponseEdgeCases:
 
         with pytest.raises(PitchDeckError, match="Extracted text starts with"):
             _parse_deck_response(mock_response, sample_company, sample_vc_profile)
+
+
+class TestCrossDocumentDedupe:
+    PARAGRAPH = (
+        "Our platform reduces month-end close time for mid-market finance "
+        "teams from twelve days to three by automating reconciliation."
+    )
+    OTHER = (
+        "We raised a 2.5M EUR seed round in 2024 led by a Berlin fund, with "
+        "participation from angels who previously built two fintech unicorns."
+    )
+
+    @staticmethod
+    def _doc(source, *paragraphs):
+        from pitchdeck.models import DocumentSection
+
+        return [DocumentSection(source=source, index=0, text="\n\n".join(paragraphs))]
+
+    def test_drops_exact_repeat_in_later_document(self):
+        from pitchdeck.engine.dedupe import dedupe_documents
+
+        docs, report = dedupe_documents([
+            self._doc("brief.md", self.PARAGRAPH),
+            self._doc("memo.md", self.PARAGRAPH, self.OTHER),
+        ])
+        assert docs[0][0].text == self.PARAGRAPH
+        assert docs[1][0].text == self.OTHER
+        assert report.paragraphs_total == 3
+        assert report.paragraphs_dropped == 1
+        assert report.chars_saved == len(self.PARAGRAPH)
+        assert report.tokens_saved > 0
+
+    def test_drops_near_duplicate_with_small_edit(self):
+        from pitchdeck.engine.dedupe import dedupe_documents
+
+        original = " ".join([self.PARAGRAPH, self.OTHER, self.PARAGRAPH])
+        edited = original.replace("unicorns.", "unicorns!").upper() + " Since 2021."
+        docs, report = dedupe_documents([
+            self._doc("brief.md", original),
+            self._doc("memo.md", edited),
+        ])
+        assert report.paragraphs_dropped == 1
+        assert docs[1] == []
+
+    def test_keeps_repeats_within_one_document(self):
+        from pitchdeck.engine.dedupe import dedupe_documents
+
+        docs, report = dedupe_documents([
+            self._doc("brief.md", self.PARAGRAPH, self.PARAGRAPH),
+        ])
+        assert report.paragraphs_dropped == 0
+        assert docs[0][0].text.count(self.PARAGRAPH) == 2
+
+    def test_keeps_distinct_and_short_paragraphs(self):
+        from pitchdeck.engine.dedupe import dedupe_documents
+
+        docs, report = dedupe_documents([
+            self._doc("brief.md", "## Traction", self.PARAGRAPH),
+            self._doc("memo.md", "## Traction", self.OTHER),
+        ])
+        assert report.paragraphs_dropped == 0
+        assert docs[1][0].text == f"## Traction\n\n{self.OTHER}"
+
+    def test_generate_cli_reports_savings(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from pitchdeck.cli import app
+
+        brief = tmp_path / "brief.md"
+        memo = tmp_path / "memo.md"
+        brief.write_text(self.PARAGRAPH, encoding="utf-8")
+        memo.write_text(f"{self.PARAGRAPH}\n\n{self.OTHER}", encoding="utf-8")
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            result = CliRunner().invoke(app, [
+                "generate", str(brief), str(memo), "--vc", "no-such-fund",
+            ])
+        output = " ".join(result.output.split())
+        assert "Dropped 1 near-duplicate paragraph(s)" in output
+        assert f"{len(self.PARAGRAPH)} chars" in output
+
+
+class TestCompaction:
+    @staticmethod
+    def _section(index, heading, body):
+        from pitchdeck.models import DocumentSection
+
+        return DocumentSection(
+            source="brief.md", index=index, heading=heading,
+            text=f"## {heading}\n\n{body}",
+        )
+
+    def _documents(self):
+        return [[
+            self._section(0, "Office Party", "We had a lovely summer barbecue. " * 20),
+            self._section(1, "Traction", "ARR grew to €1.2M with 130% NDR and 42 customers. " * 5),
+            self._section(2, "Company History", "Founded in a garage by friends. " * 20),
+            self._section(3, "Unit Economics", "CAC payback is 9 months, gross margin 78%. " * 5),
+        ]]
+
+    def test_under_budget_is_unchanged(self, sample_vc_profile):
+        from pitchdeck.engine.compaction import compact_documents
+
+        documents = self._documents()
+        result, report = compact_documents(
+            documents, SLIDE_TEMPLATES, sample_vc_profile, token_budget=10_000
+        )
+        assert result == documents
+        assert report.dropped == []
+        assert report.tokens_after == report.tokens_before
+
+    def test_zero_budget_disables_compaction(self, sample_vc_profile):
+        from pitchdeck.engine.compaction import compact_documents
+
+        documents = self._documents()
+        result, report = compact_documents(
+            documents, SLIDE_TEMPLATES, sample_vc_profile, token_budget=0
+        )
+        assert result == documents
+        assert report.dropped == []
+
+    def test_keeps_most_relevant_sections_in_order(self, sample_vc_profile):
+        from pitchdeck.engine.compaction import compact_documents
+
+        result, report = compact_documents(
+            self._documents(), SLIDE_TEMPLATES, sample_vc_profile, token_budget=150
+        )
+        assert [s.heading for s in result[0]] == ["Traction", "Unit Economics"]
+        assert [s.heading for s in report.dropped] == ["Office Party", "Company History"]
+        assert report.tokens_after <= 150 < report.tokens_before
+
+    def test_vc_metrics_raise_relevance(self, sample_vc_profile):
+        from pitchdeck.engine.compaction import build_vocabulary, score_section
+
+        vocabulary = build_vocabulary(SLIDE_TEMPLATES, sample_vc_profile)
+        assert vocabulary["ndr"] > vocabulary["pricing"]
+        relevant = self._section(0, "Metrics", "ARR and NDR are strong.")
+        filler = self._section(1, "Notes", "The weather was strong.")
+        assert score_section(relevant, vocabulary) > score_section(filler, vocabulary)
+
+    def test_generate_cli_logs_dropped_sections(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from pitchdeck.cli import app
+
+        brief = tmp_path / "brief.md"
+        brief.write_text(
+            "\n\n".join(s.text for s in self._documents()[0]), encoding="utf-8"
+        )
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.generate_deck",
+                      side_effect=PitchDeckError("stop")):
+            result = CliRunner().invoke(app, [
+                "generate", str(brief), "--token-budget", "150", "--skip-gaps",
+            ])
+        output = " ".join(result.output.split())
+        assert "150-token budget" in output
+        assert "dropped 2 least relevant section(s)" in output
+        assert "brief.md #1: Office Party" in output
+
+    def test_facts_in_dropped_sections_are_extracted(self, sample_vc_profile):
+        from pitchdeck.cli import _initial_company
+
+        documents = self._documents()
+        documents[0][1] = self._section(
+            1, "Traction", "We grew to 130% NDR and 42 customers. " * 5
+        )
+        documents[0][2] = self._section(
+            2, "Company History",
+            "Founded in a garage by friends. " * 20 + "Our revenue was €850K last year.",
+        )
+        company, compacted = _initial_company(
+            documents, SLIDE_TEMPLATES, sample_vc_profile, token_budget=150
+        )
+        assert "Company History" not in [s.heading for s in compacted[0]]
+        assert "€850K" not in company.raw_document_text
+        assert company.revenue_eur == 850_000
+
+
+class TestTokenEstimation:
+    def test_prose_is_four_to_six_chars_per_token(self):
+        from pitchdeck.engine.tokens import estimate_tokens
+
+        text = (
+            "Our platform reduces month-end close time for mid-market finance "
+            "teams by automating reconciliation across every ledger they run. "
+        ) * 10
+        assert 3.5 <= len(text) / estimate_tokens(text) <= 6.0
+
+    def test_figures_and_markup_cost_more_than_prose(self):
+        from pitchdeck.engine.tokens import estimate_tokens
+
+        prose = "the team shipped a better product to happy customers again"
+        table = "| 2024 | €1,234,567 | 42.5% | 130% |\n|---|---|---|---|"
+        assert len(table) / estimate_tokens(table) < len(prose) / estimate_tokens(prose)
+
+    def test_empty_text_is_zero(self):
+        from pitchdeck.engine.tokens import estimate_tokens
+
+        assert estimate_tokens("") == 0
+
+    def test_request_estimate_splits_cached_prefix(self):
+        from pitchdeck.engine.tokens import estimate_request
+
+        system = [
+            {"type": "text", "text": "a " * 100},
+            {"type": "text", "text": "b " * 100, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "c " * 100},
+        ]
+        messages = [{"role": "user", "content": "d " * 50}]
+        estimate = estimate_request(system, messages, ["one", "two", "three"])
+        assert [b.name for b in estimate.blocks] == ["one", "two", "three", "user message"]
+        assert [b.cached for b in estimate.blocks] == [True, True, False, False]
+        assert estimate.cached_tokens == 200
+        assert estimate.uncached_tokens == 150
+        assert estimate.total_tokens == 350
+
+
+class TestGenerationPreflight:
+    @staticmethod
+    def _big_company(sample_company):
+        relevant = "## Traction\n\nARR grew to €1.2M with 130% NDR and 42 customers."
+        filler = "## Office\n\n" + "We had a lovely summer barbecue. " * 400
+        return sample_company.model_copy(update={
+            "raw_document_text": (
+                "\n\n--- Document: brief.md ---\n\n"
+                + "\n\n".join([relevant, filler])
+            ),
+        })
+
+    def test_profile_json_omits_document_text(self, sample_company, sample_vc_profile):
+        from pitchdeck.engine.narrative import build_generation_request
+
+        company = sample_company.model_copy(update={"raw_document_text": "UNIQUE-DOC-TEXT"})
+        system, _ = build_generation_request(company, sample_vc_profile, SLIDE_TEMPLATES)
+        assert system[1]["text"].count("UNIQUE-DOC-TEXT") == 1
+
+    def test_refuses_without_calling_api(self, sample_company, sample_vc_profile):
+        from pitchdeck.engine.narrative import generate_deck
+        from pitchdeck.models import PromptTooLargeError
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            with pytest.raises(PromptTooLargeError, match="budget is 500"):
+                generate_deck(
+                    self._big_company(sample_company),
+                    sample_vc_profile,
+                    SLIDE_TEMPLATES,
+                    max_input_tokens=500,
+                    auto_compact=False,
+                )
+        mock_anthropic.assert_not_called()
+
+    def test_auto_compacts_to_fit(self, sample_company, sample_vc_profile):
+        from pitchdeck.engine.narrative import (
+            estimate_generation_prompt,
+            preflight_generation,
+        )
+
+        company = self._big_company(sample_company)
+        full = estimate_generation_prompt(company, sample_vc_profile, SLIDE_TEMPLATES)
+        budget = full.total_tokens - 500
+        compacted, estimate = preflight_generation(
+            company, sample_vc_profile, SLIDE_TEMPLATES, max_input_tokens=budget
+        )
+        assert estimate.total_tokens <= budget
+        assert "130% NDR" in compacted.raw_document_text
+        assert "barbecue" not in compacted.raw_document_text
+        assert "--- Document: brief.md ---" in compacted.raw_document_text
+
+    def test_compacts_parsed_sections_without_resplitting(
+        self, sample_company, sample_vc_profile
+    ):
+        from pitchdeck.engine.compaction import split_documents
+        from pitchdeck.engine.narrative import (
+            estimate_generation_prompt,
+            preflight_generation,
+        )
+
+        company = self._big_company(sample_company)
+        documents = split_documents(company.raw_document_text)
+        full = estimate_generation_prompt(company, sample_vc_profile, SLIDE_TEMPLATES)
+        with patch(
+            "pitchdeck.engine.narrative.split_documents",
+            side_effect=AssertionError("re-split"),
+        ):
+            compacted, _ = preflight_generation(
+                company, sample_vc_profile, SLIDE_TEMPLATES,
+                max_input_tokens=full.total_tokens - 500, documents=documents,
+            )
+        assert "130% NDR" in compacted.raw_document_text
+        assert "barbecue" not in compacted.raw_document_text
+
+    def test_generate_deck_reports_estimate(self, sample_company, sample_vc_profile):
+        from pitchdeck.engine.narrative import generate_deck
+
+        estimates = []
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            mock_anthropic.return_value.messages.create.side_effect = RuntimeError("stop")
+            with pytest.raises(PitchDeckError):
+                generate_deck(
+                    sample_company, sample_vc_profile, SLIDE_TEMPLATES,
+                    on_preflight=estimates.append,
+                )
+        [estimate] = estimates
+        assert [b.name for b in estimate.blocks] == [
+            "instructions", "company + VC context", "user message",
+        ]
+        assert estimate.cached_tokens > 0
+
+
+class TestMetricExtraction:
+    BRIEF = (
+        "Company: Acme GmbH | Founded in 2019 | 35 employees\n\n"
+        "ARR of EUR 1.2M, growing 150% YoY, with 130% NDR and a 78% gross margin.\n\n"
+        "Monthly burn: €85k/month. We serve 42 paying customers and are "
+        "raising EUR 5M Series A."
+    )
+
+    @pytest.mark.parametrize("text,suffix,expected", [
+        ("1.2", True, 1.2),
+        ("1,2", True, 1.2),
+        ("2,400,000", False, 2_400_000),
+        ("2.400.000", False, 2_400_000),
+        ("60,000", False, 60_000),
+        ("1.234,5", False, 1234.5),
+    ])
+    def test_parse_number(self, text, suffix, expected):
+        from pitchdeck.engine.extraction import parse_number
+
+        assert parse_number(text, suffix) == expected
+
+    def test_extracts_stated_metrics(self):
+        from pitchdeck.engine.extraction import extract_metrics
+
+        facts = extract_metrics(self.BRIEF)
+        values = {field: fact.value for field, fact in facts.items()}
+        assert values == {
+            "founded_year": 2019,
+            "employee_count": 35,
+            "revenue_eur": 1_200_000,
+            "growth_rate_yoy": 150,
+            "ndr_percent": 130,
+            "gross_margin_percent": 78,
+            "burn_rate_monthly_eur": 85_000,
+            "customer_count": 42,
+            "target_raise_eur": 5_000_000,
+        }
+
+    def test_fact_records_source_span(self):
+        from pitchdeck.engine.extraction import extract_metrics
+
+        fact = extract_metrics(self.BRIEF)["ndr_percent"]
+        assert self.BRIEF[fact.start:fact.end] == fact.snippet == "130% NDR"
+        assert fact.confidence >= 0.8
+
+    @pytest.mark.parametrize("text,field,expected", [
+        ("Net revenue retention (NRR) is 118%.", "ndr_percent", 118),
+        ("Cash burn of EUR 1.8M per year.", "burn_rate_monthly_eur", 150_000),
+        ("MRR: €50k.", "revenue_eur", 600_000),
+        ("Revenue grew 3x year-over-year.", "growth_rate_yoy", 200),
+        ("Team of ~12 engineers.", "employee_count", 12),
+    ])
+    def test_synonyms_and_units(self, text, field, expected):
+        from pitchdeck.engine.extraction import extract_metrics
+
+        assert extract_metrics(text)[field].value == expected
+
+    def test_skips_negated_market_and_low_confidence_statements(self):
+        from pitchdeck.engine.extraction import MIN_CONFIDENCE, extract_metrics
+
+        facts = extract_metrics(
+            "Team size: 4 engineers (NOT 15 employees).\n"
+            "The AI market is growing at 38.9% CAGR.\n"
+            "Target: 50 paying customers by end of year 2."
+        )
+        assert facts["employee_count"].value == 4
+        assert "growth_rate_yoy" not in facts
+        assert facts["customer_count"].confidence < MIN_CONFIDENCE
+
+    def test_negated_value_rejected_across_documents(self):
+        from pathlib import Path
+
+        from pitchdeck.engine.compaction import combine_documents
+        from pitchdeck.engine.extraction import MIN_CONFIDENCE, extract_metrics
+        from pitchdeck.parsers import extract_documents_sections
+
+        input_dir = Path(__file__).resolve().parent.parent / "INPUT"
+        paths = [
+            str(input_dir / "neuraplox_v7_narrative_brief.docx"),  # "15 employees"
+            str(input_dir / "neuraplox_updates.md"),  # "NOT 15 employees"
+        ]
+        documents = [
+            sections for _, sections in extract_documents_sections(paths, use_cache=False)
+        ]
+        facts = extract_metrics(combine_documents(documents))
+
+        assert facts["employee_count"].value == 10  # "team of ~10"
+        # Horizon 1 at 30%, later horizons at 70% and 80%+: ask the user
+        assert facts["gross_margin_percent"].confidence < MIN_CONFIDENCE
+
+    def test_conflicting_statements_fall_below_threshold(self):
+        from pitchdeck.engine.extraction import MIN_CONFIDENCE, extract_metrics
+
+        facts = extract_metrics("We have 40 customers.\n\nToday 55 customers use it.")
+        assert facts["customer_count"].confidence < MIN_CONFIDENCE
+        assert extract_metrics("40 customers. Again: 40 customers.")[
+            "customer_count"
+        ].confidence >= MIN_CONFIDENCE
+
+    def test_prefill_narrows_gaps_and_keeps_existing_values(self, sample_company_with_gaps):
+        from pitchdeck.engine.extraction import apply_extracted_metrics, extract_metrics
+
+        before = detect_gaps(sample_company_with_gaps, SLIDE_TEMPLATES)
+        company = sample_company_with_gaps.model_copy(update={"revenue_eur": 999.0})
+        company, applied = apply_extracted_metrics(company, extract_metrics(self.BRIEF))
+        after = {gap.field for gap in detect_gaps(company, SLIDE_TEMPLATES)}
+
+        assert company.revenue_eur == 999.0
+        assert "revenue_eur" not in {fact.field for fact in applied}
+        assert company.ndr_percent == 130
+        assert {"ndr_percent", "growth_rate_yoy", "target_raise_eur"}.isdisjoint(after)
+        assert len(after) < len(before)
+
+
+class TestBM25Retrieval:
+    @staticmethod
+    def _sections():
+        from pitchdeck.models import DocumentSection
+
+        texts = [
+            ("Team", "Our founders: CEO with 10 years in enterprise sales, CTO ex-Google."),
+            ("Traction", "ARR reached EUR 1.2M. Net revenue retention is 130% across 42 customers."),
+            ("Market", "The addressable market (TAM) is EUR 8B; SAM and SOM are bottom-up."),
+            ("Office", "We moved to a new office in Berlin with a rooftop terrace."),
+        ]
+        return [
+            DocumentSection(source="brief.md", index=i, heading=h, text=t)
+            for i, (h, t) in enumerate(texts)
+        ]
+
+    def test_tokenize_drops_stopwords_and_plurals(self):
+        from pitchdeck.engine.retrieval import tokenize
+
+        assert tokenize("The customers and their Logos") == ["customer", "their", "logo"]
+
+    def test_slide_query_expands_abbreviations(self):
+        from pitchdeck.engine.retrieval import slide_query
+
+        traction = next(t for t in SLIDE_TEMPLATES if t.slide_type == "traction")
+        query = slide_query(traction)
+        assert "ndr" in query and "retention" in query
+        assert len(query) == len(set(query))
+
+    def test_each_slide_retrieves_its_section(self):
+        from pitchdeck.engine.retrieval import BM25Index
+
+        index = BM25Index.build(self._sections())
+        by_type = {t.slide_type: t for t in SLIDE_TEMPLATES}
+        assert index.for_slide(by_type["traction"], top_k=1)[0].heading == "Traction"
+        assert index.for_slide(by_type["team"], top_k=1)[0].heading == "Team"
+        assert index.for_slide(by_type["market-sizing"], top_k=1)[0].heading == "Market"
+
+    def test_for_slide_returns_document_order(self):
+        from pitchdeck.engine.retrieval import BM25Index
+
+        index = BM25Index.build(self._sections())
+        traction = next(t for t in SLIDE_TEMPLATES if t.slide_type == "traction")
+        hits = index.for_slide(traction, top_k=3)
+        assert [s.index for s in hits] == sorted(s.index for s in hits)
+
+    def test_index_is_persisted_and_reused(self):
+        from pitchdeck.engine.retrieval import BM25Index, load_or_build_index
+
+        sections = self._sections()
+        built = load_or_build_index(sections)
+        with patch.object(BM25Index, "build", side_effect=AssertionError("rebuilt")):
+            loaded = load_or_build_index(sections)
+        query = ["retention", "arr"]
+        assert loaded.scores(query) == built.scores(query)
+
+    def test_changed_sections_get_a_new_index(self):
+        from pitchdeck.engine.retrieval import load_or_build_index
+
+        sections = self._sections()
+        load_or_build_index(sections)
+        changed = sections[:2]
+        index = load_or_build_index(changed)
+        assert len(index.doc_lengths) == 2
+
+
+def _deck_json(n_slides):
+    import json
+
+    return json.dumps({
+        "narrative_arc": "Hook to ask",
+        "gaps_identified": [],
+        "slides": [
+            {
+                "slide_number": i,
+                "slide_type": "cover",
+                "title": f"Slide {i}",
+                "headline": "Headline",
+                "bullets": ["EUR 1M ARR"],
+            }
+            for i in range(1, n_slides + 1)
+        ],
+    })
+
+
+def _stream_events(text, chunk_size=7, stop_reason="end_turn"):
+    """Raw Messages API stream events carrying text in small deltas."""
+    from types import SimpleNamespace
+
+    events = [SimpleNamespace(
+        type="message_start",
+        message=SimpleNamespace(usage=SimpleNamespace(
+            input_tokens=1200,
+            output_tokens=1,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=1000,
+        )),
+    )]
+    for i in range(0, len(text), chunk_size):
+        events.append(SimpleNamespace(
+            type="content_block_delta",
+            delta=SimpleNamespace(type="text_delta", text=text[i:i + chunk_size]),
+        ))
+    events.append(SimpleNamespace(
+        type="message_delta",
+        delta=SimpleNamespace(stop_reason=stop_reason),
+        usage=SimpleNamespace(output_tokens=max(1, len(text) // 4)),
+    ))
+
+    async def stream():
+        for event in events:
+            yield event
+
+    return stream()
+
+
+class TestStreamingGeneration:
+    def _patched_client(self, mock_anthropic, text, **kwargs):
+        from unittest.mock import AsyncMock
+
+        mock_anthropic.return_value.messages.create = AsyncMock(
+            return_value=_stream_events(text, **kwargs)
+        )
+
+    def test_reports_each_slide_as_it_arrives(self, sample_company, sample_vc_profile):
+        from pitchdeck.engine.narrative import generate_deck
+
+        progress = []
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            self._patched_client(mock_anthropic, _deck_json(3))
+            deck = generate_deck(
+                sample_company, sample_vc_profile, SLIDE_TEMPLATES[:3],
+                on_progress=lambda done, total: progress.append((done, total)),
+            )
+        assert [s.title for s in deck.slides] == ["Slide 1", "Slide 2", "Slide 3"]
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        kwargs = mock_anthropic.return_value.messages.create.call_args.kwargs
+        assert kwargs["stream"] is True
+
+    def test_async_entry_point(self, sample_company, sample_vc_profile):
+        import asyncio
+
+        from pitchdeck.engine.narrative import generate_deck_async
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            self._patched_client(mock_anthropic, _deck_json(2), chunk_size=1)
+            deck = asyncio.run(generate_deck_async(
+                sample_company, sample_vc_profile, SLIDE_TEMPLATES[:2]
+            ))
+        assert len(deck.slides) == 2
+
+    def test_empty_stream_raises(self, sample_company, sample_vc_profile):
+        from pitchdeck.engine.narrative import generate_deck
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            self._patched_client(mock_anthropic, "")
+            with pytest.raises(PitchDeckError, match="empty response"):
+                generate_deck(sample_company, sample_vc_profile, SLIDE_TEMPLATES[:2])
+
+
+class TestArrayItemStream:
+    DOC = {
+        "narrative_arc": 'braces {in} strings and a fake "slides": [',
+        "slides": [
+            {"slide_number": i, "title": 'x}"{[', "bullets": [{"a": [1]}]}
+            for i in range(1, 5)
+        ],
+        "gaps_identified": ["slides"],
+    }
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 10_000])
+    def test_emits_each_item_once_complete(self, chunk_size):
+        import json
+
+        from pitchdeck.engine.jsonstream import ArrayItemStream
+
+        text = "Here is the deck:\n```json\n" + json.dumps(self.DOC) + "\n```"
+        items = []
+        parser = ArrayItemStream("slides", items.append)
+        for i in range(0, len(text), chunk_size):
+            parser.feed(text[i:i + chunk_size])
+        assert items == self.DOC["slides"]
+        assert parser.done
+
+    def test_item_available_before_stream_ends(self):
+        import json
+
+        from pitchdeck.engine.jsonstream import ArrayItemStream
+
+        text = json.dumps(self.DOC)
+        first = json.dumps(self.DOC["slides"][0])
+        first_end = text.index(first) + len(first)
+        items = []
+        parser = ArrayItemStream("slides", items.append)
+        parser.feed(text[:first_end])
+        assert [item["slide_number"] for item in items] == [1]
+        assert not parser.done
+
+
+class TestJSONExtraction:
+    def test_ignores_prose_braces_around_the_object(self):
+        from pitchdeck.engine.jsonstream import extract_json_object
+
+        text = (
+            'Use {placeholders} sparingly. Here you go:\n'
+            '{"title": "a } and a \\" quote {", "nested": {"x": [1, {}]}}\n'
+            "Let me know if {anything} should change."
+        )
+        assert extract_json_object(text) == {
+            "title": 'a } and a " quote {', "nested": {"x": [1, {}]},
+        }
+
+    def test_all_objects(self):
+        from pitchdeck.engine.jsonstream import (
+            extract_json_objects,
+            iter_json_object_spans,
+        )
+
+        text = 'first {"a": 1} then {"b": "}"} done'
+        assert extract_json_objects(text) == [{"a": 1}, {"b": "}"}]
+        assert list(iter_json_object_spans(text)) == [(6, 14), (20, 30)]
+
+    def test_failure_offsets(self):
+        from pitchdeck.engine.jsonstream import JSONExtractError, extract_json_object
+
+        with pytest.raises(JSONExtractError, match="no JSON object") as no_json:
+            extract_json_object("nothing here")
+        assert no_json.value.start is None
+
+        with pytest.raises(JSONExtractError, match="offset 4 is never closed") as cut:
+            extract_json_object('ok: {"slides": [{"a": "b')
+        assert (cut.value.start, cut.value.end) == (4, 24)
+
+        with pytest.raises(JSONExtractError, match="offsets 2-13") as invalid:
+            extract_json_object('x {"a": nope}')
+        assert invalid.value.position == 8
+
+    def test_never_closed_brace_before_the_object_is_skipped(self):
+        from pitchdeck.engine.jsonstream import extract_json_object
+
+        assert extract_json_object('Fill {placeholder then\n{"a": 1}') == {"a": 1}
+        assert extract_json_object(
+            'Fill { in { and\n{"a": {"b": 2}} and { more'
+        ) == {"a": {"b": 2}}
+
+    def test_deck_json_followed_by_braces_parses(
+        self, sample_company, sample_vc_profile
+    ):
+        from pitchdeck.engine.narrative import _parse_deck_text
+
+        deck = _parse_deck_text(
+            _deck_json(2) + "\nNote: replace {ARR} with audited numbers.",
+            sample_company, sample_vc_profile,
+        )
+        assert len(deck.slides) == 2
+
+
+class TestStreamedSlides:
+    def test_on_slide_receives_validated_slides(self, sample_company, sample_vc_profile):
+        from unittest.mock import AsyncMock
+
+        from pitchdeck.engine.narrative import generate_deck
+        from pitchdeck.models import SlideContent
+
+        slides = []
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            mock_anthropic.return_value.messages.create = AsyncMock(
+                return_value=_stream_events(_deck_json(3), chunk_size=3)
+            )
+            deck = generate_deck(
+                sample_company, sample_vc_profile, SLIDE_TEMPLATES[:3],
+                on_slide=slides.append,
+            )
+        assert all(isinstance(s, SlideContent) for s in slides)
+        assert slides == deck.slides
+
+
+class TestTruncatedGeneration:
+    def _create(self, full_text, cut, calls):
+        """First call: full_text cut off at cut; then the remaining slides."""
+        import json
+        import re
+
+        async def create(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                return _stream_events(full_text[:cut], stop_reason="max_tokens")
+            prompt = kwargs["messages"][0]["content"]
+            numbers = re.search(r"Generate ONLY slides ([\d, ]+),", prompt).group(1)
+            return _stream_events(json.dumps({
+                "gaps_identified": ["Churn"],
+                "slides": [
+                    {"slide_number": int(n), "slide_type": "cover",
+                     "title": f"Slide {n}", "headline": "Headline"}
+                    for n in numbers.split(", ")
+                ],
+            }))
+
+        return create
+
+    def test_continues_after_max_tokens(self, sample_company, sample_vc_profile):
+        from pitchdeck.engine.narrative import generate_deck
+
+        full_text = _deck_json(4)
+        cut = full_text.index('{"slide_number": 3') + 20  # inside slide 3
+        calls, progress = [], []
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            mock_anthropic.return_value.messages.create = self._create(
+                full_text, cut, calls
+            )
+            deck = generate_deck(
+                sample_company, sample_vc_profile, SLIDE_TEMPLATES[:4],
+                on_progress=lambda done, total: progress.append((done, total)),
+            )
+
+        assert [s.slide_number for s in deck.slides] == [1, 2, 3, 4]
+        assert deck.narrative_arc == "Hook to ask"
+        assert deck.gaps_identified == ["Churn"]
+        assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+        assert len(calls) == 2
+        # Same cached prefix; only the missing slides are asked for
+        assert calls[1]["system"] == calls[0]["system"]
+        prompt = calls[1]["messages"][0]["content"]
+        assert "<written_slides>" in prompt and '"title": "Slide 2"' in prompt
+        assert "Generate ONLY slides 3, 4," in prompt
+
+    def test_unrecoverable_truncation_raises(self, sample_company, sample_vc_profile):
+        from unittest.mock import AsyncMock
+
+        from pitchdeck.engine.narrative import MAX_CONTINUATIONS, generate_deck
+
+        full_text = _deck_json(3)
+        cut = full_text.index('{"slide_number": 2') + 5
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            create = mock_anthropic.return_value.messages.create = AsyncMock(
+                side_effect=lambda **_: _stream_events(
+                    full_text[:cut], stop_reason="max_tokens"
+                )
+            )
+            with pytest.raises(PitchDeckError, match="only 1 of 3 slides"):
+                generate_deck(sample_company, sample_vc_profile, SLIDE_TEMPLATES[:3])
+        # The continuation only repeated slide 1, so it stops there
+        assert create.await_count == 2 <= 1 + MAX_CONTINUATIONS
+
+    def test_mock_backend_recovers_small_output_limit(
+        self, sample_company, sample_vc_profile
+    ):
+        from pitchdeck.engine import narrative
+        from pitchdeck.engine.backends import MockBackend
+
+        backend = MockBackend()
+        with patch.object(narrative, "MAX_OUTPUT_TOKENS", 400):
+            deck = narrative.generate_deck(
+                sample_company, sample_vc_profile, SLIDE_TEMPLATES[:5],
+                backend=backend,
+            )
+        assert [s.slide_number for s in deck.slides] == [1, 2, 3, 4, 5]
+        assert [s.slide_type for s in deck.slides] == [
+            t.slide_type for t in SLIDE_TEMPLATES[:5]
+        ]
+        assert backend.calls > 1
+
+
+class TestGroupedGeneration:
+    def test_group_templates_by_arc(self):
+        from pitchdeck.engine.slides import group_templates_by_arc
+
+        groups = group_templates_by_arc(SLIDE_TEMPLATES)
+        assert [stage for stage, _ in groups] == [
+            "hook", "tension", "resolution", "proof", "trust", "call-to-action",
+        ]
+        numbers = sorted(n for _, group in groups for n, _ in group)
+        assert numbers == list(range(1, 16))
+        proof = dict(groups)["proof"]
+        assert [t.slide_type for _, t in proof] == [
+            "market-sizing", "business-model", "traction",
+        ]
+
+    def test_unknown_slide_type_joins_previous_stage(self):
+        from pitchdeck.engine.slides import group_templates_by_arc
+        from pitchdeck.models import SlideTemplate
+
+        extra = SlideTemplate(slide_type="appendix", purpose="x", required_elements=["x"])
+        groups = group_templates_by_arc([SLIDE_TEMPLATES[0], extra, SLIDE_TEMPLATES[2]])
+        assert [(stage, [n for n, _ in g]) for stage, g in groups] == [
+            ("hook", [1, 2]), ("tension", [3]),
+        ]
+
+    def _fake_create(self, calls, in_flight, peak):
+        import asyncio
+        import json
+        import re
+
+        async def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            calls.append(prompt)
+            if "<slides>" in prompt:
+                boundaries = re.search(r"each of slides ([\d, ]+) ", prompt).group(1)
+                text = json.dumps({
+                    "narrative_arc": "Stitched arc",
+                    "transitions": [
+                        {"slide_number": int(n), "transition_to_next": f"Bridge {n}"}
+                        for n in boundaries.split(", ")
+                    ],
+                })
+                return _stream_events(text)
+            numbers = re.search(r"YOUR SECTION: .*\(slides ([\d, ]+)\)", prompt).group(1)
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            text = json.dumps({
+                "gaps_identified": ["NDR"],
+                "slides": [
+                    {
+                        "slide_number": int(n),
+                        "slide_type": SLIDE_TEMPLATES[int(n) - 1].slide_type,
+                        "title": f"Slide {n}",
+                        "headline": "Headline",
+                        "bullets": [],
+                    }
+                    for n in numbers.split(", ")
+                ],
+            })
+            return _stream_events(text)
+
+        return create
+
+    def test_generates_groups_concurrently_and_stitches(
+        self, sample_company, sample_vc_profile
+    ):
+        from pitchdeck.engine.narrative import generate_deck
+
+        calls, in_flight, peak, progress = [], [0], [0], []
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            mock_anthropic.return_value.messages.create = self._fake_create(
+                calls, in_flight, peak
+            )
+            deck = generate_deck(
+                sample_company, sample_vc_profile, SLIDE_TEMPLATES,
+                parallel_groups=2,
+                on_progress=lambda done, total: progress.append(done),
+            )
+
+        assert [s.slide_number for s in deck.slides] == list(range(1, 16))
+        assert "YOUR SECTION: HOOK" in calls[0]
+        assert "<slides>" in calls[-1] and len(calls) == 7
+        assert peak[0] == 2
+        assert progress == list(range(1, 16))
+        assert deck.narrative_arc == "Stitched arc"
+        assert deck.gaps_identified == ["NDR"]
+        by_number = {s.slide_number: s for s in deck.slides}
+        # cover+exec | problem+why-now | ... : slide 2 ends the hook group
+        assert by_number[2].transition_to_next == "Bridge 2"
+        assert by_number[15].transition_to_next == ""
+
+    def test_failed_group_is_named(self, sample_company, sample_vc_profile):
+        from pitchdeck.engine.narrative import generate_deck
+
+        calls, in_flight, peak = [], [0], [0]
+        ok = self._fake_create(calls, in_flight, peak)
+
+        async def create(**kwargs):
+            if "YOUR SECTION: TRUST" in kwargs["messages"][0]["content"]:
+                raise ConnectionError("reset")
+            return await ok(**kwargs)
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            mock_anthropic.return_value.messages.create = create
+            with pytest.raises(PitchDeckError, match="slide group\\(s\\): trust"):
+                generate_deck(
+                    sample_company, sample_vc_profile, SLIDE_TEMPLATES,
+                    parallel_groups=3,
+                )
+
+
+class TestGenerationLLMCache:
+    def _generate(self, mock_anthropic, company, vc_profile, **kwargs):
+        from unittest.mock import AsyncMock
+
+        from pitchdeck.engine.narrative import generate_deck
+
+        mock_anthropic.return_value.messages.create = AsyncMock(
+            side_effect=lambda **_: _stream_events(_deck_json(2))
+        )
+        return generate_deck(company, vc_profile, SLIDE_TEMPLATES[:2], **kwargs)
+
+    def test_identical_rerun_served_from_cache(self, sample_company, sample_vc_profile):
+        slides = []
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            first = self._generate(mock_anthropic, sample_company, sample_vc_profile)
+            create = mock_anthropic.return_value.messages.create
+            second = self._generate(
+                mock_anthropic, sample_company, sample_vc_profile,
+                on_slide=slides.append,
+            )
+            assert mock_anthropic.return_value.messages.create.call_count == 0
+        assert create.call_count == 1
+        assert second.slides == first.slides
+        assert len(slides) == 2  # replayed through the streaming parser
+
+    def test_changed_input_or_no_cache_calls_api(self, sample_company, sample_vc_profile):
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            self._generate(mock_anthropic, sample_company, sample_vc_profile)
+            self._generate(
+                mock_anthropic, sample_company, sample_vc_profile, use_llm_cache=False
+            )
+            assert mock_anthropic.return_value.messages.create.call_count == 1
+            changed = sample_company.model_copy(update={"one_liner": "Different"})
+            self._generate(mock_anthropic, changed, sample_vc_profile)
+            assert mock_anthropic.return_value.messages.create.call_count == 1
+
+
+class TestCallTelemetry:
+    def test_reports_usage_and_latency_per_call(self, sample_company, sample_vc_profile):
+        from unittest.mock import AsyncMock
+
+        from pitchdeck.engine.narrative import generate_deck
+
+        calls = []
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            mock_anthropic.return_value.messages.create = AsyncMock(
+                side_effect=lambda **_: _stream_events(_deck_json(2))
+            )
+            for _ in range(2):
+                generate_deck(
+                    sample_company, sample_vc_profile, SLIDE_TEMPLATES[:2],
+                    on_call=calls.append,
+                )
+        live, cached = calls
+        assert live.label == "generate" and not live.llm_cache_hit
+        assert live.usage.cache_read_input_tokens == 1000
+        assert live.usage.output_tokens > 0
+        assert live.time_to_first_byte_s is not None
+        assert live.stop_reason == "end_turn"
+        assert cached.llm_cache_hit
+        assert cached.usage.output_tokens == 0  # no tokens spent on a hit
+
+    def test_summary_and_metrics_files(self, tmp_path):
+        import json
+
+        from pitchdeck.engine import telemetry
+        from pitchdeck.models import CallMetrics, LLMUsage, RunMetrics
+
+        usage = LLMUsage(input_tokens=200, output_tokens=1000,
+                         cache_read_input_tokens=800)
+        run = RunMetrics(command="generate", started_at="2026-01-01T00:00:00", calls=[
+            CallMetrics(label="generate", model="claude-sonnet-4-6", usage=usage,
+                        time_to_first_byte_s=0.5, latency_s=2.0),
+            CallMetrics(label="generate", model="claude-sonnet-4-6", usage=usage,
+                        llm_cache_hit=True, latency_s=0.01),
+        ])
+        # 200 * $3 + 1000 * $15 + 800 * $0.30 per MTok; the cache hit is free
+        assert telemetry.estimate_cost_usd(run.calls) == pytest.approx(0.01584)
+        line = telemetry.summarize(run)
+        assert "2 Claude call(s)" in line
+        assert "80% prompt-cache read" in line
+        assert "1 from LLM cache" in line
+
+        telemetry.write_run_metrics(run, str(tmp_path / "run.json"))
+        record = json.loads((tmp_path / "run.json").read_text())
+        assert record["totals"]["output_tokens"] == 2000
+        assert record["llm_cache_hits"] == 1
+        log = tmp_path / "logs" / "runs.jsonl"
+        for _ in range(2):
+            telemetry.append_metrics_log(run, str(log))
+        assert len(log.read_text().splitlines()) == 2
+
+
+class TestRequestScheduler:
+    def test_token_bucket_spaces_out_requests(self):
+        from pitchdeck.engine.ratelimit import TokenBucket
+
+        now = [0.0]
+        bucket = TokenBucket(60, clock=lambda: now[0])  # one per second
+        assert bucket.reserve(60) == 0.0
+        assert bucket.reserve(1) == pytest.approx(1.0)
+        assert bucket.reserve(1) == pytest.approx(2.0)  # queued behind the first
+        now[0] = 10.0
+        assert bucket.reserve(1) == 0.0
+
+    def test_backoff_honours_retry_after_and_jitters(self):
+        from anthropic import RateLimitError
+
+        from pitchdeck.engine.ratelimit import RequestScheduler
+
+        def rate_limited(headers):
+            return RateLimitError(
+                message="Rate limit exceeded",
+                response=MagicMock(status_code=429, headers=headers),
+                body=None,
+            )
+
+        now = [100.0]
+        scheduler = RequestScheduler(base_delay=1, max_delay=30, clock=lambda: now[0], rng=lambda: 0.5)
+        assert scheduler.backoff(1, rate_limited({"retry-after": "7"})) == 7
+        assert scheduler.admission_delay() == pytest.approx(7)  # pauses everyone
+        assert scheduler.backoff(1, rate_limited({"retry-after-ms": "250"})) == 0.25
+        assert scheduler.backoff(3, rate_limited({})) == 2.0  # 0.5 * 1 * 2**2
+        assert scheduler.backoff(10, rate_limited({})) == 15.0  # capped at max_delay
+
+    def test_generation_retries_429_and_529(
+        self, fake_anthropic, sample_company, sample_vc_profile
+    ):
+        from pitchdeck.engine.narrative import generate_deck
+
+        fake_anthropic.responses = [
+            fake_anthropic.error(429, "rate_limit_error", {"retry-after": "0"}),
+            fake_anthropic.error(529, "overloaded_error"),
+            fake_anthropic.stream(_deck_json(2)),
+        ]
+        calls = []
+        deck = generate_deck(
+            sample_company, sample_vc_profile, SLIDE_TEMPLATES[:2], on_call=calls.append
+        )
+        assert len(deck.slides) == 2
+        assert len(fake_anthropic.requests) == 3
+        assert calls[0].retries == 2
+
+    def test_gives_up_after_max_retries(
+        self, fake_anthropic, sample_company, sample_vc_profile
+    ):
+        from pitchdeck.engine.narrative import generate_deck
+        from pitchdeck.engine.ratelimit import RequestScheduler, set_scheduler
+
+        set_scheduler(RequestScheduler(max_retries=2, base_delay=0))
+        fake_anthropic.default = fake_anthropic.error(429, "rate_limit_error")
+        with pytest.raises(PitchDeckError, match="rate limit"):
+            generate_deck(sample_company, sample_vc_profile, SLIDE_TEMPLATES[:2])
+        assert len(fake_anthropic.requests) == 3
+
+    def test_client_errors_are_not_retried(
+        self, fake_anthropic, sample_company, sample_vc_profile
+    ):
+        from pitchdeck.engine.narrative import generate_deck
+
+        fake_anthropic.default = fake_anthropic.error(400, "invalid_request_error")
+        with pytest.raises(PitchDeckError, match="HTTP 400"):
+            generate_deck(sample_company, sample_vc_profile, SLIDE_TEMPLATES[:2])
+        assert len(fake_anthropic.requests) == 1
+
+
+class TestMockBackend:
+    def test_generates_valid_deck_without_api_key(
+        self, sample_company, sample_vc_profile, monkeypatch
+    ):
+        from pitchdeck.engine.backends import MockBackend
+        from pitchdeck.engine.narrative import generate_deck
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        backend = MockBackend()
+        slides, calls = [], []
+        first = generate_deck(
+            sample_company, sample_vc_profile, SLIDE_TEMPLATES,
+            on_slide=slides.append, on_call=calls.append,
+            use_llm_cache=False, backend=backend,
+        )
+        second = generate_deck(
+            sample_company, sample_vc_profile, SLIDE_TEMPLATES,
+            use_llm_cache=False, backend=backend,
+        )
+        assert [s.slide_type for s in first.slides] == [
+            t.slide_type for t in SLIDE_TEMPLATES
+        ]
+        assert len(slides) == len(SLIDE_TEMPLATES)
+        assert second.slides == first.slides  # deterministic
+        assert calls[0].model == "mock/claude-sonnet-4-6"
+        assert calls[0].usage.cache_creation_input_tokens > 0
+
+    def test_grouped_generation_and_prefix_cache(self, sample_company, sample_vc_profile):
+        from pitchdeck.engine.backends import MockBackend
+        from pitchdeck.engine.narrative import generate_deck
+
+        calls = []
+        deck = generate_deck(
+            sample_company, sample_vc_profile, SLIDE_TEMPLATES,
+            parallel_groups=3, on_call=calls.append, backend=MockBackend(),
+        )
+        assert [s.slide_number for s in deck.slides] == list(
+            range(1, len(SLIDE_TEMPLATES) + 1)
+        )
+        assert deck.narrative_arc
+        assert sum(1 for c in calls if c.usage.cache_read_input_tokens) == len(calls) - 1
+
+    def test_injected_errors_are_retried(self, sample_company, sample_vc_profile):
+        from pitchdeck.engine.backends import MockBackend
+        from pitchdeck.engine.narrative import generate_deck
+
+        calls = []
+        backend = MockBackend(error_rate=0.5, seed=3)
+        generate_deck(
+            sample_company, sample_vc_profile, SLIDE_TEMPLATES[:3],
+            on_call=calls.append, backend=backend,
+        )
+        assert backend.calls == calls[0].retries + 1 > 1
+
+        with pytest.raises(PitchDeckError, match="HTTP 529"):
+            generate_deck(
+                sample_company, sample_vc_profile, SLIDE_TEMPLATES[:3],
+                use_llm_cache=False, backend=MockBackend(error_rate=1.0),
+            )
+
+    def test_get_backend(self, monkeypatch):
+        from pitchdeck.engine.backends import MockBackend, get_backend
+
+        assert get_backend("anthropic") is None
+        monkeypatch.setenv("PITCHDECK_LLM_BACKEND", "mock")
+        monkeypatch.setenv("PITCHDECK_MOCK_LATENCY", "0.25")
+        backend = get_backend()
+        assert isinstance(backend, MockBackend) and backend.latency_s == 0.25
+        with pytest.raises(PitchDeckError, match="Unknown LLM backend"):
+            get_backend("openai")
+
+    def test_rejects_parameters_the_sdk_does_not_accept(self):
+        import asyncio
+
+        from pitchdeck.engine.backends import LLMBackend, MockBackend
+
+        with pytest.raises(TypeError):
+            LLMBackend()  # abstract
+        request = {
+            "model": "claude-sonnet-4-6", "max_tokens": 10,
+            "messages": [{"role": "user", "content": "hi"}],
+        }
+        backend = MockBackend()
+        assert backend.client().messages.create(**request).content[0].text
+        with pytest.raises(TypeError, match="'temperature'"):
+            backend.client().messages.create(**request, temperature=0.0)
+        with pytest.raises(TypeError, match="'top_k'"):
+            asyncio.run(backend.async_client().messages.create(**request, top_k=5))
+
+
+class TestSharedClients:
+    def test_one_pooled_client_per_process(self, monkeypatch):
+        from pitchdeck.engine import clients
+
+        made = []
+
+        def factory(**options):
+            made.append(options)
+            return MagicMock()
+
+        clients.configure_clients(clients.ClientPoolConfig(max_connections=7))
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                shared = set(map(id, executor.map(
+                    lambda _: clients.shared_client(factory), range(8)
+                )))
+            assert len(shared) == 1 and len(made) == 1
+            assert made[0]["max_retries"] == 0
+            assert made[0]["timeout"].connect == 10.0
+            monkeypatch.setenv("ANTHROPIC_API_KEY", "other-key")
+            clients.shared_client(factory)
+            assert len(made) == 2  # a new key gets a new client
+        finally:
+            clients.configure_clients(None)
+
+    def test_pool_settings_from_env(self, monkeypatch):
+        from pitchdeck.engine.clients import ClientPoolConfig
+
+        monkeypatch.setenv("PITCHDECK_HTTP_MAX_CONNECTIONS", "5")
+        monkeypatch.setenv("PITCHDECK_HTTP_TIMEOUT", "30")
+        config = ClientPoolConfig.from_env()
+        assert (config.max_connections, config.timeout) == (5, 30.0)
+        monkeypatch.setenv("PITCHDECK_HTTP_TIMEOUT", "soon")
+        with pytest.raises(PitchDeckError, match="PITCHDECK_HTTP_TIMEOUT"):
+            ClientPoolConfig.from_env()
+
+    def test_grouped_generation_shares_one_async_client(
+        self, sample_company, sample_vc_profile
+    ):
+        from unittest.mock import AsyncMock
+
+        from pitchdeck.engine.narrative import generate_deck
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), \
+                patch("pitchdeck.engine.narrative.AsyncAnthropic") as mock_anthropic:
+            mock_anthropic.return_value.messages.create = AsyncMock(
+                side_effect=lambda **_: _stream_events(_deck_json(2))
+            )
+            mock_anthropic.return_value.close = AsyncMock()
+            generate_deck(
+                sample_company, sample_vc_profile, SLIDE_TEMPLATES[:4],
+                parallel_groups=3, use_llm_cache=False,
+            )
+            assert mock_anthropic.call_count == 1
+            assert mock_anthropic.return_value.messages.create.call_count > 2
+            mock_anthropic.return_value.close.assert_awaited_once()
+
+    def test_requests_reuse_keep_alive_connection(self, fake_anthropic):
+        from pitchdeck.engine.clients import shared_client
+
+        fake_anthropic.default = fake_anthropic.message("{}")
+        for _ in range(3):
+            shared_client().messages.create(
+                model="claude-sonnet-4-6", max_tokens=10,
+                messages=[{"role": "user", "content": "hi"}],
+            )
+        assert len(fake_anthropic.requests) == 3
+        assert len(fake_anthropic.connections) == 1
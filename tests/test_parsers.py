@@ -7,7 +7,7 @@ import pytest
 from docx import Document
 
 from pitchdeck.models import DocumentParseError
-from pitchdeck.parsers import extract_document
+from pitchdeck.parsers import extract_document, extract_documents
 from pitchdeck.parsers.docx_parser import extract_docx
 from pitchdeck.parsers.pdf import extract_pdf
 
@@ -99,9 +99,11 @@ class TestExtractDocument:
         result = extract_document(docx_path)
         assert "DOCX content" in result
 
-    def test_unsupported_format(self):
+    def test_unsupported_format(self, tmp_path):
+        image_path = tmp_path / "logo.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
         with pytest.raises(DocumentParseError, match="Unsupported format"):
-            extract_document("test.txt")
+            extract_document(str(image_path))
 
     def test_case_insensitive_extension(self, tmp_path):
         pdf_path = str(tmp_path / "test.PDF")
@@ -111,3 +113,474 @@ class TestExtractDocument:
             mock_pymupdf.to_markdown.return_value = "Content"
             result = extract_document(pdf_path)
             assert result == "Content"
+
+
+class TestParseCache:
+    def _write_pdf_stub(self, tmp_path, content="dummy"):
+        pdf_path = str(tmp_path / "cached.pdf")
+        with open(pdf_path, "w") as f:
+            f.write(content)
+        return pdf_path
+
+    def test_second_parse_is_served_from_cache(self, tmp_path):
+        pdf_path = self._write_pdf_stub(tmp_path)
+        with patch("pitchdeck.parsers.pdf.pymupdf4llm") as mock_pymupdf:
+            mock_pymupdf.to_markdown.return_value = "Cached content"
+            first = extract_document(pdf_path)
+            second = extract_document(pdf_path)
+        assert first == second == "Cached content"
+        mock_pymupdf.to_markdown.assert_called_once()
+
+    def test_changed_bytes_invalidate_entry(self, tmp_path):
+        pdf_path = self._write_pdf_stub(tmp_path)
+        with patch("pitchdeck.parsers.pdf.pymupdf4llm") as mock_pymupdf:
+            mock_pymupdf.to_markdown.return_value = "Version 1"
+            extract_document(pdf_path)
+            self._write_pdf_stub(tmp_path, content="dummy v2")
+            mock_pymupdf.to_markdown.return_value = "Version 2"
+            assert extract_document(pdf_path) == "Version 2"
+        assert mock_pymupdf.to_markdown.call_count == 2
+
+    def test_use_cache_false_always_parses(self, tmp_path):
+        pdf_path = self._write_pdf_stub(tmp_path)
+        with patch("pitchdeck.parsers.pdf.pymupdf4llm") as mock_pymupdf:
+            mock_pymupdf.to_markdown.return_value = "Fresh"
+            extract_document(pdf_path, use_cache=False)
+            extract_document(pdf_path, use_cache=False)
+        assert mock_pymupdf.to_markdown.call_count == 2
+
+    def test_parse_errors_are_not_cached(self, tmp_path):
+        pdf_path = self._write_pdf_stub(tmp_path)
+        with patch("pitchdeck.parsers.pdf.pymupdf4llm") as mock_pymupdf:
+            mock_pymupdf.to_markdown.side_effect = RuntimeError("boom")
+            with pytest.raises(DocumentParseError):
+                extract_document(pdf_path)
+            mock_pymupdf.to_markdown.side_effect = None
+            mock_pymupdf.to_markdown.return_value = "Recovered"
+            assert extract_document(pdf_path) == "Recovered"
+
+
+class TestExtractDocuments:
+    def _write_docs(self, tmp_path, count):
+        paths = []
+        for i in range(count):
+            path = tmp_path / f"doc{i}.md"
+            path.write_text(f"# Doc {i}\n\nBody {i}", encoding="utf-8")
+            paths.append(str(path))
+        return paths
+
+    def test_serial_preserves_order(self, tmp_path):
+        paths = self._write_docs(tmp_path, 3)
+        results = list(extract_documents(paths, workers=1))
+        assert [p for p, _ in results] == paths
+        assert [t for _, t in results] == [
+            f"# Doc {i}\n\nBody {i}" for i in range(3)
+        ]
+
+    def test_process_pool_preserves_order(self, tmp_path):
+        paths = self._write_docs(tmp_path, 4)
+        results = list(extract_documents(paths, workers=2))
+        assert [p for p, _ in results] == paths
+        assert all(t.startswith(f"# Doc {i}") for i, (_, t) in enumerate(results))
+
+    def test_failures_are_yielded_in_place(self, tmp_path):
+        paths = self._write_docs(tmp_path, 2)
+        paths.insert(1, str(tmp_path / "missing.pdf"))
+        results = list(extract_documents(paths, workers=2))
+        assert isinstance(results[0][1], str)
+        assert isinstance(results[1][1], DocumentParseError)
+        assert results[1][1].path == paths[1]
+        assert isinstance(results[2][1], str)
+
+
+class TestShardedPDF:
+    def _make_pdf(self, tmp_path, pages):
+        import pymupdf
+
+        pdf_path = str(tmp_path / "long.pdf")
+        doc = pymupdf.open()
+        for i in range(pages):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Page body number {i + 1}", fontsize=11)
+        doc.save(pdf_path)
+        doc.close()
+        return pdf_path
+
+    def test_page_shards_cover_all_pages(self):
+        from pitchdeck.parsers.pdf import _page_shards
+
+        shards = _page_shards(35, shard_size=16)
+        assert shards[0] == list(range(0, 16))
+        assert shards[-1] == list(range(32, 35))
+        assert sum(len(s) for s in shards) == 35
+
+    def test_small_pdf_is_not_sharded(self, tmp_path):
+        pdf_path = self._make_pdf(tmp_path, 3)
+        result = extract_pdf(pdf_path, shard_threshold=10)
+        assert "<!-- page" not in result
+        assert "Page body number 3" in result
+
+    def test_large_pdf_is_stitched_in_page_order(self, tmp_path):
+        pdf_path = self._make_pdf(tmp_path, 18)
+        result = extract_pdf(pdf_path, shard_threshold=10, workers=2)
+        positions = [result.index(f"<!-- page {n} -->") for n in range(1, 19)]
+        assert positions == sorted(positions)
+        assert result.index("Page body number 17") > result.index("<!-- page 17 -->")
+        assert result.index("Page body number 17") < result.index("<!-- page 18 -->")
+
+    def test_shards_in_flight_are_bounded_by_workers(self, tmp_path):
+        from concurrent.futures import Future
+
+        from pitchdeck.parsers import pdf
+
+        submitted = []
+
+        class InlineExecutor:
+            def __init__(self, max_workers):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, fn, *args):
+                submitted.append(args[1])
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+        pdf_path = self._make_pdf(tmp_path, 12)
+        with patch.object(pdf, "ProcessPoolExecutor", InlineExecutor), \
+                patch.object(pdf, "_page_shards", lambda n: [[i] for i in range(n)]):
+            pages = pdf.iter_pdf_pages(pdf_path, shard_threshold=2, workers=3)
+            assert next(pages)[0] == 1
+            # Three submitted up front, one refill before the first yield
+            assert len(submitted) == 4
+            assert [page for page, _ in pages] == list(range(2, 13))
+        assert len(submitted) == 12
+
+    def test_parse_pool_shares_cpus_with_pdf_shards(self):
+        from pitchdeck.parsers import _pdf_worker_share
+        from pitchdeck.parsers.formats import _pdf_kwargs
+        from pitchdeck.parsers.registry import ParseOptions
+
+        with patch("os.cpu_count", return_value=8):
+            assert _pdf_worker_share(1) is None
+            assert _pdf_worker_share(4) == 2
+            assert _pdf_worker_share(16) == 1
+        assert _pdf_kwargs(ParseOptions(pdf_workers=2))["workers"] == 2
+
+
+class TestFastPDFMode:
+    def _make_pdf(self, tmp_path):
+        import pymupdf
+
+        pdf_path = str(tmp_path / "brief.pdf")
+        doc = pymupdf.open()
+        page = doc.new_page()
+        page.insert_text((72, 72), "Traction", fontsize=20)
+        page.insert_text((72, 110), "ARR grew to EUR 2.3M with 4 customers.", fontsize=11)
+        page.insert_text((72, 130), "NDR is 130 percent across the base.", fontsize=11)
+        doc.save(pdf_path)
+        doc.close()
+        return pdf_path
+
+    def test_fast_mode_detects_headings(self, tmp_path):
+        from pitchdeck.parsers.pdf_fast import extract_pdf_fast
+
+        result = extract_pdf_fast(self._make_pdf(tmp_path))
+        assert result.startswith("# Traction")
+        assert "ARR grew to EUR 2.3M" in result
+
+    def test_fast_mode_file_not_found(self):
+        from pitchdeck.parsers.pdf_fast import extract_pdf_fast
+
+        with pytest.raises(DocumentParseError, match="File not found"):
+            extract_pdf_fast("/nonexistent/file.pdf")
+
+    def test_extract_document_dispatches_on_mode(self, tmp_path):
+        pdf_path = self._make_pdf(tmp_path)
+        with patch("pitchdeck.parsers.pdf.pymupdf4llm") as mock_pymupdf:
+            mock_pymupdf.to_markdown.return_value = "layout output"
+            assert extract_document(pdf_path) == "layout output"
+            assert "# Traction" in extract_document(pdf_path, mode="fast")
+        mock_pymupdf.to_markdown.assert_called_once()
+
+    def test_unknown_mode_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown parse mode"):
+            extract_document(self._make_pdf(tmp_path), mode="turbo")
+
+
+class TestDocumentSections:
+    def test_split_markdown_on_headings(self):
+        from pitchdeck.parsers.sections import split_markdown
+
+        text = "Intro line\n\n# Problem\n\nPain.\n\n## Detail\n\nMore."
+        assert list(split_markdown(text.splitlines())) == [
+            ("", "Intro line"),
+            ("Problem", "# Problem\n\nPain."),
+            ("Detail", "## Detail\n\nMore."),
+        ]
+
+    def test_split_markdown_ignores_headings_in_code_fences(self):
+        from pitchdeck.parsers.sections import split_markdown
+
+        text = "# Real\n\n```\n# not a heading\n```"
+        assert [h for h, _ in split_markdown(text.splitlines())] == ["Real"]
+
+    def test_split_markdown_bounds_section_size(self):
+        from pitchdeck.parsers.sections import split_markdown
+
+        lines = ["# Long"]
+        for i in range(50):
+            lines += [f"Paragraph {i} text.", ""]
+        chunks = list(split_markdown(lines, max_chars=100))
+        assert len(chunks) > 1
+        assert all(heading == "Long" for heading, _ in chunks)
+
+    def test_markdown_file_sections_carry_metadata(self, tmp_path):
+        from pitchdeck.parsers import iter_document_sections
+
+        path = tmp_path / "brief.md"
+        path.write_text("# Team\n\nFounders.\n\n# Traction\n\nARR.", encoding="utf-8")
+        sections = list(iter_document_sections(str(path)))
+        assert [s.heading for s in sections] == ["Team", "Traction"]
+        assert [s.index for s in sections] == [0, 1]
+        assert all(s.source == "brief.md" and s.page is None for s in sections)
+
+    def test_pdf_sections_are_per_page_and_cached(self, tmp_path):
+        import pymupdf
+
+        from pitchdeck.parsers import iter_document_sections
+
+        pdf_path = str(tmp_path / "deck.pdf")
+        doc = pymupdf.open()
+        for i in range(3):
+            doc.new_page().insert_text((72, 72), f"Page text {i + 1}", fontsize=11)
+        doc.save(pdf_path)
+        doc.close()
+
+        first = list(iter_document_sections(pdf_path, mode="fast"))
+        assert [s.page for s in first] == [1, 2, 3]
+        assert "Page text 2" in first[1].text
+        with patch("pitchdeck.parsers.pdf_fast.pymupdf.open") as mock_open:
+            second = list(iter_document_sections(pdf_path, mode="fast"))
+        mock_open.assert_not_called()
+        assert second == first
+
+    def test_extract_documents_sections_in_order(self, tmp_path):
+        from pitchdeck.parsers import extract_documents_sections
+
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"doc{i}.md"
+            path.write_text(f"# Doc {i}\n\nBody", encoding="utf-8")
+            paths.append(str(path))
+        results = list(extract_documents_sections(paths, workers=2))
+        assert [r[0].heading for _, r in results] == ["Doc 0", "Doc 1", "Doc 2"]
+
+
+class TestStreamingDOCX:
+    def test_tables_rendered_as_markdown_in_order(self, tmp_path):
+        docx_path = str(tmp_path / "kpis.docx")
+        doc = Document()
+        doc.add_heading("Traction", level=1)
+        doc.add_paragraph("Key numbers below.")
+        table = doc.add_table(rows=3, cols=2)
+        for row, (metric, value) in zip(
+            table.rows, [("Metric", "Value"), ("ARR", "EUR 2.3M"), ("NDR", "130%")]
+        ):
+            row.cells[0].text = metric
+            row.cells[1].text = value
+        doc.add_paragraph("After the table.")
+        doc.save(docx_path)
+
+        result = extract_docx(docx_path)
+        assert "| Metric | Value |\n|---|---|\n| ARR | EUR 2.3M |\n| NDR | 130% |" in result
+        assert result.index("Key numbers") < result.index("| ARR")
+        assert result.index("| NDR") < result.index("After the table.")
+
+    def test_pipe_in_cell_is_escaped(self, tmp_path):
+        docx_path = str(tmp_path / "pipes.docx")
+        doc = Document()
+        table = doc.add_table(rows=1, cols=1)
+        table.rows[0].cells[0].text = "a|b"
+        doc.save(docx_path)
+        assert "a\\|b" in extract_docx(docx_path)
+
+    def test_heading_levels_from_styles(self, tmp_path):
+        docx_path = str(tmp_path / "levels.docx")
+        doc = Document()
+        doc.add_heading("Level three", level=3)
+        doc.add_heading("Document title", level=0)  # "Title" style, not a heading
+        doc.save(docx_path)
+        result = extract_docx(docx_path)
+        assert "### Level three" in result
+        assert "# Document title" not in result
+        assert "Document title" in result
+
+    def test_iter_docx_blocks_streams_blocks(self, tmp_path):
+        from pitchdeck.parsers.docx_parser import iter_docx_blocks
+
+        docx_path = str(tmp_path / "blocks.docx")
+        doc = Document()
+        doc.add_heading("One", level=1)
+        doc.add_paragraph("")
+        doc.add_paragraph("Two")
+        doc.save(docx_path)
+        assert list(iter_docx_blocks(docx_path)) == ["# One", "Two"]
+
+    def test_not_a_zip_raises_parse_error(self, tmp_path):
+        docx_path = str(tmp_path / "broken.docx")
+        with open(docx_path, "w") as f:
+            f.write("not a zip")
+        with pytest.raises(DocumentParseError, match="broken.docx"):
+            extract_docx(docx_path)
+
+    def test_docx_sections_include_tables(self, tmp_path):
+        from pitchdeck.parsers import iter_document_sections
+
+        docx_path = str(tmp_path / "sections.docx")
+        doc = Document()
+        doc.add_heading("KPIs", level=1)
+        table = doc.add_table(rows=2, cols=2)
+        table.rows[0].cells[0].text = "Metric"
+        table.rows[1].cells[0].text = "ARR"
+        doc.save(docx_path)
+        sections = list(iter_document_sections(docx_path))
+        assert sections[0].heading == "KPIs"
+        assert "| ARR |" in sections[0].text
+
+
+class TestFormatSniffing:
+    def test_pdf_sniffed_despite_wrong_extension(self, tmp_path):
+        import pymupdf
+
+        path = str(tmp_path / "export.bin")
+        doc = pymupdf.open()
+        doc.new_page().insert_text((72, 72), "Sniffed PDF", fontsize=11)
+        doc.save(path)
+        doc.close()
+        assert "Sniffed PDF" in extract_document(path, mode="fast")
+
+    def test_text_mentioning_pdf_marker_is_not_pdf(self, tmp_path):
+        from pitchdeck.parsers.registry import resolve_parser
+
+        path = tmp_path / "notes.md"
+        path.write_text("# Notes\n\nThe exporter emits %PDF-1.7 headers.\n", encoding="utf-8")
+        assert resolve_parser(str(path)).name == "text"
+        assert extract_document(str(path)).startswith("# Notes")
+
+    def test_pdf_marker_after_bom_and_whitespace(self):
+        from pitchdeck.parsers.formats import _sniff_pdf
+
+        assert _sniff_pdf(b"\xef\xbb\xbf\r\n%PDF-1.7\n", "x.bin")
+        assert not _sniff_pdf(b"see %PDF-1.7\n", "x.bin")
+
+    def test_docx_sniffed_by_zip_layout(self, tmp_path):
+        path = str(tmp_path / "brief.dat")
+        doc = Document()
+        doc.add_paragraph("Sniffed DOCX")
+        doc.save(path)
+        assert extract_document(path) == "Sniffed DOCX"
+
+    def test_plain_zip_is_not_docx(self, tmp_path):
+        import zipfile
+
+        from pitchdeck.parsers.registry import resolve_parser
+
+        path = str(tmp_path / "archive.zip")
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("data.csv", "a,b")
+        with pytest.raises(DocumentParseError, match="Unsupported format"):
+            resolve_parser(path)
+
+    def test_docx_sniffed_from_header_only(self, tmp_path):
+        from pitchdeck.parsers.formats import _sniff_docx
+
+        path = str(tmp_path / "brief.dat")
+        Document().save(path)
+        with open(path, "rb") as handle:
+            header = handle.read(4096)
+        with patch("zipfile.ZipFile", side_effect=AssertionError("opened")):
+            assert _sniff_docx(header, "/nonexistent")
+
+    def test_docx_sniffed_by_content_type_when_word_is_past_header(self, tmp_path):
+        import zipfile
+
+        from pitchdeck.parsers.registry import read_header, resolve_parser
+
+        path = str(tmp_path / "brief.dat")
+        content_types = (
+            '<Types><Override PartName="/word/document.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/></Types>'
+        )
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("[Content_Types].xml", content_types)
+            archive.writestr("docProps/thumbnail.bin", os.urandom(8192), zipfile.ZIP_STORED)
+            archive.writestr("word/document.xml", "<w:document/>")
+        assert b"word/" not in read_header(path)
+        assert resolve_parser(path).name == "docx"
+
+    def test_xlsx_package_is_not_docx(self, tmp_path):
+        import zipfile
+
+        from pitchdeck.parsers.formats import _sniff_docx
+        from pitchdeck.parsers.registry import read_header
+
+        path = str(tmp_path / "book.dat")
+        content_types = (
+            '<Types><Override PartName="/xl/workbook.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/></Types>'
+        )
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("[Content_Types].xml", content_types)
+            archive.writestr("xl/workbook.xml", "<workbook/>")
+        assert not _sniff_docx(read_header(path), path)
+
+    def test_legacy_doc_rejected_with_hint(self, tmp_path):
+        path = tmp_path / "old.doc"
+        path.write_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 64)
+        with pytest.raises(DocumentParseError, match="Save it as DOCX"):
+            extract_document(str(path))
+
+    def test_text_without_extension_is_sniffed(self, tmp_path):
+        path = tmp_path / "NOTES"
+        path.write_text("Plain notes \u2014 with UTF-8", encoding="utf-8")
+        assert extract_document(str(path)) == "Plain notes \u2014 with UTF-8"
+
+    def test_registering_a_new_format(self, tmp_path):
+        from pitchdeck.parsers import registry
+        from pitchdeck.parsers.registry import ParserSpec, register_parser
+
+        path = tmp_path / "deck.key"
+        path.write_bytes(b"KEYNOTE\x00payload")
+        saved = dict(registry._REGISTRY)
+        try:
+            register_parser(ParserSpec(
+                name="keynote",
+                sniff=lambda header, p: header.startswith(b"KEYNOTE"),
+                extract=lambda p, options: "keynote text",
+            ))
+            assert extract_document(str(path)) == "keynote text"
+        finally:
+            registry._REGISTRY.clear()
+            registry._REGISTRY.update(saved)
+
+    def test_unused_backends_are_not_imported(self, tmp_path):
+        import subprocess
+        import sys
+
+        path = tmp_path / "brief.md"
+        path.write_text("# Brief", encoding="utf-8")
+        code = (
+            "import sys; from pitchdeck.parsers import extract_document; "
+            f"extract_document({str(path)!r}); "
+            "print('pymupdf4llm' in sys.modules, 'pymupdf' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.split() == ["False", "False"]
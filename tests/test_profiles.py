@@ -1,5 +1,8 @@
 """Tests for VC profile loading."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 from ruamel.yaml import YAML
 
@@ -64,3 +67,127 @@ class TestListProfiles:
                 yaml.dump(data, f)
         profiles = list_profiles(profiles_dir=tmp_path)
         assert profiles == ["alpha", "beta", "charlie"]
+
+
+class TestCompiledProfileCache:
+    def test_second_load_skips_yaml(self, sample_vc_yaml):
+        from pitchdeck.profiles import loader
+
+        first = load_vc_profile("testvc", profiles_dir=sample_vc_yaml)
+        with patch.object(loader, "_compile_profile", side_effect=AssertionError("recompiled")):
+            second = load_vc_profile("testvc", profiles_dir=sample_vc_yaml)
+        assert second == first
+
+    def test_edit_invalidates_cache(self, sample_vc_yaml):
+        load_vc_profile("testvc", profiles_dir=sample_vc_yaml)
+        path = sample_vc_yaml / "testvc.yaml"
+        path.write_text(path.read_text().replace("Test VC", "Edited VC"))
+        profile = load_vc_profile("testvc", profiles_dir=sample_vc_yaml)
+        assert profile.name == "Edited VC"
+
+    def test_touch_without_edit_reuses_cache(self, sample_vc_yaml):
+        from pitchdeck.profiles import loader
+
+        load_vc_profile("testvc", profiles_dir=sample_vc_yaml)
+        path = sample_vc_yaml / "testvc.yaml"
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        with patch.object(loader, "_compile_profile", side_effect=AssertionError("recompiled")):
+            profile = load_vc_profile("testvc", profiles_dir=sample_vc_yaml)
+        assert profile.name == "Test VC"
+
+    def test_corrupt_entry_is_recompiled(self, sample_vc_yaml):
+        from pitchdeck.profiles.loader import get_profile_cache
+
+        load_vc_profile("testvc", profiles_dir=sample_vc_yaml)
+        for entry in get_profile_cache().directory.glob("*.json"):
+            entry.write_text("not json")
+        profile = load_vc_profile("testvc", profiles_dir=sample_vc_yaml)
+        assert profile.name == "Test VC"
+
+    def test_use_cache_false_writes_nothing(self, sample_vc_yaml):
+        from pitchdeck.profiles.loader import get_profile_cache
+
+        load_vc_profile("testvc", profiles_dir=sample_vc_yaml, use_cache=False)
+        assert not list(get_profile_cache().directory.glob("*.json"))
+
+
+def _write_profile(directory, name, **overrides):
+    data = {
+        "name": name.title(),
+        "fund_name": "Fund I",
+        "aum_eur": 500000000,
+        "stage_focus": ["seed", "series-a"],
+        "sector_focus": ["enterprise-ai"],
+        "geo_focus": ["DACH"],
+        "thesis_points": ["European digital sovereignty"],
+    }
+    data.update(overrides)
+    with open(directory / f"{name}.yaml", "w") as f:
+        YAML().dump(data, f)
+
+
+def names(hits):
+    return [entry.profile for entry in hits]
+
+
+class TestProfileIndex:
+    def test_facet_search(self, tmp_path):
+        from pitchdeck.profiles import load_profile_index
+
+        _write_profile(tmp_path, "alpha")
+        _write_profile(tmp_path, "beta", geo_focus=["Nordics"])
+        _write_profile(tmp_path, "gamma", stage_focus=["Series B"])
+        index = load_profile_index(tmp_path)
+        assert names(index.search(stage=["series-a"], sector=["enterprise-ai"], geo=["DACH"])) == ["alpha"]
+        assert names(index.search(geo=["DACH", "nordics"])) == ["alpha", "beta", "gamma"]
+        assert names(index.search(stage=["series_b"])) == ["gamma"]
+        assert names(index.search(keywords=["sovereignty"], geo=["Nordics"])) == ["beta"]
+        assert names(index.search(min_aum_eur=1e9)) == []
+
+    def test_unchanged_profiles_are_not_reloaded(self, tmp_path):
+        from pitchdeck.profiles import index as index_module
+
+        _write_profile(tmp_path, "alpha")
+        _write_profile(tmp_path, "beta")
+        index_module.load_profile_index(tmp_path)
+        _write_profile(tmp_path, "beta", geo_focus=["Nordics"])
+        loaded = []
+        real_load = index_module.load_vc_profile
+
+        def spy(name, *args, **kwargs):
+            loaded.append(name)
+            return real_load(name, *args, **kwargs)
+
+        with patch.object(index_module, "load_vc_profile", side_effect=spy):
+            index = index_module.load_profile_index(tmp_path)
+        assert loaded == ["beta"]
+        assert [e.profile for e in index.search(geo=["nordics"])] == ["beta"]
+
+    def test_deleted_and_invalid_profiles(self, tmp_path):
+        from pitchdeck.profiles import load_profile_index
+
+        _write_profile(tmp_path, "alpha")
+        _write_profile(tmp_path, "beta")
+        load_profile_index(tmp_path)
+        (tmp_path / "beta.yaml").unlink()
+        (tmp_path / "broken.yaml").write_text("name: [unclosed\n")
+        index = load_profile_index(tmp_path)
+        assert sorted(index.entries) == ["alpha"]
+        assert index.skipped == ["broken"]
+
+    def test_cli_filters(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from pitchdeck.cli import app
+
+        _write_profile(tmp_path, "alpha")
+        _write_profile(tmp_path, "beta", geo_focus=["Nordics"])
+        runner = CliRunner()
+        with patch("pitchdeck.profiles.index.PROFILES_DIR", tmp_path):
+            result = runner.invoke(app, ["profiles", "--stage", "series-a", "--geo", "DACH"])
+            missing = runner.invoke(app, ["profiles", "--geo", "US"])
+        assert result.exit_code == 0
+        assert "alpha" in result.output and "beta" not in result.output
+        assert missing.exit_code == 1
+        assert "No profiles match" in missing.output
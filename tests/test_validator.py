@@ -1,6 +1,7 @@
 """Tests for the deck validation engine."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from unittest.mock import MagicMock, patch
 
@@ -16,6 +17,7 @@ from pitchdeck.engine.validator import (
     _score_metrics_density,
     _score_slide_rules,
     validate_deck,
+    validate_deck_against_profiles,
 )
 from pitchdeck.models import (
     CustomCheckResult,
@@ -440,6 +442,64 @@ class TestValidateDeck:
         slide_1 = next(s for s in result.slide_scores if s.slide_number == 1)
         assert "Strong opener" in slide_1.suggestions
 
+    def test_oversized_prompt_refused_before_api_call(
+        self, sample_multi_slide_deck, sample_vc_profile
+    ):
+        from pitchdeck.models import PromptTooLargeError
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            with patch(
+                "pitchdeck.engine.validator.Anthropic"
+            ) as mock_anthropic:
+                with pytest.raises(PromptTooLargeError, match="budget is 100"):
+                    validate_deck(
+                        sample_multi_slide_deck,
+                        sample_vc_profile,
+                        skip_llm=False,
+                        max_input_tokens=100,
+                    )
+        mock_anthropic.return_value.messages.create.assert_not_called()
+
+    def test_oversized_prompt_still_reports_breakdown(
+        self, sample_multi_slide_deck, sample_vc_profile
+    ):
+        from pitchdeck.models import PromptTooLargeError
+
+        estimates = []
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            with patch("pitchdeck.engine.validator.Anthropic"):
+                with pytest.raises(PromptTooLargeError):
+                    validate_deck(
+                        sample_multi_slide_deck,
+                        sample_vc_profile,
+                        skip_llm=False,
+                        max_input_tokens=100,
+                        on_preflight=estimates.append,
+                    )
+        assert len(estimates) == 1
+        assert estimates[0].total_tokens > 100
+        assert estimates[0].blocks
+
+    def test_preflight_reports_cached_system_blocks(
+        self, sample_multi_slide_deck, sample_vc_profile
+    ):
+        estimates = []
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            with patch("pitchdeck.engine.validator.Anthropic") as mock_anthropic:
+                mock_anthropic.return_value.messages.create.side_effect = (
+                    RuntimeError("stop after preflight")
+                )
+                with pytest.raises(PitchDeckError):
+                    validate_deck(
+                        sample_multi_slide_deck,
+                        sample_vc_profile,
+                        skip_llm=False,
+                        on_preflight=estimates.append,
+                    )
+        [estimate] = estimates
+        assert [b.cached for b in estimate.blocks] == [True, True, False]
+        assert estimate.uncached_tokens == estimate.blocks[-1].tokens > 0
+
     def test_parse_validation_response_invalid_json(self):
         from pitchdeck.engine.validator import _parse_validation_response
 
@@ -692,6 +752,21 @@ class TestParseValidationResponseSnippets:
         with pytest.raises(PitchDeckError, match="Response starts with"):
             _parse_validation_response(mock_response)
 
+    def test_trailing_prose_with_braces_is_ignored(self):
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(
+            text='{"recommendation": "Add {NDR}"}\nScores use the {0-100} scale.'
+        )]
+        assert _parse_validation_response(mock_response) == {
+            "recommendation": "Add {NDR}"
+        }
+
+    def test_unclosed_json_error_names_offsets(self):
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text='Scores: {"narrative_coherence": {')]
+        with pytest.raises(PitchDeckError, match="offset 8 is never closed"):
+            _parse_validation_response(mock_response)
+
 
 class TestScoreQualitativeAPIErrors:
     """Test that API errors from _score_qualitative are wrapped as PitchDeckError."""
@@ -817,3 +892,198 @@ class TestScoreMetricsDensityEmphasis:
         )
         score = _score_metrics_density(deck, profile)
         assert any("Found:" in e for e in score.evidence_found)
+
+
+LLM_SCORES_JSON = json.dumps({
+    "narrative_coherence": {"score": 70, "rationale": "ok"},
+    "thesis_alignment": {"score": 60, "rationale": "ok"},
+    "common_mistakes": {"score": 80, "rationale": "ok"},
+})
+
+
+class TestValidateDeckAgainstProfiles:
+    def _profiles(self, sample_vc_profile):
+        return {
+            "alpha": sample_vc_profile,
+            "beta": sample_vc_profile.model_copy(
+                update={"name": "Beta VC", "custom_checks": []}
+            ),
+        }
+
+    def test_slide_rules_scored_once_per_deck(
+        self, sample_multi_slide_deck, sample_vc_profile
+    ):
+        from pitchdeck.engine import validator
+
+        with patch.object(
+            validator, "_score_slide_rules", wraps=validator._score_slide_rules
+        ) as spy:
+            results = validate_deck_against_profiles(
+                sample_multi_slide_deck,
+                self._profiles(sample_vc_profile),
+                skip_llm=True,
+            )
+        assert spy.call_count == len(sample_multi_slide_deck.slides)
+        assert list(results) == ["alpha", "beta"]
+        assert results["beta"].target_vc == "Beta VC"
+        single = validate_deck(sample_multi_slide_deck, sample_vc_profile, skip_llm=True)
+        assert results["alpha"].overall_score == single.overall_score
+
+    def test_shared_client_and_isolated_failures(
+        self, sample_multi_slide_deck, sample_vc_profile
+    ):
+        ok = MagicMock()
+        ok.content = [MagicMock(text=LLM_SCORES_JSON)]
+
+        def create(**kwargs):
+            if "Beta VC" in kwargs["messages"][0]["content"]:
+                raise RuntimeError("boom")
+            return ok
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            with patch("pitchdeck.engine.validator.Anthropic") as mock_anthropic:
+                mock_anthropic.return_value.messages.create.side_effect = create
+                results = validate_deck_against_profiles(
+                    sample_multi_slide_deck,
+                    self._profiles(sample_vc_profile),
+                    max_workers=2,
+                )
+        assert mock_anthropic.call_count == 1
+        assert isinstance(results["alpha"], DeckValidationResult)
+        assert isinstance(results["beta"], PitchDeckError)
+        assert "boom" in str(results["beta"])
+
+
+class TestValidationLLMCache:
+    def test_rerun_served_from_cache(self, sample_multi_slide_deck, sample_vc_profile):
+        response = MagicMock()
+        response.content = [MagicMock(text=LLM_SCORES_JSON)]
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            with patch("pitchdeck.engine.validator.Anthropic") as mock_anthropic:
+                create = mock_anthropic.return_value.messages.create
+                create.return_value = response
+                first = validate_deck(sample_multi_slide_deck, sample_vc_profile)
+                second = validate_deck(sample_multi_slide_deck, sample_vc_profile)
+                assert create.call_count == 1
+                validate_deck(
+                    sample_multi_slide_deck, sample_vc_profile, use_llm_cache=False
+                )
+                assert create.call_count == 2
+        assert second.overall_score == first.overall_score
+
+    def test_unparseable_response_not_cached(
+        self, sample_multi_slide_deck, sample_vc_profile
+    ):
+        bad = MagicMock()
+        bad.content = [MagicMock(text="no json here")]
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            with patch("pitchdeck.engine.validator.Anthropic") as mock_anthropic:
+                create = mock_anthropic.return_value.messages.create
+                create.return_value = bad
+                for _ in range(2):
+                    with pytest.raises(PitchDeckError):
+                        validate_deck(sample_multi_slide_deck, sample_vc_profile)
+                assert create.call_count == 2
+
+
+class TestValidationTelemetry:
+    def test_on_call_records_usage_and_errors(
+        self, sample_multi_slide_deck, sample_vc_profile
+    ):
+        import anthropic
+
+        response = MagicMock()
+        response.content = [MagicMock(text=LLM_SCORES_JSON)]
+        response.usage = MagicMock(
+            input_tokens=900, output_tokens=300,
+            cache_creation_input_tokens=0, cache_read_input_tokens=0,
+        )
+        calls = []
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            with patch("pitchdeck.engine.validator.Anthropic") as mock_anthropic:
+                create = mock_anthropic.return_value.messages.create
+                create.return_value = response
+                validate_deck(
+                    sample_multi_slide_deck, sample_vc_profile, on_call=calls.append
+                )
+                create.side_effect = anthropic.APIConnectionError(request=MagicMock())
+                with pytest.raises(PitchDeckError):
+                    validate_deck(
+                        sample_multi_slide_deck, sample_vc_profile,
+                        use_llm_cache=False, on_call=calls.append,
+                    )
+        ok, failed = calls
+        assert ok.label == f"validate:{sample_vc_profile.name}"
+        assert ok.usage.input_tokens == 900
+        assert ok.error is None
+        assert failed.error is not None
+
+    def test_scoring_call_records_time_to_first_byte(
+        self, fake_anthropic, sample_multi_slide_deck, sample_vc_profile
+    ):
+        from pitchdeck.engine.backends import MockBackend
+
+        fake_anthropic.default = fake_anthropic.message(LLM_SCORES_JSON)
+        fake_anthropic.responses = [fake_anthropic.error(529, "overloaded_error")]
+        calls = []
+        validate_deck(sample_multi_slide_deck, sample_vc_profile, on_call=calls.append)
+        validate_deck(
+            sample_multi_slide_deck, sample_vc_profile,
+            on_call=calls.append, backend=MockBackend(latency_s=0.01),
+        )
+        api, mock = calls
+        assert api.retries == 1
+        # Headers of the successful response, not of the 529
+        assert 0 < api.time_to_first_byte_s <= api.latency_s
+        assert 0.01 <= mock.time_to_first_byte_s <= mock.latency_s
+
+
+class TestValidationRetries:
+    def test_threads_share_scheduler_through_fake_server(
+        self, fake_anthropic, sample_multi_slide_deck, sample_vc_profile
+    ):
+        from pitchdeck.engine.validator import _score_qualitative
+
+        fake_anthropic.default = fake_anthropic.message(LLM_SCORES_JSON)
+        fake_anthropic.responses = [
+            fake_anthropic.error(429, "rate_limit_error", {"retry-after-ms": "10"}),
+            fake_anthropic.error(529, "overloaded_error"),
+        ]
+        calls = []
+
+        def _score(_):
+            return _score_qualitative(
+                sample_multi_slide_deck, sample_vc_profile, "findings",
+                use_cache=False, on_call=calls.append,
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_score, range(2)))
+        assert [r["thesis_alignment"]["score"] for r in results] == [60, 60]
+        assert sum(c.retries for c in calls) == 2
+        assert all(c.time_to_first_byte_s is not None for c in calls)
+        assert len(fake_anthropic.requests) == 4
+        # The request the SDK actually sent: only parameters it supports
+        sent = fake_anthropic.requests[-1]
+        assert sent["model"] == "claude-sonnet-4-6"
+        assert "temperature" not in sent
+
+
+class TestValidationMockBackend:
+    def test_scores_without_api_key(
+        self, sample_multi_slide_deck, sample_vc_profile, monkeypatch
+    ):
+        from pitchdeck.engine.backends import MockBackend
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        first = validate_deck(
+            sample_multi_slide_deck, sample_vc_profile, backend=MockBackend()
+        )
+        second = validate_deck(
+            sample_multi_slide_deck, sample_vc_profile,
+            use_llm_cache=False, backend=MockBackend(),
+        )
+        assert {d.dimension for d in first.dimension_scores} >= {
+            "narrative_coherence", "thesis_alignment", "common_mistakes"
+        }
+        assert second.overall_score == first.overall_score